@@ -2,7 +2,28 @@
 # -*- coding: UTF-8 -*-
 """High-level OntologyParser: the primary public API for mutato consumers."""
 
+import contextvars
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from mutato.core import CacheInfo, ResultCache, Tracing, TraceHook
+
+
+class ParseResult(str):
+    """A parsed string from a budgeted parse; ``degraded`` is True if work was skipped."""
+
+    def __new__(cls, value: str, degraded: bool = False) -> 'ParseResult':
+        obj = super().__new__(cls, value)
+        obj.degraded = degraded
+        return obj
+
+
+class ParseOffsets(list):
+    """Parsed offsets from a budgeted parse; ``degraded`` is True if work was skipped."""
+
+    def __init__(self, offsets: list, degraded: bool = False) -> None:
+        super().__init__(offsets)
+        self.degraded = degraded
 
 
 class OntologyParser:
@@ -20,11 +41,39 @@ class OntologyParser:
 
         d = parser.to_dict()        # JSON-serialisable dict; upload to S3/cache
         s = parser.parse('some text')  # returns canonical plain-text string
+
+    Repeated inputs can be served from a bounded in-memory cache::
+
+        parser = OntologyParser.from_dict(d_owl, name='econ', cache_size=4096)
+        parser.cache_info()         # hits, misses, evictions, maxsize, currsize
+
+    Stage hooks see every pipeline stage, with the caller's trace attributes::
+
+        parser.add_hook(InMemoryTraceCollector())
+        with Tracing.context(request_id='abc-123'):
+            parser.parse_batch(lines, max_workers=4)
+
+    A time budget bounds each parse; span and hierarchy work is skipped once it runs out::
+
+        s = parser.parse('some text', budget_ms=50)
+        s.degraded                  # True if the result is partial
+
+    The output mode selects what ``parse`` returns; neither builds swap dicts::
+
+        parser = OntologyParser.from_dict(d_owl, name='econ', output='offsets')
+        parser.parse('some text')   # [(start, end, canon, type), ...] for each swap
     """
 
-    def __init__(self, owl_path: str | Path, namespace: str | None = None):
+    OUTPUTS = ('text', 'offsets')
+
+    def __init__(self,
+                 owl_path: str | Path,
+                 namespace: str | None = None,
+                 cache_size: int = 0,
+                 output: str = 'text'):
         from mutato.mda.universal_mda_generator import UniversalMDAGenerator
 
+        self._output = self._check_output(output)
         p = Path(owl_path).expanduser().resolve()
         self._name = p.stem
         self._d_owl = UniversalMDAGenerator(
@@ -33,16 +82,35 @@ class OntologyParser:
             namespace=namespace,
         ).generate()
         self._api = self._make_api(self._d_owl, self._name)
+        self._init_cache(cache_size)
 
     @classmethod
-    def from_dict(cls, d_owl: dict, name: str) -> 'OntologyParser':
+    def from_dict(cls,
+                  d_owl: dict,
+                  name: str,
+                  cache_size: int = 0,
+                  output: str = 'text') -> 'OntologyParser':
         """Restore a parser from a pre-built dict (e.g. fetched from S3)."""
         obj = cls.__new__(cls)
+        obj._output = cls._check_output(output)
         obj._name = name
         obj._d_owl = d_owl
         obj._api = cls._make_api(d_owl, name)
+        obj._init_cache(cache_size)
         return obj
 
+    @classmethod
+    def _check_output(cls, output: str) -> str:
+        """Validate an output mode: 'text' (canonical string) or 'offsets' (swap tuples)."""
+        if output not in cls.OUTPUTS:
+            raise ValueError(f'Unknown Output: {output}')
+        return output
+
+    def _init_cache(self, cache_size: int) -> None:
+        """Create the optional parse cache; a size of 0 disables caching."""
+        self._cache = ResultCache(maxsize=cache_size) if cache_size else None
+        self._fingerprint = ResultCache.fingerprint(self._d_owl) if cache_size else None
+
     @staticmethod
     def _make_api(d_owl: dict, name: str):
         from mutato.finder.multiquery.bp import FindOntologyJSON
@@ -53,13 +121,93 @@ class OntologyParser:
         """Return the JSON-serialisable MDA dict for external storage."""
         return self._d_owl
 
-    def parse(self, text: str) -> str:
-        """Parse *text* and return a plain-text string with canonical forms."""
-        tokens = self._api.swap_input_text(text)
+    def cache_info(self) -> CacheInfo | None:
+        """Return parse cache statistics, or None if caching is disabled."""
+        if self._cache is not None:
+            return self._cache.cache_info()
+
+    def add_hook(self, hook: TraceHook) -> None:
+        """Register a stage hook; see MutatoAPI.add_hook."""
+        self._api.add_hook(hook)
+
+    def remove_hook(self, hook: TraceHook) -> None:
+        """Unregister a stage hook."""
+        self._api.remove_hook(hook)
+
+    def parse_batch(self,
+                    texts: list[str],
+                    max_workers: int | None = None,
+                    budget_ms: float | None = None) -> list[str | list[tuple]]:
+        """Parse each of *texts*, in order; threads are used when *max_workers* is set.
+
+        Each text runs inside ``Tracing.context(batch_index=i)`` and workers
+        inherit the caller's trace attributes.
+        """
+        def parse(i: int, text: str) -> str | list[tuple]:
+            with Tracing.context(batch_index=i):
+                return self.parse(text, budget_ms=budget_ms)
+
+        if not max_workers:
+            return [parse(i, text) for i, text in enumerate(texts)]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, parse, i, text)
+                for i, text in enumerate(texts)
+            ]
+            return [future.result() for future in futures]
+
+    def parse(self, text: str, budget_ms: float | None = None) -> str | list[tuple]:
+        """Parse *text* and return a plain-text string with canonical forms.
+
+        In ``offsets`` mode, return a ``(start, end, canon, type)`` tuple for each swap instead.
+
+        With *budget_ms*, the result is a ``ParseResult`` (or ``ParseOffsets``) flagged
+        ``degraded`` when the budget ran out before the span and hierarchy passes finished.
+        """
+        if self._cache is None or not text:
+            return self._parse(text, budget_ms)
+
+        # offsets depend on the exact whitespace; plain text does not
+        key = ResultCache.key(
+            self._fingerprint,
+            self._api.pipeline_config(),
+            text if self._output == 'offsets' else ResultCache.normalize(text))
+
+        result = self._cache.get(key)
+        if result is None:
+            result = self._parse(text, budget_ms)
+            if not getattr(result, 'degraded', False):
+                self._cache.put(key, list(result) if self._output == 'offsets' else str(result))
+        elif budget_ms is not None:
+            result = ParseOffsets(result) if self._output == 'offsets' else ParseResult(result)
+
+        return result
+
+    def _parse(self, text: str, budget_ms: float | None = None) -> str | list[tuple]:
+        # token records are read in place; no swap dicts are built
+        tokens = self._api.swap_input_records(text, budget_ms=budget_ms)
+        degraded = getattr(tokens, 'degraded', False)
+
+        if self._output == 'offsets':
+            result = [
+                (t['x'], t['y'], t['swaps']['canon'], t['swaps']['type'])
+                for t in tokens or []
+                if 'swaps' in t
+            ]
+            if budget_ms is None:
+                return result
+            return ParseOffsets(result, degraded=degraded)
+
         if not tokens:
-            return text
-        return ' '.join(
-            t['swaps']['canon'] if t.get('swaps') else t['text'].strip()
-            for t in tokens
-            if t.get('swaps') or t['text'].strip()
-        )
+            result = text
+        else:
+            result = ' '.join(
+                t['swaps']['canon'] if t.get('swaps') else t['text'].strip()
+                for t in tokens
+                if t.get('swaps') or t['text'].strip()
+            )
+
+        if budget_ms is None:
+            return result
+        return ParseResult(result, degraded=degraded)
@@ -16,6 +16,7 @@ logging.basicConfig(
 _log = logging.getLogger(__name__)
 
 _CACHE_ROOT = Path.home() / '.cache' / 'mutato'
+_GRAPH_CACHE_ROOT = _CACHE_ROOT / 'graphs'
 
 
 def _cache_path(ontology_path: Path) -> Path:
@@ -32,22 +33,24 @@ def _reconstruct(tokens: list, fallback: str) -> str:
     return ' '.join(parts) if parts else fallback
 
 
-def _warn_if_mixed(ontology_path: Path) -> None:
+def _warn_if_mixed(ontology_path: Path):
     """Emit a WARNING if the ontology uses the MIXED schema.
 
     The --live path uses plain AskOwlAPI, which does not traverse
     owl:NamedIndividual leaves present in MIXED ontologies.  Entity
     coverage will therefore be lower than the JSON-cached path for
     such ontologies.
+
+    Returns the parsed graph (None if detection failed); the registry
+    holds graphs weakly, so the caller keeps it for the finder to share.
     """
     try:
-        from rdflib import Graph
         from mutato.mda.owl_schema_detector import OWLSchemaDetector
         from mutato.mda.owl_schema import OWLSchema
 
-        g = Graph()
-        g.parse(str(ontology_path), format='turtle')
-        schema = OWLSchemaDetector(g).detect()
+        # the graph is parsed once and shared with the finder that follows
+        detector = OWLSchemaDetector.from_path(str(ontology_path))
+        schema = detector.detect()
 
         if schema == OWLSchema.MIXED:
             _log.warning(
@@ -58,15 +61,25 @@ def _warn_if_mixed(ontology_path: Path) -> None:
                 'editing the ontology) for full results.',
                 ontology_path.name,
             )
+
+        return detector.graph
     except Exception as exc:
         _log.debug('Schema detection skipped: %s', exc)
+        return None
 
 
 def _parse_live(ontology_path: Path, input_text: str) -> str:
     from mutato.finder.multiquery.bp import FindOntologyData
+    from mutato.finder.singlequery.dmo import OwlGraphRegistry
     from mutato.parser import MutatoAPI
 
-    _warn_if_mixed(ontology_path)
+    # reload the parsed graph from disk unless the OWL file changed;
+    # 'OWL_GRAPH_CACHE' names a different directory
+    if OwlGraphRegistry.graph_cache() is None:
+        OwlGraphRegistry.set_cache_dir(str(_GRAPH_CACHE_ROOT))
+
+    # held until the finder below takes its own reference
+    graph = _warn_if_mixed(ontology_path)
     _log.info('Parsing via live OWL -- no JSON cache')
 
     finder = FindOntologyData(
@@ -75,7 +88,7 @@ def _parse_live(ontology_path: Path, input_text: str) -> str:
         namespace=None,
     )
     api = MutatoAPI(find_ontology_data=finder)
-    tokens = api.swap_input_text(input_text)
+    tokens = api.swap_input_records(input_text)
     return _reconstruct(tokens, input_text) if tokens else input_text
 
 
@@ -116,8 +129,10 @@ def main():
         action='store_true',
         help=(
             'Parse directly from the OWL file without reading or writing the '
-            'JSON cache. Slower at startup because the full RDF graph is loaded '
-            'and SPARQL views are built on every run. Useful when iterating on '
+            'JSON cache. Slower at startup because SPARQL views are built on '
+            'every run; the parsed RDF graph is cached under '
+            '~/.cache/mutato/graphs and re-parsed only when the OWL file '
+            'changes. Useful when iterating on '
             'an ontology before committing a cache rebuild. '
             'WARNING: MIXED-schema ontologies (those with owl:NamedIndividual '
             'leaf entities, such as econ.owl) will return fewer matches on this '
@@ -10,6 +10,13 @@ from .file_io import FileIO
 from .enforcer import Enforcer
 from .stopwatch import Stopwatch
 from .text_utils import TextUtils
+from .result_cache import ResultCache, CacheInfo
+from .persistent_cache import PersistentCache
+from .instance_cache import InstanceCache, instance_cache
+from .metrics_registry import MetricsRegistry
+from .instrumentation import Instrumentation, NullStopwatch
+from .tracing import Tracing, TraceHook, InMemoryTraceCollector
+from .deadline import Deadline
 
 
 def isEnabledForDebug(logger: Logger) -> bool:
@@ -20,10 +27,18 @@ def isEnabledForInfo(logger: Logger) -> bool:
     return logger.isEnabledFor(logging.INFO)
 
 
+_logging_configured = False
+
+
 def configure_logging(function_name: str) -> Logger:
-    root_logger = logging.getLogger()
-    if len(root_logger.handlers) > 0:
-        root_logger.setLevel(logging.INFO)
-    else:
-        logging.basicConfig(level=logging.INFO)
+    # configure the root logger once per process;
+    # resetting its level on every call overrode the caller's choice and cost time on the hot path
+    global _logging_configured
+    if not _logging_configured:
+        _logging_configured = True
+        root_logger = logging.getLogger()
+        if len(root_logger.handlers) > 0:
+            root_logger.setLevel(logging.INFO)
+        else:
+            logging.basicConfig(level=logging.INFO)
     return logging.getLogger(function_name)
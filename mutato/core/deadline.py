@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+""" Time Budget for a single Parse """
+
+
+import time
+
+
+class Deadline(object):
+    """ Time Budget for a single Parse
+
+    Carries the budget through the pipeline, along with per-stage timings
+    and the stages that were skipped or truncated when the budget ran out.
+
+    A Deadline without a budget never expires; it only records timings.
+
+    Usage:
+        deadline = Deadline(budget_ms=50)
+        swaps = api.swap_input_tokens(tokens, deadline=deadline)
+
+        deadline.degraded   # True if any work was skipped
+        deadline.timings    # {'exact': 0.0012, 'span': 0.0003, ...}
+    """
+
+    def __init__(self,
+                 budget_ms: float | None = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   deadline-aware parsing with graceful pass degradation
+
+        Args:
+            budget_ms (float, optional): the time budget in milliseconds. Defaults to None.
+                None never expires
+
+        Raises:
+            ValueError: the budget is negative
+        """
+        if budget_ms is not None and budget_ms < 0:
+            raise ValueError(f"Invalid Budget: {budget_ms}")
+
+        self.budget_ms = budget_ms
+        self._start = time.perf_counter()
+        self._expires = None
+        if budget_ms is not None:
+            self._expires = self._start + (budget_ms / 1000)
+
+        self.skipped = []
+        self.timings = {}
+
+    @property
+    def degraded(self) -> bool:
+        """ True if any stage was skipped or truncated """
+        return len(self.skipped) > 0
+
+    def expired(self) -> bool:
+        """ Check the Budget
+
+        Returns:
+            bool: True if the budget has run out
+        """
+        return self._expires is not None and time.perf_counter() >= self._expires
+
+    def elapsed_ms(self) -> float:
+        """ Return the Time spent so far in milliseconds """
+        return (time.perf_counter() - self._start) * 1000
+
+    def degrade(self,
+                stage: str) -> None:
+        """ Record that a Stage was skipped or truncated
+
+        Args:
+            stage (str): the stage name
+        """
+        if stage not in self.skipped:
+            self.skipped.append(stage)
+
+    def record(self,
+               stage: str,
+               seconds: float) -> None:
+        """ Add Time spent in a Stage
+
+        Stages that run once per sweep accumulate.
+
+        Args:
+            stage (str): the stage name
+            seconds (float): the elapsed time in seconds
+        """
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
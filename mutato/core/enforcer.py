@@ -5,6 +5,7 @@ from typing import List
 from pprint import pprint
 from typing import Callable
 from collections import defaultdict
+from collections.abc import Mapping
 
 class DataTypeNotExpectedError(Exception):
     """Exception raised for data type errors
@@ -210,6 +211,14 @@ class Enforcer(object):
         if display:
             pprint(value)
 
+    @classmethod
+    def is_mapping(cls,
+                   value: object) -> None:
+        """ Assert Value is a Dict or a read-only Mapping (e.g., a token record) """
+        if not isinstance(value, Mapping):
+            raise DataTypeNotExpectedError(actual_value=value,
+                                           expected_type='Mapping')
+
     @classmethod
     def is_dict_of_lists(cls,
                          value: object,
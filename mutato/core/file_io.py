@@ -3,6 +3,7 @@
 
 
 import os
+import hashlib
 from typing import List
 from pathlib import Path
 from sys import platform
@@ -163,6 +164,22 @@ class FileIO(object):
         """
         return os.path.exists(file_path)
 
+    @staticmethod
+    def sha256(file_path: str) -> str:
+        """ Compute the SHA-256 Digest of a File's Contents
+
+        Args:
+            file_path (str): a file path
+
+        Returns:
+            str: the hex digest
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     @staticmethod
     def exists_or_error(file_path: str) -> None:
         """ Raise Exception if File Path does not exist
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+""" Bounded per-Instance Method Cache """
+
+
+import inspect
+from threading import RLock
+from functools import wraps
+from collections import OrderedDict
+
+from .result_cache import CacheInfo
+
+
+_CACHES = '_d_instance_caches'
+
+
+class InstanceCache(object):
+    """ Bounded per-Instance Method Cache
+
+    A replacement for '@lru_cache' on instance methods.
+
+    'functools.lru_cache' on a method is one class-level cache keyed on 'self';
+    it keeps every instance (and its graph) alive for the life of the process.
+    This cache lives on the instance, so it is released with it.
+
+    Values are returned as-is (not copied), as 'lru_cache' does.
+    Two threads that miss on the same key at once may both compute the value;
+    use a lock around the build where it must happen once.
+
+    Usage:
+        class AskOwlAPI(object):
+
+            @instance_cache(maxsize=1024)
+            def labels(self) -> list:
+                ...
+
+        InstanceCache.info(api)     # {'AskOwlAPI.labels': CacheInfo(...)}
+        InstanceCache.clear(api)
+    """
+
+    _MISSING = object()
+
+    def __init__(self,
+                 maxsize: int):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   per-instance method caches with size limits, statistics and invalidation
+
+        Args:
+            maxsize (int): the maximum number of entries
+
+        Raises:
+            ValueError: the maxsize is not a positive integer
+        """
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError(f"Invalid Cache Size: {maxsize}")
+
+        self._maxsize = maxsize
+        self._lock = RLock()
+        self._d_cache = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self,
+            key: tuple) -> object:
+        """ Retrieve a Value (or InstanceCache._MISSING) """
+        with self._lock:
+            value = self._d_cache.get(key, self._MISSING)
+            if value is self._MISSING:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._d_cache.move_to_end(key)
+            return value
+
+    def put(self,
+            key: tuple,
+            value: object) -> None:
+        """ Store a Value, evicting the least-recently-used entry when full """
+        with self._lock:
+            if key in self._d_cache:
+                self._d_cache.move_to_end(key)
+            self._d_cache[key] = value
+
+            while len(self._d_cache) > self._maxsize:
+                self._d_cache.popitem(last=False)
+                self._evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        """ Return Cache Statistics
+
+        Returns:
+            CacheInfo: hits, misses, evictions, maxsize and currsize
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._d_cache))
+
+    def cache_clear(self) -> None:
+        """ Remove all entries and reset statistics """
+        with self._lock:
+            self._d_cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    @staticmethod
+    def of(instance: object,
+           name: str,
+           maxsize: int) -> 'InstanceCache':
+        """ The Cache for one Method of one Instance, created on first use """
+        d_caches = vars(instance).setdefault(_CACHES, {})
+
+        cache = d_caches.get(name)
+        if cache is None:
+            cache = d_caches.setdefault(name, InstanceCache(maxsize))
+        return cache
+
+    @staticmethod
+    def info(instance: object) -> dict[str, CacheInfo]:
+        """ Statistics for every Method Cache of an Instance
+
+        Returns:
+            dict[str, CacheInfo]: statistics keyed by qualified method name
+        """
+        d_caches = vars(instance).get(_CACHES, {})
+        return {
+            name: d_caches[name].cache_info()
+            for name in sorted(d_caches)
+        }
+
+    @staticmethod
+    def clear(instance: object) -> None:
+        """ Release every Method Cache of an Instance """
+        vars(instance).pop(_CACHES, None)
+
+
+def instance_cache(maxsize: int = 128) -> callable:
+    """ Cache an Instance Method in a Bounded per-Instance LRU Cache
+
+    Each method has its own cache, so an override and the method it overrides never share entries.
+    Calls that bind to the same arguments share an entry,
+    whether arguments are passed by position, by name, or left at their defaults.
+
+    Args:
+        maxsize (int, optional): the maximum number of entries per instance. Defaults to 128.
+
+    Returns:
+        callable: the decorator
+    """
+    def decorator(method: callable) -> callable:
+        cache_name = method.__qualname__
+        signature = inspect.signature(method)
+
+        params = list(signature.parameters.values())[1:]
+        positional = all(
+            param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            for param in params)
+        names = tuple(param.name for param in params)
+        defaults = tuple(param.default for param in params)
+
+        def key(args: tuple,
+                kwargs: dict) -> tuple:
+            if positional and len(args) <= len(params):
+                position = len(args)
+                if not kwargs:
+                    values = args + defaults[position:]
+                elif sum(name in kwargs for name in names[position:]) == len(kwargs):
+                    values = args + tuple(
+                        kwargs.get(name, default)
+                        for name, default in zip(names[position:], defaults[position:]))
+                else:
+                    values = None
+
+                if values is not None and not any(value is inspect.Parameter.empty for value in values):
+                    return values
+
+            # anything unusual, including a call that will fail, binds the slow way
+            bound = signature.bind(None, *args, **kwargs)
+            bound.apply_defaults()
+            return tuple(bound.arguments.values())[1:]
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = InstanceCache.of(self, cache_name, maxsize)
+            cache_key = key(args, kwargs)
+
+            value = cache.get(cache_key)
+            if value is InstanceCache._MISSING:
+                value = method(self, *args, **kwargs)
+                cache.put(cache_key, value)
+
+            return value
+
+        # lets a caller seed an entry computed elsewhere, e.g. 'AskOwlAPI.preload'
+        wrapper.cache_key = key
+        wrapper.cache_name = cache_name
+        wrapper.maxsize = maxsize
+        return wrapper
+
+    return decorator
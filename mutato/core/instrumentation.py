@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+""" Resolve Logging, Timing and Validation once per Pipeline """
+
+
+import logging
+
+from .stopwatch import Stopwatch
+from .metrics_registry import MetricsRegistry
+
+
+class NullStopwatch(object):
+    """ A Stopwatch that measures nothing
+
+    Returned by Instrumentation.stopwatch() when debug logging is disabled,
+    so hot-path code can time itself unconditionally at no cost.
+    """
+
+    duration = 0.0
+    running = False
+
+    def restart(self) -> 'NullStopwatch':
+        return self
+
+    def reset(self) -> 'NullStopwatch':
+        return self
+
+    def start(self) -> 'NullStopwatch':
+        return self
+
+    def stop(self) -> 'NullStopwatch':
+        return self
+
+    def __str__(self) -> str:
+        return ''
+
+
+class Instrumentation(object):
+    """ Resolve Logging, Timing and Validation once per Pipeline
+
+    The parser services previously asked the logger for its level, built a Stopwatch
+    and ran Enforcer checks on every call.  An Instrumentation is resolved once
+    and handed to each service, which then branches on plain attributes.
+
+    Attributes:
+        debug (bool): emit debug logging and timings
+        validate (bool): run Enforcer checks on hot-path inputs
+        metrics (MetricsRegistry | None): pipeline counters and histograms (if enabled)
+
+    In production mode debug and validate are False and stopwatch() returns a shared NullStopwatch.
+    Metrics are independent of production mode.
+    The log level is read at construction; build a new pipeline to pick up a level change.
+    """
+
+    _NULL_STOPWATCH = NullStopwatch()
+
+    def __init__(self,
+                 production: bool = False,
+                 logger_name: str = 'mutato',
+                 metrics: MetricsRegistry | None = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   central instrumentation for the hot path
+
+        Args:
+            production (bool, optional): skip all per-call logging, timing and validation. Defaults to False.
+            logger_name (str, optional): the logger whose level controls debug output. Defaults to 'mutato'.
+            metrics (MetricsRegistry, optional): a registry to record pipeline metrics into. Defaults to None.
+        """
+        self.production = production
+        self.metrics = metrics
+        self.validate = not production
+        self.debug = not production and logging.getLogger(
+            logger_name).isEnabledFor(logging.DEBUG)
+
+    def stopwatch(self) -> Stopwatch | NullStopwatch:
+        """ Start a Stopwatch (if debug output is enabled)
+
+        Returns:
+            Stopwatch | NullStopwatch: a running stopwatch or the shared no-op
+        """
+        if self.debug:
+            return Stopwatch()
+        return self._NULL_STOPWATCH
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+""" Opt-In Counters and Latency Histograms for the Matching Pipeline """
+
+
+from bisect import bisect_left
+from threading import RLock
+from typing import Callable
+
+
+class MetricsRegistry(object):
+    """ Opt-In Counters and Latency Histograms for the Matching Pipeline
+
+    Series are identified by a metric name and optional labels, and keyed
+    in Prometheus notation (e.g., 'mutato_swaps_total{type="exact"}').
+
+    Gauges are not stored; they are read from registered collectors
+    (e.g., finder cache statistics) each time a snapshot is taken.
+
+    Usage:
+        metrics = MetricsRegistry()
+        metrics.inc('mutato_swaps_total', type='exact')
+        metrics.observe('mutato_stage_seconds', 0.0042, stage='exact')
+
+        metrics.snapshot()      # dict
+        metrics.prometheus()    # text exposition format
+    """
+
+    DEFAULT_BUCKETS = (
+        0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+        0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self,
+                 buckets: tuple = DEFAULT_BUCKETS):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   per-stage metrics for the matching pipeline
+
+        Args:
+            buckets (tuple, optional): histogram upper bounds in seconds. Defaults to DEFAULT_BUCKETS.
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._lock = RLock()
+
+        self._d_help = {}
+        self._d_counters = {}
+        self._d_histograms = {}
+        self._collectors = []
+
+    @staticmethod
+    def _series(name: str,
+                labels: dict) -> str:
+        if not labels:
+            return name
+        inner = ','.join(f'{k}="{labels[k]}"' for k in sorted(labels))
+        return f'{name}{{{inner}}}'
+
+    def describe(self,
+                 name: str,
+                 text: str) -> None:
+        """ Attach HELP text to a metric name
+
+        Args:
+            name (str): the metric name
+            text (str): a one-line description
+        """
+        self._d_help[name] = text
+
+    def inc(self,
+            name: str,
+            value: int = 1,
+            **labels) -> None:
+        """ Increment a Counter
+
+        Args:
+            name (str): the metric name
+            value (int, optional): the increment. Defaults to 1.
+        """
+        key = (name, self._series(name, labels))
+        with self._lock:
+            self._d_counters[key] = self._d_counters.get(key, 0) + value
+
+    def observe(self,
+                name: str,
+                seconds: float,
+                **labels) -> None:
+        """ Record a Latency Observation
+
+        Args:
+            name (str): the metric name
+            seconds (float): the elapsed time in seconds
+        """
+        key = (name, self._series(name, labels))
+        with self._lock:
+            d = self._d_histograms.get(key)
+            if d is None:
+                d = {'count': 0, 'sum': 0.0,
+                     'buckets': [0] * len(self._buckets)}
+                self._d_histograms[key] = d
+
+            d['count'] += 1
+            d['sum'] += seconds
+
+            i = bisect_left(self._buckets, seconds)
+            if i < len(self._buckets):
+                d['buckets'][i] += 1
+
+    def register_collector(self,
+                           collector: Callable[[], list]) -> None:
+        """ Register a Gauge Collector
+
+        Args:
+            collector (Callable): returns a list of (name, labels, value) tuples
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def _gauges(self) -> dict:
+        d_gauges = {}
+        for collector in self._collectors:
+            for name, labels, value in collector():
+                d_gauges[(name, self._series(name, labels))] = value
+        return d_gauges
+
+    def _cumulative(self,
+                    d: dict) -> dict:
+        d_buckets = {}
+        total = 0
+        for bound, count in zip(self._buckets, d['buckets']):
+            total += count
+            d_buckets[str(bound)] = total
+        d_buckets['+Inf'] = d['count']
+        return d_buckets
+
+    def snapshot(self) -> dict:
+        """ Return a point-in-time copy of every series
+
+        Returns:
+            dict: 'counters', 'histograms' and 'gauges' keyed by series
+        """
+        with self._lock:
+            return {
+                'counters': {
+                    series: value
+                    for (_, series), value in sorted(self._d_counters.items())
+                },
+                'histograms': {
+                    series: {
+                        'count': d['count'],
+                        'sum': d['sum'],
+                        'buckets': self._cumulative(d),
+                    }
+                    for (_, series), d in sorted(self._d_histograms.items())
+                },
+                'gauges': {
+                    series: value
+                    for (_, series), value in sorted(self._gauges().items())
+                },
+            }
+
+    def prometheus(self) -> str:
+        """ Render every series in the Prometheus text exposition format
+
+        Returns:
+            str: the exposition text
+        """
+        lines = []
+
+        def header(name: str, metric_type: str) -> None:
+            if name in self._d_help:
+                lines.append(f'# HELP {name} {self._d_help[name]}')
+            lines.append(f'# TYPE {name} {metric_type}')
+
+        def grouped(d: dict) -> dict:
+            d_grouped = {}
+            for (name, series), value in sorted(d.items()):
+                d_grouped.setdefault(name, []).append((series, value))
+            return d_grouped
+
+        def with_label(series: str, suffix: str, label: str) -> str:
+            name, _, inner = series.partition('{')
+            inner = inner.rstrip('}')
+            inner = ','.join(x for x in (inner, label) if x)
+            return f'{name}{suffix}{{{inner}}}' if inner else f'{name}{suffix}'
+
+        with self._lock:
+
+            for name, items in grouped(self._d_counters).items():
+                header(name, 'counter')
+                for series, value in items:
+                    lines.append(f'{series} {value}')
+
+            for name, items in grouped(self._d_histograms).items():
+                header(name, 'histogram')
+                for series, d in items:
+                    for bound, count in self._cumulative(d).items():
+                        le = 'le="' + bound + '"'
+                        lines.append(f'{with_label(series, "_bucket", le)} {count}')
+                    lines.append(f'{with_label(series, "_sum", "")} {d["sum"]}')
+                    lines.append(f'{with_label(series, "_count", "")} {d["count"]}')
+
+            for name, items in grouped(self._gauges()).items():
+                header(name, 'gauge')
+                for series, value in items:
+                    lines.append(f'{series} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """ Zero every counter and histogram; collectors are kept """
+        with self._lock:
+            self._d_counters.clear()
+            self._d_histograms.clear()
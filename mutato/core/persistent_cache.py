@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+""" Two-Tier On-Disk Cache for Tokenization and Swap Results """
+
+
+import json
+import time
+import sqlite3
+import hashlib
+from threading import RLock
+
+from .result_cache import ResultCache
+
+
+class PersistentCache(object):
+    """ Two-Tier On-Disk Cache for Tokenization and Swap Results
+
+    Tier one ('tokens') holds tokenization output keyed by text hash and spaCy model version.
+    Tier two ('swaps') holds swap results keyed by token hash, ontology fingerprint and pipeline config.
+
+    After an ontology edit only the fingerprint changes, so tier one continues to hit
+    and a re-run of a corpus pays only for matching.
+
+    Writes are buffered and flushed in a single transaction once 'batch_size' writes are pending,
+    on an explicit flush(), or on close().  Each tier is bounded by 'max_entries';
+    the least-recently-accessed rows are evicted on flush.
+
+    Usage:
+        with PersistentCache('/tmp/mutato.db') as cache:
+            api = MutatoAPI(finder, persistent_cache=cache)
+            for line in corpus:
+                api.swap_input_text(line)
+    """
+
+    TOKENS = 'tokens'
+    SWAPS = 'swaps'
+
+    _TIERS = (TOKENS, SWAPS)
+
+    def __init__(self,
+                 db_path: str,
+                 max_entries: int = 100000,
+                 batch_size: int = 256):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   two-tier on-disk cache for tokenization and swap results
+
+        Args:
+            db_path (str): the path to the SQLite database file
+            max_entries (int, optional): the maximum number of rows per tier. Defaults to 100000.
+            batch_size (int, optional): the number of pending writes that triggers a flush. Defaults to 256.
+
+        Raises:
+            ValueError: max_entries or batch_size is not a positive integer
+        """
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError(f"Invalid Max Entries: {max_entries}")
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError(f"Invalid Batch Size: {batch_size}")
+
+        self._db_path = db_path
+        self._max_entries = max_entries
+        self._batch_size = batch_size
+
+        self._lock = RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+
+        with self._conn:
+            for tier in self._TIERS:
+                self._conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS {tier} ('
+                    'key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed REAL NOT NULL)')
+                self._conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS {tier}_accessed ON {tier} (accessed)')
+
+        self._d_pending = {tier: {} for tier in self._TIERS}
+        self._d_touched = {tier: set() for tier in self._TIERS}
+        self._d_stats = {
+            tier: {'hits': 0, 'misses': 0, 'evictions': 0}
+            for tier in self._TIERS
+        }
+
+    @staticmethod
+    def tokens_key(input_text: str,
+                   model_version: str) -> str:
+        """ Build a Tier-One Key
+
+        Args:
+            input_text (str): the exact input text
+            model_version (str): the spaCy model name and version
+
+        Returns:
+            str: the cache key
+        """
+        return ResultCache.key(
+            model_version,
+            hashlib.sha256(input_text.encode('utf-8')).hexdigest())
+
+    @staticmethod
+    def swaps_key(tokens: list[dict],
+                  fingerprint: str,
+                  config: tuple) -> str:
+        """ Build a Tier-Two Key
+
+        Compute this before the pipeline runs; the passes may annotate the input tokens.
+
+        Args:
+            tokens (list[dict]): the tokenized input
+            fingerprint (str): the ontology content fingerprint
+            config (tuple): the pipeline configuration
+
+        Returns:
+            str: the cache key
+        """
+        return ResultCache.key(fingerprint, config, tokens)
+
+    def _check_tier(self,
+                    tier: str) -> None:
+        if tier not in self._d_pending:
+            raise ValueError(f"Unknown Cache Tier: {tier}")
+
+    def get(self,
+            tier: str,
+            key: str) -> object | None:
+        """ Retrieve a Cached Value
+
+        Args:
+            tier (str): PersistentCache.TOKENS or PersistentCache.SWAPS
+            key (str): the cache key
+
+        Returns:
+            object | None: the cached value (if any)
+        """
+        self._check_tier(tier)
+
+        with self._lock:
+            value = self._d_pending[tier].get(key)
+
+            if value is None:
+                row = self._conn.execute(
+                    f'SELECT value FROM {tier} WHERE key = ?', (key,)).fetchone()
+                if row:
+                    value = row[0]
+                    self._d_touched[tier].add(key)
+
+            if value is None:
+                self._d_stats[tier]['misses'] += 1
+                return None
+
+            self._d_stats[tier]['hits'] += 1
+
+        return json.loads(value)
+
+    def put(self,
+            tier: str,
+            key: str,
+            value: object) -> None:
+        """ Buffer a Value for the next bulk write
+
+        Args:
+            tier (str): PersistentCache.TOKENS or PersistentCache.SWAPS
+            key (str): the cache key
+            value (object): a JSON-serializable value
+        """
+        self._check_tier(tier)
+        if value is None:
+            return None
+
+        encoded = json.dumps(value, separators=(',', ':'), default=str)
+
+        with self._lock:
+            self._d_pending[tier][key] = encoded
+
+            total_pending = sum(len(x) for x in self._d_pending.values())
+            if total_pending >= self._batch_size:
+                self.flush()
+
+    def _evict(self,
+               tier: str) -> None:
+        total = self._conn.execute(f'SELECT COUNT(*) FROM {tier}').fetchone()[0]
+        overflow = total - self._max_entries
+        if overflow <= 0:
+            return None
+
+        self._conn.execute(
+            f'DELETE FROM {tier} WHERE key IN '
+            f'(SELECT key FROM {tier} ORDER BY accessed ASC LIMIT ?)', (overflow,))
+        self._d_stats[tier]['evictions'] += overflow
+
+    def flush(self) -> None:
+        """ Write all pending values and access times in a single transaction """
+        with self._lock:
+            now = time.time()
+
+            with self._conn:
+                for tier in self._TIERS:
+
+                    if self._d_pending[tier]:
+                        self._conn.executemany(
+                            f'INSERT OR REPLACE INTO {tier} (key, value, accessed) VALUES (?, ?, ?)',
+                            [(k, v, now) for k, v in self._d_pending[tier].items()])
+
+                    if self._d_touched[tier]:
+                        self._conn.executemany(
+                            f'UPDATE {tier} SET accessed = ? WHERE key = ?',
+                            [(now, k) for k in self._d_touched[tier]])
+
+                    self._evict(tier)
+
+            for tier in self._TIERS:
+                self._d_pending[tier].clear()
+                self._d_touched[tier].clear()
+
+    def cache_info(self) -> dict:
+        """ Return Per-Tier Cache Statistics
+
+        Returns:
+            dict: hits, misses, evictions and currsize keyed by tier
+        """
+        with self._lock:
+            d_info = {}
+            for tier in self._TIERS:
+                stored = self._conn.execute(
+                    f'SELECT COUNT(*) FROM {tier}').fetchone()[0]
+                d_info[tier] = {
+                    **self._d_stats[tier],
+                    'maxsize': self._max_entries,
+                    'currsize': stored + len(self._d_pending[tier]),
+                }
+            return d_info
+
+    def clear(self) -> None:
+        """ Remove all rows from both tiers """
+        with self._lock:
+            with self._conn:
+                for tier in self._TIERS:
+                    self._conn.execute(f'DELETE FROM {tier}')
+                    self._d_pending[tier].clear()
+                    self._d_touched[tier].clear()
+
+    def close(self) -> None:
+        """ Flush pending writes and close the database """
+        with self._lock:
+            if self._conn is None:
+                return None
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> 'PersistentCache':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+""" Bounded In-Memory Result Cache """
+
+
+import copy
+import json
+import hashlib
+from threading import RLock
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class ResultCache(object):
+    """ Bounded In-Memory Result Cache
+
+    A thread-safe LRU cache for pipeline results.
+
+    Values are deep-copied on the way in and on the way out,
+    so a caller that mutates a returned result cannot corrupt the cached entry.
+    Immutable values (str, int, tuple of str) are returned as-is.
+
+    Usage:
+        cache = ResultCache(maxsize=1024)
+        key = ResultCache.key(fingerprint, config, input_text)
+
+        result = cache.get(key)
+        if result is None:
+            result = expensive(input_text)
+            cache.put(key, result)
+    """
+
+    _IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+
+    def __init__(self,
+                 maxsize: int = 1024):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   in-memory parse result cache with ontology fingerprinting
+
+        Args:
+            maxsize (int, optional): the maximum number of entries. Defaults to 1024.
+
+        Raises:
+            ValueError: the maxsize is not a positive integer
+        """
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError(f"Invalid Cache Size: {maxsize}")
+
+        self._maxsize = maxsize
+        self._lock = RLock()
+        self._d_cache = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(*args) -> str:
+        """ Build a stable Cache Key from one-or-more components
+
+        Returns:
+            str: a hex digest of the components
+        """
+        return hashlib.sha256(
+            json.dumps(args, default=str).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def normalize(input_text: str) -> str:
+        """ Normalize Input Text for use in a Cache Key
+
+        Collapses runs of whitespace and strips leading and trailing whitespace.
+
+        Args:
+            input_text (str): any input text
+
+        Returns:
+            str: the normalized text
+        """
+        return ' '.join(input_text.split())
+
+    @staticmethod
+    def fingerprint(data: object) -> str:
+        """ Compute a Content Fingerprint for a JSON-like structure
+
+        Args:
+            data (object): a JSON-like structure (e.g., an MDA dict)
+
+        Returns:
+            str: a hex digest of the content
+        """
+        try:
+            encoded = json.dumps(data, sort_keys=True, default=str)
+        except TypeError:
+            # mixed int and str keys (e.g., 'ngrams') cannot be sorted
+            encoded = json.dumps(data, default=str)
+
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def _copy(self,
+              value: object) -> object:
+        if isinstance(value, self._IMMUTABLE_TYPES):
+            return value
+        return copy.deepcopy(value)
+
+    def get(self,
+            key: str) -> object | None:
+        """ Retrieve a Cached Value
+
+        Args:
+            key (str): the cache key
+
+        Returns:
+            object | None: a copy of the cached value (if any)
+        """
+        with self._lock:
+            if key not in self._d_cache:
+                self._misses += 1
+                return None
+
+            self._d_cache.move_to_end(key)
+            self._hits += 1
+            value = self._d_cache[key]
+
+        return self._copy(value)
+
+    def put(self,
+            key: str,
+            value: object) -> None:
+        """ Cache a Value
+
+        The least-recently-used entry is evicted when the cache is full.
+        None values are not cached.
+
+        Args:
+            key (str): the cache key
+            value (object): the value to cache
+        """
+        if value is None:
+            return None
+
+        value = self._copy(value)
+
+        with self._lock:
+            if key in self._d_cache:
+                self._d_cache.move_to_end(key)
+            self._d_cache[key] = value
+
+            while len(self._d_cache) > self._maxsize:
+                self._d_cache.popitem(last=False)
+                self._evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        """ Return Cache Statistics
+
+        Returns:
+            CacheInfo: hits, misses, evictions, maxsize and currsize
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._d_cache))
+
+    def clear(self) -> None:
+        """ Remove all entries and reset statistics """
+        with self._lock:
+            self._d_cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._d_cache)
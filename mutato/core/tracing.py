@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+""" Stage Tracing Hooks for the Matching Pipeline """
+
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import RLock
+
+
+_TRACE_CONTEXT: ContextVar[dict] = ContextVar('mutato_trace_context', default={})
+
+
+class Tracing(object):
+    """ Propagate Trace Attributes to Stage Hooks
+
+    Attributes set here (e.g., a request or sentence id) are passed to every hook
+    fired inside the block.  They live in a ContextVar, so they follow the caller
+    into batch workers started with contextvars.copy_context().
+
+    Usage:
+        with Tracing.context(request_id='abc-123'):
+            api.swap_input_text(input_text)
+    """
+
+    @staticmethod
+    @contextmanager
+    def context(**attributes):
+        """ Add Trace Attributes for the duration of a block """
+        token = _TRACE_CONTEXT.set({**_TRACE_CONTEXT.get(), **attributes})
+        try:
+            yield
+        finally:
+            _TRACE_CONTEXT.reset(token)
+
+    @staticmethod
+    def current() -> dict:
+        """ Return the active Trace Attributes
+
+        Returns:
+            dict: the attributes set by the enclosing Tracing.context() blocks
+        """
+        return _TRACE_CONTEXT.get()
+
+
+class TraceHook(object):
+    """ Base Class for Stage Hooks
+
+    Subclass and override either method; both default to no-ops.
+    An exporter for any tracing library can be written as a TraceHook
+    without mutato depending on that library.
+    """
+
+    def on_stage_start(self,
+                       stage: str,
+                       token_count: int | None,
+                       context: dict) -> None:
+        """ Called before a stage runs
+
+        Args:
+            stage (str): 'tokenization', 'exact', 'span' or 'hierarchy'
+            token_count (int | None): the number of input tokens (None before tokenization)
+            context (dict): the active trace attributes
+        """
+        pass
+
+    def on_stage_end(self,
+                     stage: str,
+                     token_count: int | None,
+                     elapsed: float,
+                     context: dict) -> None:
+        """ Called after a stage completes
+
+        Args:
+            stage (str): 'tokenization', 'exact', 'span' or 'hierarchy'
+            token_count (int | None): the number of output tokens
+            elapsed (float): the stage duration in seconds
+            context (dict): the active trace attributes
+        """
+        pass
+
+
+class InMemoryTraceCollector(TraceHook):
+    """ Record Stage Events in Memory
+
+    Usage:
+        collector = InMemoryTraceCollector()
+        api.add_hook(collector)
+        api.swap_input_text(input_text)
+        collector.events    # [{'event': 'start', 'stage': 'tokenization', ...}, ...]
+    """
+
+    def __init__(self):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   stage tracing hooks for the matching pipeline
+        """
+        self._lock = RLock()
+        self.events = []
+
+    def on_stage_start(self,
+                       stage: str,
+                       token_count: int | None,
+                       context: dict) -> None:
+        with self._lock:
+            self.events.append({
+                'event': 'start',
+                'stage': stage,
+                'token_count': token_count,
+                'context': context,
+            })
+
+    def on_stage_end(self,
+                     stage: str,
+                     token_count: int | None,
+                     elapsed: float,
+                     context: dict) -> None:
+        with self._lock:
+            self.events.append({
+                'event': 'end',
+                'stage': stage,
+                'token_count': token_count,
+                'elapsed': elapsed,
+                'context': context,
+            })
+
+    def clear(self) -> None:
+        """ Remove all recorded events """
+        with self._lock:
+            self.events.clear()
@@ -3,7 +3,9 @@
 """ Generic Facade to Find Data in 1..* Ontology Models """
 
 
-from functools import lru_cache
+import os
+from threading import RLock
+from functools import wraps
 from collections import defaultdict
 
 from mutato.finder.multiquery.dmo import (
@@ -16,22 +18,46 @@ from mutato.finder.multiquery.svc import (
     FindTypes,
     FindEquivalents,
     LoadSynonyms,
+    LoadOntologiesParallel,
     QueryNerDepth,
     QueryNerLabel,
     QueryNerTaxo
 )
 from mutato.finder.singlequery.bp import AskOwlAPI
 from mutato.finder.singlequery.dto import QueryResultType
-from mutato.core import configure_logging, Enforcer, isEnabledForDebug
+from mutato.core import configure_logging, Enforcer, FileIO, ResultCache, CacheInfo, InstanceCache, instance_cache, isEnabledForDebug
+
+
+def _lazy_view(method: callable) -> callable:
+    """ Build a Zero-Argument View on first use, at most once
+
+    Concurrent first calls wait on the finder's lock; only one of them builds the view.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def view(self):
+        if name in self._d_views:
+            return self._d_views[name]
+
+        with self._lock:
+            if name not in self._d_views:
+                self._d_views[name] = method(self)
+            return self._d_views[name]
+
+    return view
 
 
 class FindOntologyData(object):
     """ Generic Facade to Find Data in 1..* Ontology Models """
 
+    WARM_VIEWS = ['synonyms', 'types', 'lookup', 'spans', 'trie', 'equivalents', 'ner']
+
     def __init__(self,
                  ontologies: list,
                  absolute_path: str,
-                 namespace: str):
+                 namespace: str,
+                 max_workers: int = 1):
         """ Change Log
 
         Created:
@@ -50,10 +76,32 @@ class FindOntologyData(object):
             craig@bast.ai
             *   add 'find-equivalents'
                 https://bast-ai.atlassian.net/browse/COR-139
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   optionally load ontologies and build their views in a process pool
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   build synonym, type and lookup views lazily; add 'warm'
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   per-instance bounded caches in place of '@lru_cache'; add 'cache_info' and 'cache_clear'
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve NER labels once into 'ner_table'; 'find_ner' is a single lookup
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   equivalence classes across all ontologies; add 'equivalence_classes'
 
         Args:
             ontologies (list): one-or-more Ontology models to use in processing
             absolute_path (str): an absolute path that applies to all the OWL models
+            max_workers (int, optional): the number of worker processes used to load 2..* ontologies.
+                Defaults to 1 (load in this process).
         """
         self.logger = configure_logging(__name__)
         if isEnabledForDebug(self.logger):
@@ -62,10 +110,14 @@ class FindOntologyData(object):
         self._ontologies = ontologies
         self._absolute_path = absolute_path
 
+        self._lock = RLock()
+        self._d_views = {}
+
         self._d_ontologies = self._load(
             ontologies=ontologies,
             absolute_path=absolute_path,
-            namespace=namespace)
+            namespace=namespace,
+            max_workers=max_workers)
 
         self._merge = ModelResultMerge().process
 
@@ -73,20 +125,86 @@ class FindOntologyData(object):
         self._query_ner_depth = QueryNerDepth(self._d_ontologies).process
         self._query_ner_taxo = QueryNerTaxo(self._d_ontologies).process
 
-        self._load_synonyms = LoadSynonyms(
+    @property
+    @_lazy_view
+    def _load_synonyms(self) -> LoadSynonyms:
+        return LoadSynonyms(
             d_ontologies=self._d_ontologies,
             model_result_merge=self._merge)
 
-        self._find_synonyms = FindSynonyms(
+    @property
+    @_lazy_view
+    def _find_synonyms(self) -> FindSynonyms:
+        return FindSynonyms(
             d_synonyms_fwd=self.synonyms(),
             d_synonyms_rev=self.synonyms_rev())
 
-        self._find_types = FindTypes(
+    @property
+    @_lazy_view
+    def _find_types(self) -> FindTypes:
+        return FindTypes(
             d_types_fwd=self.types(),
             d_types_rev=self.types_rev())
 
-        self._find_equivalents = FindEquivalents(
-            list(self._d_ontologies.values())).process
+    @property
+    @_lazy_view
+    def _find_equivalents(self) -> FindEquivalents:
+        return FindEquivalents(
+            list(self._d_ontologies.values()))
+
+    def warm(self,
+             views: list[str] | None = None) -> None:
+        """ Build Views now instead of on first use
+
+        Views are otherwise built lazily, so a caller that only needs the taxonomy
+        never pays for the synonym pipeline.  Services that prefer to pay up front
+        can call this once after construction.
+
+        Args:
+            views (list[str] | None, optional): names from WARM_VIEWS. Defaults to None (all of them).
+
+        Raises:
+            ValueError: an unknown view name
+        """
+        views = self.WARM_VIEWS if views is None else views
+
+        unknown = [view for view in views if view not in self.WARM_VIEWS]
+        if unknown:
+            raise ValueError(f"Unknown Views: {unknown}")
+
+        d_builders = {
+            'synonyms': lambda: self._find_synonyms,
+            'types': lambda: self._find_types,
+            'lookup': self.lookup,
+            'spans': self.span_keys,
+            'trie': self.trie,
+            'equivalents': lambda: self._find_equivalents,
+            'ner': self.ner_table,
+        }
+
+        for view in views:
+            d_builders[view]()
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """ Return Cache Statistics
+
+        Returns:
+            dict[str, CacheInfo]: statistics keyed by qualified method name
+        """
+        return InstanceCache.info(self)
+
+    def cache_clear(self) -> None:
+        """ Release every cached Result and lazily-built View
+
+        The ontologies' own view caches are released too;
+        each view is built again on its next use.
+        """
+        with self._lock:
+            self._d_views.clear()
+            InstanceCache.clear(self)
+
+            for ask_owl_api in self._d_ontologies.values():
+                ask_owl_api.cache_clear()
 
     def ontologies(self) -> list:
         return self._ontologies
@@ -94,16 +212,43 @@ class FindOntologyData(object):
     def absolute_path(self) -> str:
         return self._absolute_path
 
+    @instance_cache(maxsize=1)
+    def fingerprint(self) -> str:
+        """ Compute a Content Fingerprint for the underlying Ontologies
+
+        The fingerprint covers each OWL file and its optional external synonym file.
+
+        Returns:
+            str: a hex digest of the ontology content
+        """
+        digests = []
+        for ontology_name in sorted(self._d_ontologies):
+            ask_owl_api = self._d_ontologies[ontology_name]
+
+            synonym_file_path = os.path.normpath(os.path.join(
+                ask_owl_api.absolute_path,
+                f'{ask_owl_api.ontology_name}.txt'))
+
+            digests.append([
+                ontology_name,
+                FileIO.sha256(ask_owl_api.input_path),
+                FileIO.sha256(synonym_file_path) if FileIO.exists(synonym_file_path) else None
+            ])
+
+        return ResultCache.key(*digests)
+
     def _load(self,
               ontologies: list[str],
               absolute_path: str,
-              namespace: str) -> dict[str, AskOwlAPI]:
+              namespace: str,
+              max_workers: int = 1) -> dict[str, AskOwlAPI]:
         """
         Loads ontologies and initializes AskOwlAPI instances for each ontology.
 
         Parameters:
             ontologies (list[str]): A list of ontology names.
             absolute_path (str): The absolute path where the ontologies are located.
+            max_workers (int): The number of worker processes; 2..* ontologies and 2..* workers load in parallel.
 
         Returns:
             Dict[str, AskOwlAPI]: 
@@ -114,6 +259,12 @@ class FindOntologyData(object):
         Notes:
             - The method assumes that the `AskOwlAPI` class takes `ontology_name` and `absolute_path` as initialization parameters.
         """
+        if max_workers > 1 and len(ontologies) > 1:
+            return LoadOntologiesParallel(max_workers).process(
+                ontologies=ontologies,
+                absolute_path=absolute_path,
+                namespace=namespace)
+
         return {
             ontology_name: AskOwlAPI(
                 ontology_name=ontology_name,
@@ -171,7 +322,7 @@ class FindOntologyData(object):
         """
         return self._by_predicate(predicate_name, to_lowercase)
 
-    @lru_cache
+    @instance_cache()
     def _by_predicate(self,
                       predicate_name: str,
                       to_lowercase: bool = True) -> dict:
@@ -184,14 +335,9 @@ class FindOntologyData(object):
 
         if not results:
             return None
-        
         elif len(results) == 1:
             return results[0]
-
-        return self._merge(
-            sorted(set(results)),
-            QueryResultType.DICT_OF_STR2LIST
-        )
+        return self._merge(results, QueryResultType.DICT_OF_STR2LIST)
 
     def by_predicate_rev(self,
                          predicate_name: str,
@@ -218,7 +364,7 @@ class FindOntologyData(object):
         """
         return self._by_predicate_rev(predicate_name, to_lowercase)
 
-    @lru_cache
+    @instance_cache()
     def _by_predicate_rev(self,
                           predicate_name: str,
                           to_lowercase: bool = True) -> dict:
@@ -294,7 +440,7 @@ class FindOntologyData(object):
         """
         return self._by_predicate('effects')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def effects_rev(self) -> dict:
         """ Find Effected By relationships
 
@@ -307,7 +453,7 @@ class FindOntologyData(object):
         """
         return self._by_predicate_rev('effects')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def requires(self) -> dict:
         """ Find Requires Relationships
 
@@ -320,7 +466,7 @@ class FindOntologyData(object):
         """
         return self._by_predicate('requires')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def required_by(self) -> dict:
         """ Find Required By relationships
 
@@ -361,7 +507,7 @@ class FindOntologyData(object):
         if self.required_by() and input_text in self.required_by():
             return self.required_by()[input_text]
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def similar(self) -> dict:
         """ Find Similar Relationships
 
@@ -374,7 +520,7 @@ class FindOntologyData(object):
         """
         return self._by_predicate('similarTo')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def similar_rev(self) -> dict:
         """ Find Similar Inverse Relationships
 
@@ -418,7 +564,7 @@ class FindOntologyData(object):
 
         return results
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def implies(self) -> dict:
         """ Find Implied Relationships
 
@@ -431,7 +577,7 @@ class FindOntologyData(object):
         """
         return self._by_predicate('implies')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def implies_by_entity(self,
                           input_text: str) -> dict:
         """ Restrict Implies Relationship to a Single Entity
@@ -446,7 +592,7 @@ class FindOntologyData(object):
         if self.implies() and input_text in self.implies():
             return self.implies()[input_text]
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def implied_by(self) -> dict:
         """ Find Implied By relationships
 
@@ -459,7 +605,7 @@ class FindOntologyData(object):
         """
         return self._by_predicate_rev('implies')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def implied_by_entity(self,
                           input_text: str) -> dict:
         """ Restrict Implied By Relationship to a Single Entity
@@ -474,7 +620,7 @@ class FindOntologyData(object):
         if self.implied_by() and input_text in self.implied_by():
             return self.implied_by()[input_text]
 
-    @lru_cache(maxsize=512, typed=False)
+    @instance_cache(maxsize=512)
     def is_canon(self,
                  input_text: str) -> bool:
         """Check if Input Text is Canonical Entity
@@ -487,7 +633,7 @@ class FindOntologyData(object):
         """
         return self._find_synonyms.is_canon(input_text)
 
-    @lru_cache(maxsize=512, typed=False)
+    @instance_cache(maxsize=512)
     def find_canon(self,
                    input_text: str) -> str | None:
         """Find the Canonical Representation of the Input String
@@ -500,7 +646,7 @@ class FindOntologyData(object):
         """
         return self._find_synonyms.find_canon(input_text)
 
-    @lru_cache(maxsize=512, typed=False)
+    @instance_cache(maxsize=512)
     def is_variant(self,
                    input_text: str) -> bool:
         """Check if Input Text is known variant for at least one Canonical Entry
@@ -513,7 +659,7 @@ class FindOntologyData(object):
         """
         return self._find_synonyms.is_variant(input_text)
 
-    @lru_cache(maxsize=512, typed=False)
+    @instance_cache(maxsize=512)
     def find_variants(self,
                       input_text: str) -> list | None:
         """Find the Synonyms for a known Entity
@@ -526,55 +672,67 @@ class FindOntologyData(object):
         """
         return self._find_synonyms.find_variants(input_text)
 
-    @lru_cache(maxsize=512, typed=False)
-    def find_ner(self,
-                 input_text: str) -> str | None:
+    @_lazy_view
+    def ner_table(self) -> dict[str, str]:
+        """ Resolve the NER of every Entity once
+
+        The NER depth and taxonomy queries run only when some entity has a NER label.
 
-        svc = FindNER(
+        Returns:
+            dict[str, str]: NER keyed by entity, with depth-based tie-breaking applied
+        """
+        d_graffl_ner = self.graffl_ner()
+        d_spacy_ner = self.spacy_ner()
+        if not d_graffl_ner and not d_spacy_ner:
+            return {}
+
+        return FindNER(
             d_ner_depth=self.ner_depth(),
             d_ner_taxo=self.ner_taxonomy(),
-            d_graffl_ner=self.graffl_ner(),
-            d_spacy_ner=self.spacy_ner())
+            d_graffl_ner=d_graffl_ner,
+            d_spacy_ner=d_spacy_ner).table()
 
-        return svc.find_ner(input_text)
+    def find_ner(self,
+                 input_text: str) -> str | None:
+        return FindNER.probe(self.ner_table(), input_text)
 
     # TODO:  Find a way to fix this
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def graffl_ner(self) -> dict:
         return dict()
         # return self._query_ner_label('grafflNER')
 
     # TODO:  Find a way to fix this
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def graffl_ner_rev(self) -> dict:
         return dict()
         # return self._query_ner_label('grafflNER', reverse=True)
 
     # TODO:  Find a way to fix this
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def spacy_ner(self) -> dict:
         return dict()
         # return self._query_ner_label('spacyNER')
 
     # TODO:  Find a way to fix this
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def spacy_ner_rev(self) -> dict:
         return dict()
         # return self._query_ner_label('spacyNER', reverse=True)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def ner_depth(self) -> dict:
         return self._query_ner_depth(reverse=False)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def ner_depth_rev(self) -> dict:
         return self._query_ner_depth(reverse=True)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def infer_by_requires(self) -> dict:
         raise NotImplementedError
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def labels(self, force_lowercase: bool = True) -> dict | None:
         """Find all the Labels keyed by Entity Name
 
@@ -595,7 +753,7 @@ class FindOntologyData(object):
 
         return d
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def labels_rev(self, force_lowercase: bool = True) -> dict | None:
         """Find all the Entity Names keyed by Label
 
@@ -637,11 +795,11 @@ class FindOntologyData(object):
             if results and len(results):
                 return results[0]
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def ner_taxonomy(self) -> dict:
         return self._query_ner_taxo(reverse=False)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def ner_taxonomy_rev(self) -> dict:
         return self._query_ner_taxo(reverse=True)
 
@@ -665,7 +823,7 @@ class FindOntologyData(object):
                                                          unique equivalent entities,
                                                          or a dictionary of equivalents.
         """
-        d_equivalents = self._find_equivalents(entities)
+        d_equivalents = self._find_equivalents.process(entities)
 
         if not flat_list:
             return d_equivalents
@@ -682,6 +840,20 @@ class FindOntologyData(object):
 
         return master
 
+    def equivalence_classes(self,
+                            entities: list[str]) -> dict[str, str | None]:
+        """ Resolve the Equivalence Class of many Entities at once
+
+        Entities with the same class ID are equivalent, directly or through a chain of equivalences.
+
+        Args:
+            entities (list[str]): entity names; underscores and spaces are interchangeable
+
+        Returns:
+            dict[str, str | None]: class ID keyed by normalized entity name; None for an entity without equivalents
+        """
+        return self._find_equivalents.classes(entities)
+
     def has_spans(self) -> bool:
         """ Check if the underlying Ontologies has spans
 
@@ -690,7 +862,7 @@ class FindOntologyData(object):
         """
         return self.spans() and len(self.spans())
 
-    @lru_cache(maxsize=1024)
+    @_lazy_view
     def spans(self) -> dict:
         results = []
         for ontology_name in self._d_ontologies:
@@ -703,7 +875,7 @@ class FindOntologyData(object):
 
         return self._merge(results, QueryResultType.DICT_OF_STR2DICT)
 
-    @lru_cache(maxsize=1024)
+    @_lazy_view
     def span_keys(self) -> list | None:
         """ Return Span Keys sorted by Length
 
@@ -714,6 +886,7 @@ class FindOntologyData(object):
         if spans and len(spans):
             return sorted(self.spans().keys(), key=len)
 
+    @_lazy_view
     def synonyms(self) -> dict:
         """ Return Synonyms keyed by Entity Name
 
@@ -722,6 +895,7 @@ class FindOntologyData(object):
         """
         return self._load_synonyms.synonyms()
 
+    @_lazy_view
     def synonyms_rev(self) -> dict:
         """ Return Entities keyed by Synonyms
 
@@ -730,7 +904,7 @@ class FindOntologyData(object):
         """
         return self._load_synonyms.synonyms_rev()
 
-    @lru_cache(maxsize=1024)
+    @_lazy_view
     def trie(self) -> dict:
         results = []
         for ontology_name in self._d_ontologies:
@@ -742,23 +916,23 @@ class FindOntologyData(object):
             return results[0]
         return self._merge(results, QueryResultType.DICT_OF_STR2LIST)
 
-    @lru_cache(maxsize=1024)
+    @_lazy_view
     def types(self) -> dict:
         return self._by_predicate('rdfs:subClassOf')
 
-    @lru_cache(maxsize=1024)
+    @_lazy_view
     def types_rev(self) -> dict:
         return self._by_predicate_rev('rdfs:subClassOf')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def uses(self) -> dict:
         return self._by_predicate('uses')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def uses_rev(self) -> dict:
         return self._by_predicate_rev('uses')
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def has_parent(self,
                    input_text: str,
                    parent: str) -> bool:
@@ -775,7 +949,7 @@ class FindOntologyData(object):
             parent=parent,
             input_text=input_text)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def has_ancestor(self,
                      input_text: str,
                      parent: str) -> bool:
@@ -792,7 +966,7 @@ class FindOntologyData(object):
             parent=parent,
             input_text=input_text)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def entity_exists(self,
                       input_text: str) -> bool:
         """ Simple Truth check
@@ -806,7 +980,7 @@ class FindOntologyData(object):
         """
         return self._find_types.exists(input_text)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def children(self,
                  input_text: str) -> list[str]:
         """ Return the Children for an Entity
@@ -823,7 +997,7 @@ class FindOntologyData(object):
         self._type_check(input_text)
         return self._sort_list(self._find_types.children(input_text))
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def children_and_self(self,
                           input_text: str) -> list[str]:
         """ Return the Children for an Entity,
@@ -850,7 +1024,7 @@ class FindOntologyData(object):
         results.append(input_text)
         return self._sort_list(results)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def descendants(self,
                     input_text: str) -> list:
         """ Return the Descendants for an Entity
@@ -867,7 +1041,7 @@ class FindOntologyData(object):
         self._type_check(input_text)
         return self._find_types.descendants(input_text)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def descendants_and_self(self,
                              input_text: str) -> list:
         """ Return the Descendants for an Entity,
@@ -894,7 +1068,7 @@ class FindOntologyData(object):
         results.append(input_text)
         return self._sort_list(results)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def parents(self,
                 input_text: str) -> list:
         """ Return the Parents for an Entity
@@ -911,7 +1085,7 @@ class FindOntologyData(object):
         self._type_check(input_text)
         return self._find_types.parents(input_text)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def parents_and_self(self,
                          input_text: str) -> list:
         """ Return the Parents for an Entity,
@@ -938,7 +1112,7 @@ class FindOntologyData(object):
         results.append(input_text)
         return self._sort_list(results)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def ancestors(self,
                   input_text: str) -> list:
         """ Return the Ancestors for an Entity
@@ -955,7 +1129,7 @@ class FindOntologyData(object):
         self._type_check(input_text)
         return self._sort_list(self._find_types.ancestors(input_text))
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def ancestors_and_self(self,
                            input_text: str) -> list:
         """ Return the Ancestors for an Entity,
@@ -982,7 +1156,7 @@ class FindOntologyData(object):
         results.append(input_text)
         return self._sort_list(results)
 
-    @lru_cache(maxsize=1024)
+    @_lazy_view
     def lookup(self) -> dict | None:
         """ Generate n-Gram Spans suitable for Synonym Matching
 
@@ -5,9 +5,10 @@
 
 from collections import defaultdict
 
-from mutato.core import configure_logging
+from mutato.core import configure_logging, ResultCache
 from mutato.finder.singlequery.bp import AskJsonAPI
 from mutato.finder.multiquery.dmo import OwlFindCanon
+from mutato.finder.multiquery.svc import FindEquivalents
 
 class FindOntologyJSON(object):
     """ Generic Facade to Find Data in a single Ontology JSON file """
@@ -21,15 +22,39 @@ class FindOntologyJSON(object):
             26-May-2024
             craigtrim@gmail.com
             *   https://github.com/Maryville-University-DLX/transcriptiq/issues/21
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   answer 'equivalents' from the snapshot's equivalence classes
         """
         self.logger = configure_logging(__name__)
         self.d_owl = d_owl
         self.ontology_name = ontology_name
         self._ask_json_api = AskJsonAPI(d_owl)
+        self._fingerprint = None
+        self._equivalents = None
 
     def ontologies(self) -> list[str]:
         return [self.ontology_name]
 
+    def fingerprint(self) -> str:
+        """ Compute a Content Fingerprint for the underlying Ontology
+
+        The fingerprint is computed once and changes whenever the ontology content changes.
+
+        Returns:
+            str: a hex digest of the ontology content
+        """
+        if not self._fingerprint:
+            self._fingerprint = ResultCache.fingerprint(self.d_owl)
+        return self._fingerprint
+
+    @property
+    def _find_equivalents(self) -> FindEquivalents:
+        if not self._equivalents:
+            self._equivalents = FindEquivalents([self._ask_json_api])
+        return self._equivalents
+
     @staticmethod
     def _to_entity_name(input_text: str) -> str:
         input_text = input_text.lower().strip()
@@ -462,7 +487,7 @@ class FindOntologyJSON(object):
                                                          unique equivalent entities,
                                                          or a dictionary of equivalents.
         """
-        d_equivalents = self._find_equivalents(entities)
+        d_equivalents = self._find_equivalents.process(entities)
 
         if not flat_list:
             return d_equivalents
@@ -479,6 +504,20 @@ class FindOntologyJSON(object):
 
         return master
 
+    def equivalence_classes(self,
+                            entities: list[str]) -> dict[str, str | None]:
+        """ Resolve the Equivalence Class of many Entities at once
+
+        Entities with the same class ID are equivalent, directly or through a chain of equivalences.
+
+        Args:
+            entities (list[str]): entity names; underscores and spaces are interchangeable
+
+        Returns:
+            dict[str, str | None]: class ID keyed by normalized entity name; None for an entity without equivalents
+        """
+        return self._find_equivalents.classes(entities)
+
     def has_spans(self) -> bool:
         """ Check if the underlying Ontologies has spans
 
@@ -3,8 +3,6 @@
 """ Merge Multiple Model results into a single and cohesive structure """
 
 
-from collections import defaultdict
-
 from mutato.core import configure_logging
 from mutato.finder.singlequery.dto import QueryResultType
 
@@ -23,50 +21,87 @@ class ModelResultMerge(object):
             craigtrim@gmail.com
             *   sort the merged output
                 https://github.com/craigtrim/owl-finder/issues/3
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   set-based merge in one pass; deduplicate dict values instead of failing on them
         """
         self.logger = configure_logging(__name__)
 
-    def _merge(self,
-               results: list,
-               result_type: QueryResultType) -> dict:
-
-        results = [x for x in results if x is not None and len(x)]
-
-        if result_type == QueryResultType.DICT_OF_STR2LIST:
-            d_merge = defaultdict(list)
-            for d_result in results:
-                for k in d_result:
-                    if k not in d_merge:
-                        d_merge[k] = []
-
-                    for value in d_result[k]:
-                        if value not in d_merge[k]:
-                            d_merge[k].append(value)
+    @staticmethod
+    def _freeze(value: object) -> object:
+        """ A hashable stand-in for a (nested) dict or list value """
+        if isinstance(value, dict):
+            return tuple(sorted((k, ModelResultMerge._freeze(v)) for k, v in value.items()))
+        if isinstance(value, list):
+            return tuple(ModelResultMerge._freeze(v) for v in value)
+        return value
+
+    def _merge_lists(self,
+                     results: list) -> dict:
+        """ Union each Key's Values across all Results, then sort once """
+        d_merge = {}
+        for d_result in results:
+            for k, values in d_result.items():
+                merged = d_merge.get(k)
+                if merged is None:
+                    d_merge[k] = set(values)
+                else:
+                    merged.update(values)
+
+        return {k: sorted(d_merge[k]) for k in d_merge}
+
+    def _merge_dicts(self,
+                     results: list) -> dict:
+        """ Union each Key's Dicts across all Results, in the order first found
+
+        Dicts have no natural sort order; span candidates found earlier win ties
+        during span matching, so input order is kept.
+        """
+        d_merge = {}
+        d_seen = {}
+        for d_result in results:
+            for k, values in d_result.items():
+                merged = d_merge.get(k)
+                if merged is None:
+                    merged = d_merge[k] = []
+                    d_seen[k] = set()
+
+                seen = d_seen[k]
+                for value in values:
+                    frozen = self._freeze(value)
+                    if frozen not in seen:
+                        seen.add(frozen)
+                        merged.append(value)
+
+        return d_merge
 
-            return dict(d_merge)
+    def process(self,
+                results: list,
+                result_type: QueryResultType) -> dict:
+        """ Merge the Results of 1..* Models in one Pass
 
-        elif result_type == QueryResultType.DICT_OF_STR2DICT:
-            d_merge = defaultdict(list)
-            for d_result in results:
-                for k in d_result:
-                    for value in d_result[k]:
-                        d_merge[k].append(value)
+        Keys keep the order they are first found in.
 
-            return dict(d_merge)
+        Args:
+            results (list): one result per model; None and empty results are skipped
+            result_type (QueryResultType): DICT_OF_STR2LIST or DICT_OF_STR2DICT
 
-        else:
-            raise NotImplementedError
+        Raises:
+            NotImplementedError: any other result type
 
-    def process(self,
-                results: list,
-                result_type: QueryResultType) -> list:
+        Returns:
+            dict: DICT_OF_STR2LIST values are sorted and deduplicated;
+                DICT_OF_STR2DICT values are deduplicated in input order
+        """
+        results = [x for x in results if x is not None and len(x)]
 
-        d_model = self._merge(
-            results=results,
-            result_type=result_type)
+        if result_type == QueryResultType.DICT_OF_STR2LIST:
+            # Sort by Alpha
+            # Reference https://github.com/craigtrim/owl-finder/issues/3
+            return self._merge_lists(results)
 
-        # Sort by Alpha
-        # Reference https://github.com/craigtrim/owl-finder/issues/3
-        d_sorted = {k: sorted(set(d_model[k]), reverse=False) for k in d_model}
+        elif result_type == QueryResultType.DICT_OF_STR2DICT:
+            return self._merge_dicts(results)
 
-        return d_sorted
+        raise NotImplementedError
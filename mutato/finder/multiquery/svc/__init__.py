@@ -6,3 +6,4 @@ from .find_equivalents import FindEquivalents
 from .query_ner_depth import QueryNerDepth
 from .query_ner_label import QueryNerLabel
 from .query_ner_taxo import QueryNerTaxo
+from .load_ontologies_parallel import LoadOntologiesParallel
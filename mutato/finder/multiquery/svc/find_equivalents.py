@@ -6,6 +6,7 @@ from collections import defaultdict
 
 from mutato.core import configure_logging
 from mutato.finder.singlequery import AskOwlAPI
+from mutato.finder.singlequery.dmo import EquivalenceClasses
 
 class FindEquivalents(object):
 
@@ -17,9 +18,71 @@ class FindEquivalents(object):
             16-Aug-2023
             craig@bast.ai
             *   https://bast-ai.atlassian.net/browse/COR-139
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   build equivalence classes once, across all ontologies, with union-find;
+                lookups are class probes and equivalence chains are closed transitively
+
+        Args:
+            owlapis (list[AskOwlAPI]): the ontologies; any API with 'equivalence_classes' (e.g. AskJsonAPI)
         """
         self.logger = configure_logging(__name__)
-        self._owlapis = owlapis
+
+        classes = EquivalenceClasses()
+        for owlapi in owlapis:
+            classes.add_class_ids(owlapi.equivalence_classes())
+
+        # class ID keyed by entity
+        self._d_class_ids = classes.class_ids()
+
+        # class IDs and members keyed by normalized entity name
+        self._d_normalized = {
+            self._normalize(entity): class_id
+            for entity, class_id in self._d_class_ids.items()
+        }
+
+        self._d_members = defaultdict(list)
+        for entity, class_id in self._d_class_ids.items():
+            self._d_members[class_id].append(entity)
+
+    @staticmethod
+    def _normalize(entity: str) -> str:
+        return entity.replace('_', ' ').lower().strip()
+
+    @staticmethod
+    def _entities(entities: list[str] | str) -> list[str]:
+        if isinstance(entities, str):
+            return [entities]
+        elif not isinstance(entities, list):
+            raise ValueError(f"Unexpected Type: {type(entities)}")
+        return entities
+
+    def class_ids(self) -> dict[str, str]:
+        """ Return the Class ID of every Entity with Equivalents
+
+        Returns:
+            dict[str, str]: class ID (the least member) keyed by entity
+        """
+        return self._d_class_ids
+
+    def classes(self,
+                entities: list[str]) -> dict[str, str | None]:
+        """ Resolve the Class ID of many Entities at once
+
+        Entities with the same class ID are equivalent.
+
+        Args:
+            entities (list[str]): entity names, normalized as in 'process'
+
+        Returns:
+            dict[str, str | None]: class ID keyed by normalized entity name; None for an entity without equivalents
+        """
+        d_normalized = self._d_normalized
+        return {
+            entity: d_normalized.get(entity)
+            for entity in map(self._normalize, self._entities(entities))
+        }
 
     def process(self,
                 entities: list[str]) -> dict[str, list[str]]:
@@ -30,45 +93,27 @@ class FindEquivalents(object):
             entities (list[str]): A list of entity names.
 
         Returns:
-            Dict[str, list[str]]: 
+            Dict[str, list[str]]:
                 A dictionary where:
                     - Each key is a cleaned-up entity name from the input list, and
-                    - The associated value is a list of equivalent entity names for the key entity.
+                    - The associated value is the sorted list of entity names equivalent to the key entity,
+                      directly or through a chain of equivalences.
 
         Notes:
-            - The method normalizes the input entity names by replacing spaces with underscores, 
+            - The method normalizes the input entity names by replacing underscores with spaces,
               converting to lowercase, and stripping leading/trailing whitespace.
-            - The method aggregates data from multiple OWL API instances, which are accessed through self._owlapis.
+            - The classes span every ontology; an entity is never its own equivalent.
         """
-
-        if isinstance(entities, str):
-            entities = [entities]
-        elif not isinstance(entities, list):
-            raise ValueError(f"Unexpected Type: {type(entities)}")
-
-        # Normalize entity names
-        entities = [
-            x.replace('_', ' ').lower().strip()
-            for x in entities
-        ]
-
-        # print (entities)
-
-        # Initialize the master dictionary with default sets
-        d_master = defaultdict(set)
-
-        # Fetch and aggregate equivalent entities from all OWL API instances
-        for owlapi in self._owlapis:
-
-            d_equivalents = owlapi.equivalents()
-            if not d_equivalents or not len(d_equivalents):
+        d_master = {}
+        for entity, class_id in self.classes(entities).items():
+            if class_id is None:
                 continue
 
-            for entity in [
-                x for x in entities
-                if x in d_equivalents
-            ]:
-                d_master[entity].update(d_equivalents[entity])
+            equivalents = [
+                x for x in self._d_members[class_id]
+                if self._normalize(x) != entity
+            ]
+            if equivalents:
+                d_master[entity] = equivalents
 
-        # Convert sets to lists
-        return {k: list(v) for k, v in d_master.items()}
+        return d_master
@@ -49,6 +49,10 @@ class FindNER(object):
             craigtrim@gmail.com
             *   migrated to 'owlblock' in pursuit of
                 https://github.com/grafflr/deepnlu/issues/13
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve every known entity once into a table ('table', 'probe')
 
         Args:
             ontologies (list): one-or-more Ontology models to use in processing
@@ -132,3 +136,33 @@ class FindNER(object):
 
         d_depth = {self._depth(x): x for x in ners}
         return d_depth[max(d_depth)]
+
+    def table(self) -> dict[str, str]:
+        """ Resolve the NER of every Entity that has one, once
+
+        Depth-based tie-breaking is applied here, so a lookup is a single dict probe.
+
+        Returns:
+            dict[str, str]: NER keyed by cleansed entity; entities not in the table resolve to 'NER'
+        """
+        entities = set(self._d_graffl_ner or {}) | set(self._d_spacy_ner or {})
+
+        # 'find_ner' cleanses its input, so a key with an underscore can never match
+        return {
+            entity: self.find_ner(entity)
+            for entity in entities if '_' not in entity
+        }
+
+    @staticmethod
+    def probe(d_table: dict[str, str],
+              input_text: str) -> str:
+        """ Look up an Entity in a Table built by 'table'
+
+        Args:
+            d_table (dict[str, str]): the resolved NER table
+            input_text (str): any input entity
+
+        Returns:
+            str: NER; the same answer 'find_ner' gives
+        """
+        return d_table.get(FindNER._cleanse(input_text), 'NER')
@@ -0,0 +1,122 @@
+# !/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Load 1..* Ontology Models and build their Views in a Process Pool """
+
+
+from concurrent.futures import ProcessPoolExecutor
+
+from mutato.finder.singlequery import AskOwlAPI
+from mutato.finder.multiquery.svc.query_ner_depth import QueryNerDepth
+from mutato.finder.multiquery.svc.query_ner_taxo import QueryNerTaxo
+from mutato.core import configure_logging, Stopwatch, isEnabledForDebug
+
+
+def _load_views(ontology_name: str,
+                absolute_path: str,
+                namespace: str,
+                views: list[tuple[str, dict]]) -> tuple[str, list[tuple[str, dict, object]]]:
+    """ Worker: parse one Ontology and build its Views
+
+    Only plain view results go back; the graph is never pickled across processes.
+
+    Returns:
+        tuple[str, list]: the OWL file path, and (view name, arguments, result) per view
+    """
+    ask_owl_api = AskOwlAPI(
+        ontology_name=ontology_name,
+        absolute_path=absolute_path,
+        namespace=namespace)
+
+    results = [
+        (name, kwargs, getattr(ask_owl_api, name)(**kwargs))
+        for name, kwargs in views
+    ]
+
+    return ask_owl_api.input_path, results
+
+
+class LoadOntologiesParallel(object):
+    """ Load 1..* Ontology Models and build their Views in a Process Pool
+
+    Each worker parses one ontology and builds the per-ontology views that
+    'FindOntologyData' merges.  Only the view results come back, as plain
+    Python objects; they are seeded into the local 'AskOwlAPI' with
+    'AskOwlAPI.preload'.  The local 'AskOwlAPI' loads its graph only when a
+    call misses the preloaded views.
+    """
+
+    VIEWS: list[tuple[str, dict]] = [
+        ('synonyms', {}),
+        ('synonyms_rev', {}),
+        ('spans', {}),
+        ('trie', {}),
+        ('by_predicate', {'predicate': 'rdfs:subClassOf', 'to_lowercase': True}),
+        ('by_predicate', {'predicate': 'rdfs:subClassOf', 'to_lowercase': True, 'reverse': True}),
+        ('by_predicate', {'predicate': 'rdfs:label', 'to_lowercase': False}),
+        QueryNerDepth.view(),
+        QueryNerTaxo.view(),
+    ]
+
+    def __init__(self,
+                 max_workers: int):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   load ontologies and build their views in parallel
+
+        Args:
+            max_workers (int): the maximum number of worker processes
+
+        Raises:
+            ValueError: max_workers is not a positive integer
+        """
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValueError(f"Invalid Max Workers: {max_workers}")
+
+        self.logger = configure_logging(__name__)
+        self._max_workers = max_workers
+
+    def process(self,
+                ontologies: list[str],
+                absolute_path: str,
+                namespace: str) -> dict[str, AskOwlAPI]:
+        """ Load each Ontology in a Worker Process
+
+        Args:
+            ontologies (list[str]): the ontology names
+            absolute_path (str): the absolute path where the ontologies are located
+            namespace (str): the RDF namespace URI
+
+        Returns:
+            dict[str, AskOwlAPI]: an AskOwlAPI per ontology name, in input order, with its views preloaded
+        """
+        sw = Stopwatch()
+
+        max_workers = min(self._max_workers, len(ontologies))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                ontology_name: executor.submit(
+                    _load_views, ontology_name, absolute_path, namespace, self.VIEWS)
+                for ontology_name in ontologies
+            }
+
+            d_ontologies = {}
+            for ontology_name in ontologies:
+                input_path, views = futures[ontology_name].result()
+
+                ask_owl_api = AskOwlAPI(
+                    ontology_name=ontology_name,
+                    absolute_path=absolute_path,
+                    namespace=namespace,
+                    input_path=input_path)
+                ask_owl_api.preload(views)
+
+                d_ontologies[ontology_name] = ask_owl_api
+
+        if isEnabledForDebug(self.logger):
+            self.logger.debug(
+                f"Loaded Ontologies (total: {len(ontologies)}), (workers: {max_workers}) in {str(sw)}")
+
+        return d_ontologies
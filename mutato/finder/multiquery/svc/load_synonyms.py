@@ -4,11 +4,10 @@
 
 
 import os
-from functools import lru_cache
 from collections import defaultdict
 
 from mutato.finder.singlequery import AskOwlAPI
-from mutato.core import configure_logging, FileIO
+from mutato.core import configure_logging, FileIO, instance_cache
 from mutato.finder.singlequery.dto import QueryResultType
 from mutato.finder.multiquery.dmo import ExternalSynonymLoader
 
@@ -81,7 +80,7 @@ class LoadSynonyms(object):
 
         return d_external_fwd, d_external_rev
 
-    @lru_cache
+    @instance_cache()
     def synonyms(self) -> dict:
         results = []
         for ontology_name in self._d_ontologies:
@@ -99,7 +98,7 @@ class LoadSynonyms(object):
 
         return self._merge(results, QueryResultType.DICT_OF_STR2LIST)
 
-    @lru_cache
+    @instance_cache()
     def synonyms_rev(self) -> dict:
         results = []
         for ontology_name in self._d_ontologies:
@@ -49,17 +49,28 @@ class QueryNerDepth(object):
         self._d_ontologies = d_ontologies
         self._generate_view = ViewGeneratorNerDepth().process
 
-    def _get_results(self,
-                     sparql_query: str) -> list:
+    @classmethod
+    def view(cls) -> tuple[str, dict]:
+        """ The per-Ontology AskOwlAPI Call behind this Query
+
+        Returns:
+            tuple[str, dict]: the view method name and its arguments
+        """
+        return 'adhoc', {
+            'to_lowercase': False,
+            'sparql_query': cls.__SPARQL_QUERY,
+            'result_type': QueryResultType.DICT_OF_STR2LIST,
+        }
+
+    def _get_results(self) -> list:
+        name, kwargs = self.view()
+
         results = []
         for ontology_name in self._d_ontologies:
 
             ask_owl_api = self._d_ontologies[ontology_name]
 
-            results.append(ask_owl_api.adhoc(
-                to_lowercase=False,
-                sparql_query=sparql_query,
-                result_type=QueryResultType.DICT_OF_STR2LIST))
+            results.append(getattr(ask_owl_api, name)(**kwargs))
 
         if not results:
             return None
@@ -72,8 +83,7 @@ class QueryNerDepth(object):
     def process(self,
                 reverse: bool = False) -> dict | None:
 
-        d_results = self._get_results(
-            sparql_query=self.__SPARQL_QUERY)
+        d_results = self._get_results()
         if not d_results or not len(d_results):
             return None
 
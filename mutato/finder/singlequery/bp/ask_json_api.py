@@ -4,6 +4,7 @@
 
 
 from mutato.core import configure_logging
+from mutato.finder.singlequery.dmo import EquivalenceClasses
 
 class AskJsonAPI(object):
     """ Identical to AskOwlAPI but query local JSON representation of OWL instead """
@@ -130,6 +131,12 @@ class AskJsonAPI(object):
     def equivalents(self) -> dict[str, list[str]]:
         return self.d_owl.get("equivalents", {})
 
+    def equivalence_classes(self) -> dict[str, str] | None:
+        """ Class ID keyed by entity; closed from the equivalents for snapshots that predate the table """
+        if "equivalence_classes" in self.d_owl:
+            return self.d_owl["equivalence_classes"]
+        return EquivalenceClasses.of(self.equivalents())
+
     def find_ner(self, input_text: str) -> str | None:
         return self.d_owl.get("ner", {}).get(input_text)
 
@@ -3,9 +3,11 @@
 """ API for the ask-owl Microservice """
 
 
-from functools import lru_cache
+import re
 from collections import defaultdict
 
+from rdflib import Graph, URIRef
+
 from mutato.finder.singlequery.svc import (
     LoadOntologyModel,
     QueryOntologyModel,
@@ -14,8 +16,12 @@ from mutato.finder.singlequery.svc import (
     GeneratePlusSpans,
     GenerateViewSynonyms
 )
+from mutato.finder.singlequery.dmo import EquivalenceClasses, OwlGraphRegistry
 from mutato.finder.singlequery.dto import QueryResultType
-from mutato.core import configure_logging, Enforcer, isEnabledForDebug
+from mutato.core import configure_logging, Enforcer, CacheInfo, InstanceCache, instance_cache, isEnabledForDebug
+
+# a local name that a ':name' prefixed name resolves verbatim
+_LOCAL_NAME = re.compile(r'^[A-Za-z0-9_][A-Za-z0-9_\-]*$')
 
 
 class AskOwlAPI(object):
@@ -24,13 +30,16 @@ class AskOwlAPI(object):
     def __init__(self,
                  ontology_name: str,
                  absolute_path: str,
-                 namespace: str = None):
+                 namespace: str = None,
+                 input_path: str = None):
         """ Load and initialize the OWL ontology for SPARQL querying.
 
         Args:
             ontology_name (str): the name of the ontology file (without .owl extension)
             absolute_path (str): absolute path to the directory containing the OWL file
             namespace (str, optional): the RDF namespace URI. Defaults to None.
+            input_path (str, optional): the OWL file, already resolved (e.g. by a worker process). Defaults to None.
+                When given, the graph is loaded on the first query rather than here.
         """
         self.logger = configure_logging(__name__)
         self.absolute_path = absolute_path
@@ -43,10 +52,62 @@ class AskOwlAPI(object):
         self.prefix = loader.prefix
         self.ontology_name = loader.ontology_name
 
-        graph = loader.process()
+        if input_path:
+            self._graph = None
+            self.input_path = input_path
+        else:
+            self._graph = loader.process()
+            self.input_path = loader.input_path
+
+        self._query_model = None
+
+    @property
+    def graph(self) -> Graph:
+        """ The Ontology Graph, loaded on first use if it was not loaded on init """
+        if self._graph is None:
+            self._graph = OwlGraphRegistry.graph(self.input_path)
+        return self._graph
+
+    @property
+    def _execute_query(self) -> callable:
+        if self._query_model is None:
+            self._query_model = QueryOntologyModel(self.graph)
+        return self._query_model.process
+
+    def preload(self,
+                views: list[tuple[str, dict, object]]) -> None:
+        """ Seed View Results computed elsewhere, e.g. by a worker process
+
+        Each result is put in the view's per-instance cache, so a later call with the same
+        arguments (positional or by name) returns it; any other call runs the query as usual.
+
+        Args:
+            views (list[tuple[str, dict, object]]): (view method name, arguments by name, result)
+
+        Raises:
+            ValueError: the view is not a cached method
+        """
+        for name, kwargs, result in views:
+            method = getattr(type(self), name)
+            if not hasattr(method, 'cache_key'):
+                raise ValueError(f"Uncached View: {name}")
+
+            cache = InstanceCache.of(self, method.cache_name, method.maxsize)
+            cache.put(method.cache_key((), kwargs), result)
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """ Return View Cache Statistics
 
-        self._execute_query = QueryOntologyModel(graph).process
+        Returns:
+            dict[str, CacheInfo]: statistics keyed by qualified method name
+        """
+        return InstanceCache.info(self)
 
+    def cache_clear(self) -> None:
+        """ Release every cached and preloaded View Result """
+        InstanceCache.clear(self)
+
+    @instance_cache(maxsize=64)
     def adhoc(self,
               sparql_query: str,
               result_type: QueryResultType,
@@ -54,6 +115,8 @@ class AskOwlAPI(object):
               reverse: bool = False):
         """ Execute an ad-hoc SPARQL query against the loaded ontology graph.
 
+        Results are cached per query; the graph is read-only.
+
         Args:
             sparql_query (str): the SPARQL query string
             result_type (QueryResultType): how to transform the result set
@@ -69,7 +132,7 @@ class AskOwlAPI(object):
             to_lowercase=to_lowercase,
             reverse=reverse)
 
-    @lru_cache(maxsize=6, typed=False)
+    @instance_cache(maxsize=6)
     def ngrams(self,
                gram_level: 1) -> list | None:
         """ Generate n-Grams by Size
@@ -80,20 +143,25 @@ class AskOwlAPI(object):
         Returns:
             list | None: the n-Gram results (if any)
         """
+        results = self._ngram_candidates()
+
+        if not results or not len(results):
+            return None
+
+        return [x for x in results if x.count('_') == gram_level - 1]
+
+    @instance_cache(maxsize=1024)
+    def _ngram_candidates(self) -> list | None:
+        """ Entities to filter by gram level; queried once for every level """
         sparql = 'SELECT ?a WHERE { ?a rdfs:subClassOf ?b }'
 
-        results = self._execute_query(
+        return self._execute_query(
             sparql=sparql,
             to_lowercase=True,
             result_type=QueryResultType.LIST_OF_STRINGS,
         )
 
-        if not results or not len(results):
-            return None
-
-        return [x for x in results if x.count('_') == gram_level - 1]
-
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def trie(self) -> dict | None:
         """ Generate Entities in a Trie View
 
@@ -163,7 +231,7 @@ class AskOwlAPI(object):
     #     return d_results
     # --------------------------------------------------------------------------------------------------------
 
-    @lru_cache(maxsize=1024, typed=False)
+    @instance_cache(maxsize=1024)
     def by_predicate(self,
                      predicate: str,
                      to_lowercase: bool = True,
@@ -207,22 +275,24 @@ class AskOwlAPI(object):
             result_type=QueryResultType.DICT_OF_STR2LIST,
         )
 
+        return self._distinct_values(d_results)
+
+    @staticmethod
+    def _distinct_values(d_results: dict) -> dict:
         # ------------------------------------------------------------------------------
         # Purpose:  Ensure list[str] is de-duplicated and doesn't contain key
         #           Exclude 'class' as it contains everything
         # Issue:    https://github.com/Maryville-University-DLX/transcriptiq/issues/1059
         # Updated:  13-Oct-2025
         # ------------------------------------------------------------------------------
-        d_results = {
+        return {
             k: [x for x in sorted(set(v)) if x != k]
             for k, v in d_results.items()
             if k not in ['class']
         }
         # ------------------------------------------------------------------------------
 
-        return d_results
-
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def keyed_labels(self) -> list:
         """ Retrieve rdfs:label values from the Graph
 
@@ -236,7 +306,7 @@ class AskOwlAPI(object):
             to_lowercase=False,
             result_type=QueryResultType.DICT_OF_STR2STR)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def labels(self) -> list:
         """ Retrieve rdfs:label values from the Graph
 
@@ -249,7 +319,7 @@ class AskOwlAPI(object):
             to_lowercase=False,
             result_type=QueryResultType.LIST_OF_STRINGS)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def entities(self) -> list:
         """ Retrieve entities from the Graph
 
@@ -270,11 +340,33 @@ class AskOwlAPI(object):
             sparql=sparql, to_lowercase=is_lowercase,
             result_type=QueryResultType.LIST_OF_STRINGS)
 
-    @lru_cache(maxsize=1024)
+    def _entity_query(self,
+                      sparql: str,
+                      entity: str) -> tuple[str, dict | None]:
+        """ Bind '?entity' in a Query Template to ':entity'
+
+        A bound template is prepared once and reused for every entity.
+        An entity that is not a plain local name is formatted into the query text instead,
+        so it resolves (or fails) exactly as a ':entity' prefixed name would.
+
+        Args:
+            sparql (str): the query template
+            entity (str): the entity local name
+
+        Returns:
+            tuple[str, dict | None]: the query and its bindings
+        """
+        namespace = dict(self.graph.namespaces()).get('')
+        if namespace is None or not _LOCAL_NAME.match(entity):
+            return sparql.replace('?entity', f':{entity}'), None
+
+        return sparql, {'entity': URIRef(f'{namespace}{entity}')}
+
+    @instance_cache(maxsize=1024)
     def parents(self, entity: str):
-        sparql = """
-            SELECT ?a WHERE  { :#ENTITY rdfs:subClassOf ?a }
-        """.replace('#ENTITY', entity)
+        sparql, bindings = self._entity_query("""
+            SELECT ?a WHERE  { ?entity rdfs:subClassOf ?a }
+        """, entity)
 
         # ----------------------------------------------------------------------------------------------------
         # Purpose:  Do Not LowerCase Entities
@@ -287,13 +379,14 @@ class AskOwlAPI(object):
         return self._execute_query(
             sparql=sparql, to_lowercase=is_lowercase,
             result_type=QueryResultType.LIST_OF_STRINGS,
+            bindings=bindings,
         )
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def ancestors(self, entity: str) -> list[str]:
-        sparql = """
-            SELECT ?a WHERE  { :#ENTITY rdfs:subClassOf+ ?a }
-        """.replace('#ENTITY', entity)
+        sparql, bindings = self._entity_query("""
+            SELECT ?a WHERE  { ?entity rdfs:subClassOf+ ?a }
+        """, entity)
 
         # ----------------------------------------------------------------------------------------------------
         # Purpose:  Do Not LowerCase Entities
@@ -306,6 +399,7 @@ class AskOwlAPI(object):
         results: list[str] = self._execute_query(
             sparql=sparql, to_lowercase=is_lowercase,
             result_type=QueryResultType.LIST_OF_STRINGS,
+            bindings=bindings,
         )
 
         if results:
@@ -313,11 +407,11 @@ class AskOwlAPI(object):
 
         return results
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def children(self, entity: str):
-        sparql = """
-            SELECT ?a WHERE  { ?a rdfs:subClassOf :#ENTITY }
-        """.replace('#ENTITY', entity)
+        sparql, bindings = self._entity_query("""
+            SELECT ?a WHERE  { ?a rdfs:subClassOf ?entity }
+        """, entity)
 
         # ----------------------------------------------------------------------------------------------------
         # Purpose:  Do Not LowerCase Entities
@@ -330,13 +424,14 @@ class AskOwlAPI(object):
         return self._execute_query(
             sparql=sparql, to_lowercase=is_lowercase,
             result_type=QueryResultType.LIST_OF_STRINGS,
+            bindings=bindings,
         )
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def descendants(self, entity: str):
-        sparql = """
-            SELECT ?a WHERE  { ?a rdfs:subClassOf+ :#ENTITY }
-        """.replace('#ENTITY', entity)
+        sparql, bindings = self._entity_query("""
+            SELECT ?a WHERE  { ?a rdfs:subClassOf+ ?entity }
+        """, entity)
 
         # ----------------------------------------------------------------------------------------------------
         # Purpose:  Do Not LowerCase Entities
@@ -349,6 +444,7 @@ class AskOwlAPI(object):
         return self._execute_query(
             sparql=sparql, to_lowercase=is_lowercase,
             result_type=QueryResultType.LIST_OF_STRINGS,
+            bindings=bindings,
         )
 
     # -----------------------------------------------------------------------------
@@ -415,7 +511,7 @@ class AskOwlAPI(object):
     #         result_type=QueryResultType.LIST_OF_STRINGS)
     # --------------------------------------------------------------------------------------------------------
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def types(self,
               to_lowercase: bool = True) -> list:
         """ Retrieve rdf:type values from the Graph
@@ -432,7 +528,7 @@ class AskOwlAPI(object):
             to_lowercase=to_lowercase,
             result_type=QueryResultType.LIST_OF_STRINGS)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def _synonym_query(self) -> dict | None:
         """ Generate n-Gram Spans suitable for Synonym Matching
 
@@ -484,6 +580,10 @@ class AskOwlAPI(object):
         if not d_results or not len(d_results):
             return None
 
+        return self._normalize_synonyms(d_results)
+
+    @staticmethod
+    def _normalize_synonyms(d_results: dict) -> dict:
         d_normalized = defaultdict(list)
         for k in d_results:
             for synonym in d_results[k]:
@@ -493,7 +593,7 @@ class AskOwlAPI(object):
 
         return d_normalized
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def predicates(self) -> dict | None:
         """
         Retrieves the predicates from the OWL API.
@@ -539,7 +639,7 @@ class AskOwlAPI(object):
 
         return d_predicates
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def synonyms(self) -> dict | None:
         """ Generate a Dictionary of Entities keyed to Synonym Lists
 
@@ -556,7 +656,7 @@ class AskOwlAPI(object):
 
         return GenerateViewSynonyms().process(d_results)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def synonyms_rev(self) -> dict:
         """ Reverse Synonym Dictionary:
         Synonyms are keyed to one-or-more Entities
@@ -574,7 +674,7 @@ class AskOwlAPI(object):
 
         return GenerateViewSynonyms().process(d_results, reverse=True)
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def equivalents(self) -> dict[str, list[str]] | None:
         """
         Retrieves equivalent classes from an RDF graph and organizes them into a bidirectional mapping.
@@ -631,6 +731,20 @@ class AskOwlAPI(object):
         if not d_results:
             return None
 
+        return self._bidirectional(d_results)
+
+    @instance_cache(maxsize=1)
+    def equivalence_classes(self) -> dict[str, str] | None:
+        """ Close the Equivalents transitively into Classes
+
+        Returns:
+            dict[str, str] | None: class ID (the least member) keyed by entity; None if there are no equivalents
+        """
+        return EquivalenceClasses.of(self.equivalents())
+
+    @staticmethod
+    def _bidirectional(d_results: dict) -> dict[str, list[str]]:
+
         # ensure bidirectional equivalence
         d_bidir = defaultdict(set)
         for k, values in d_results.items():
@@ -641,7 +755,7 @@ class AskOwlAPI(object):
         # convert sets to lists
         return {k: list(v) for k, v in d_bidir.items()}
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def spans(self) -> dict | None:
         """ Entity Spans for Long-Range Matching
 
@@ -675,6 +789,11 @@ class AskOwlAPI(object):
         if not d_results or not len(d_results):
             return None
 
+        return self._merge_spans(d_results)
+
+    def _merge_spans(self,
+                     d_results: dict) -> dict:
+
         d_merged = defaultdict(list)
 
         def merge(d: dict) -> None:
@@ -1,3 +1,6 @@
 from .owl_query_extract import OwlQueryExtract
+from .owl_graph_cache import OwlGraphCache
+from .owl_graph_registry import OwlGraphRegistry
 from .owl_graph_connector import OwlGraphConnector
 from .owl_query_normalize import OwlQueryNormalize
+from .equivalence_classes import EquivalenceClasses
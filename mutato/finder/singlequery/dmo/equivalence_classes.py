@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Union-Find over Equivalent Entities """
+
+
+class EquivalenceClasses(object):
+    """ Union-Find over Equivalent Entities
+
+    'owl:equivalentClass' edges are direct, so a chain a ≡ b ≡ c leaves a and c unrelated.
+    Union-find closes the chains: every entity in a class gets the same class ID,
+    which is the class's least member name.  This is stable across runs and ontologies.
+
+    Usage:
+        classes = EquivalenceClasses()
+        classes.add({'a': ['b'], 'b': ['a', 'c']})
+        classes.class_ids()     # {'a': 'a', 'b': 'a', 'c': 'a'}
+    """
+
+    def __init__(self):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   close equivalence chains transitively into classes
+        """
+        self._d_parent: dict[str, str] = {}
+
+    def find(self,
+             entity: str) -> str:
+        """ Return the Class ID of an Entity (the entity itself if it is unknown) """
+        self._d_parent.setdefault(entity, entity)
+        while self._d_parent[entity] != entity:
+            # path halving
+            self._d_parent[entity] = self._d_parent[self._d_parent[entity]]
+            entity = self._d_parent[entity]
+        return entity
+
+    def union(self,
+              a: str,
+              b: str) -> None:
+        """ Merge the Classes of two Entities; the lesser root stays the class ID """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return
+
+        if root_b < root_a:
+            root_a, root_b = root_b, root_a
+        self._d_parent[root_b] = root_a
+
+    def add(self,
+            d_edges: dict[str, list[str]] | None) -> None:
+        """ Union every Entity with each of its Equivalents
+
+        Args:
+            d_edges (dict[str, list[str]] | None): equivalents keyed by entity, as 'AskOwlAPI.equivalents' returns
+        """
+        for entity, values in (d_edges or {}).items():
+            self.find(entity)
+            for value in values:
+                self.union(entity, value)
+
+    def add_class_ids(self,
+                      d_class_ids: dict[str, str] | None) -> None:
+        """ Union every Entity with its Class ID from a Table built elsewhere (e.g. an MDA snapshot)
+
+        Args:
+            d_class_ids (dict[str, str] | None): class ID keyed by entity
+        """
+        for entity, class_id in (d_class_ids or {}).items():
+            self.union(entity, class_id)
+
+    def class_ids(self) -> dict[str, str]:
+        """ Return the Class ID of every Entity
+
+        Returns:
+            dict[str, str]: class ID keyed by entity, sorted by entity
+        """
+        return {
+            entity: self.find(entity)
+            for entity in sorted(self._d_parent)
+        }
+
+    @staticmethod
+    def of(d_equivalents: dict[str, list[str]] | None) -> dict[str, str] | None:
+        """ Close one Ontology's Equivalents into Class IDs
+
+        Args:
+            d_equivalents (dict[str, list[str]] | None): equivalents keyed by entity
+
+        Returns:
+            dict[str, str] | None: class ID keyed by entity; None if there are no equivalents
+        """
+        if not d_equivalents:
+            return None
+
+        classes = EquivalenceClasses()
+        classes.add(d_equivalents)
+        return classes.class_ids()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" On-Disk Cache of Parsed OWL Graphs """
+
+
+import os
+import pickle
+import hashlib
+import tempfile
+from contextlib import suppress
+from threading import RLock
+
+import rdflib
+from rdflib import Graph
+from mutato.core import configure_logging, CacheInfo
+
+
+class OwlGraphCache(object):
+    """ On-Disk Cache of Parsed OWL Graphs
+
+    Parsing Turtle dominates the startup of the '--live' path and of MDA generation.
+    The cache stores each parsed graph as a pickled in-memory store, which loads
+    in roughly half the time of a fresh parse.
+
+    Entries are keyed by a hash of the file content, the RDF format and the rdflib version,
+    so an edited ontology (or an upgraded rdflib) never reads a stale entry.
+    The key is prefixed with a hash of the resolved path and format, and only the latest
+    entry per prefix is kept: saving an edited file's graph deletes the entry it supersedes.
+    An unreadable entry is discarded and the file is parsed again.
+
+    Entries are unpickled: only point the cache at a directory you trust.
+
+    Usage:
+        cache = OwlGraphCache('/home/user/.cache/mutato/graphs')
+        key = cache.key('/path/to/owls/econ.owl', 'ttl')
+        graph = cache.load(key)
+    """
+
+    _EXTENSION = 'pickle'
+
+    def __init__(self,
+                 cache_dir: str):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   reload parsed OWL graphs from disk instead of re-parsing Turtle
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   keep only the latest entry per OWL file
+
+        Args:
+            cache_dir (str): the directory holding the cached graphs; created if missing
+        """
+        self.logger = configure_logging(__name__)
+
+        self._cache_dir = os.path.realpath(cache_dir)
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def key(self,
+            input_path: str,
+            format: str) -> str:
+        """ Build the Cache Key for an OWL File
+
+        Args:
+            input_path (str): the path to the OWL file
+            format (str): the RDF format
+
+        Returns:
+            str: a hash of the resolved path and format, then a hash of the file content, format and rdflib version
+        """
+        prefix = hashlib.sha256(
+            f'{os.path.realpath(input_path)}|{format}'.encode('utf-8')).hexdigest()[:16]
+
+        h = hashlib.sha256()
+        with open(input_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+
+        h.update(f'|{format}|{rdflib.__version__}'.encode('utf-8'))
+        return f'{prefix}-{h.hexdigest()}'
+
+    def _path(self,
+              key: str) -> str:
+        return os.path.join(self._cache_dir, f'{key}.{self._EXTENSION}')
+
+    def load(self,
+             key: str) -> Graph | None:
+        """ Load a Cached Graph
+
+        Args:
+            key (str): the cache key
+
+        Returns:
+            Graph | None: the cached graph, if any
+        """
+        path = self._path(key)
+
+        with self._lock:
+            if not os.path.exists(path):
+                self._misses += 1
+                return None
+
+            try:
+                with open(path, 'rb') as f:
+                    graph = pickle.load(f)
+                if not isinstance(graph, Graph):
+                    raise TypeError(type(graph).__name__)
+
+            except Exception as e:
+                self.logger.warning(
+                    f"Discarding Unreadable Graph Cache Entry (path: {path}), (error: {e})")
+                # another process may have discarded it first
+                with suppress(FileNotFoundError):
+                    os.remove(path)
+                self._evictions += 1
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            return graph
+
+    def save(self,
+             key: str,
+             graph: Graph) -> None:
+        """ Write a Graph to the Cache
+
+        The entry is written to a temporary file and renamed into place,
+        so a concurrent reader never sees a partial entry.
+        Older entries for the same file (same key prefix) are then deleted.
+
+        Args:
+            key (str): the cache key
+            graph (Graph): the parsed graph
+        """
+        fd, temp_path = tempfile.mkstemp(
+            dir=self._cache_dir, suffix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        prefix = key.split('-', 1)[0]
+        superseded = [
+            name for name in os.listdir(self._cache_dir)
+            if name.startswith(f'{prefix}-')
+            and name.endswith(f'.{self._EXTENSION}')
+            and name != os.path.basename(self._path(key))
+        ]
+
+        with self._lock:
+            for name in superseded:
+                with suppress(FileNotFoundError):
+                    os.remove(os.path.join(self._cache_dir, name))
+                self._evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        """ Return Cache Statistics
+
+        Returns:
+            CacheInfo: hits, misses, evictions (unreadable or superseded entries), maxsize (None) and currsize (entries on disk)
+        """
+        with self._lock:
+            currsize = len([
+                name for name in os.listdir(self._cache_dir)
+                if name.endswith(f'.{self._EXTENSION}')
+            ])
+
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=None,
+                currsize=currsize)
+
+    def clear(self) -> None:
+        """ Remove every Cached Graph and reset statistics """
+        with self._lock:
+            for name in os.listdir(self._cache_dir):
+                if name.endswith(f'.{self._EXTENSION}'):
+                    os.remove(os.path.join(self._cache_dir, name))
+
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
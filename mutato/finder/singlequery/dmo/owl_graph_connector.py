@@ -7,6 +7,7 @@ import os
 
 from rdflib import Graph
 from mutato.core import configure_logging, FileIO, isEnabledForDebug
+from mutato.finder.singlequery.dmo.owl_graph_registry import OwlGraphRegistry
 
 class OwlGraphConnector(object):
     """ Connect to an RDF Graph (Ontology) """
@@ -27,6 +28,10 @@ class OwlGraphConnector(object):
             craigtrim@gmail.com
             *   refactor into 'ask-owl' repo
                 https://github.com/craigtrim/askowl/issues/1
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   parse each OWL file once per process via 'OwlGraphRegistry'
 
         Args:
             prefix (str): the query prefix
@@ -90,8 +95,8 @@ class OwlGraphConnector(object):
 
         Returns:
             Graph: an instantiated and in-memory RDF Graph
+                shared with every other loader of the same file; treat it as read-only
         """
-        g = Graph()
 
         input_path = os.path.normpath(
             os.path.join(
@@ -102,9 +107,10 @@ class OwlGraphConnector(object):
             input_path = self._get_versioned_model()
 
         FileIO.exists_or_error(input_path)
+        self._input_path = input_path
 
-        g.parse(input_path,
-                format=self._format)
+        g = OwlGraphRegistry.graph(input_path,
+                                   format=self._format)
 
         # TODO: Fix this in the future
         # g.bind(self._prefix,
@@ -114,3 +120,6 @@ class OwlGraphConnector(object):
 
     def graph(self) -> Graph:
         return self._graph
+
+    def input_path(self) -> str:
+        return self._input_path
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Process-Level Registry of Parsed OWL Graphs """
+
+
+import os
+from threading import RLock
+from weakref import WeakValueDictionary
+
+from rdflib import Graph
+from mutato.core import configure_logging, Stopwatch, CacheInfo, EnvIO, isEnabledForDebug
+from mutato.finder.singlequery.dmo.owl_graph_cache import OwlGraphCache
+
+
+class OwlGraphRegistry(object):
+    """ Process-Level Registry of Parsed OWL Graphs
+
+    Schema detection, MDA generation and the finders each load the same OWL file.
+    The registry parses each file once per process and hands every caller the same graph.
+
+    Entries are keyed by the resolved path and format, and are re-parsed when the
+    file's modification time or size changes.
+
+    Graphs are held weakly: a graph is freed once no connector, finder or detector
+    uses it, and a later call loads it again.
+
+    Graphs are shared: callers must treat them as read-only.
+
+    A file missing from the registry is read from the optional on-disk 'OwlGraphCache'
+    before it is parsed.  Enable the cache with 'set_cache_dir' or the
+    'OWL_GRAPH_CACHE' environment variable.
+
+    Usage:
+        graph = OwlGraphRegistry.graph('/path/to/owls/econ.owl')
+    """
+
+    _lock = RLock()
+    _d_graphs: WeakValueDictionary[tuple[str, str], Graph] = WeakValueDictionary()
+    _d_versions: dict[tuple[str, str], tuple[int, int]] = {}
+
+    _graph_cache: OwlGraphCache | None = None
+    _graph_cache_set = False
+
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+
+    @staticmethod
+    def _stat(input_path: str) -> tuple[int, int]:
+        stat = os.stat(input_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def graph(cls,
+              input_path: str,
+              format: str = 'ttl') -> Graph:
+        """ Parse an OWL File once per Process
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   share one parsed graph between detector, generator, finder and CLI
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   read and write the optional on-disk graph cache
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   a failed cache write is logged, not raised
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   hold graphs weakly, so an unused graph is freed
+
+        Args:
+            input_path (str): the path to the OWL file
+            format (str, optional): the RDF format. Defaults to 'ttl'.
+
+        Raises:
+            FileNotFoundError: the file does not exist
+
+        Returns:
+            Graph: the parsed graph; shared, so treat it as read-only
+        """
+        input_path = os.path.realpath(input_path)
+        key = (input_path, format)
+
+        with cls._lock:
+            version = cls._stat(input_path)
+
+            graph = cls._d_graphs.get(key)
+            if graph is not None:
+                if cls._d_versions[key] == version:
+                    cls._hits += 1
+                    return graph
+
+                # the file changed on disk
+                cls._evictions += 1
+
+            cls._misses += 1
+
+            sw = Stopwatch()
+            logger = configure_logging(__name__)
+
+            graph_cache = cls.graph_cache()
+            cache_key = graph_cache.key(input_path, format) if graph_cache else None
+
+            graph = graph_cache.load(cache_key) if graph_cache else None
+            if graph is not None:
+                if isEnabledForDebug(logger):
+                    logger.debug(
+                        f"Loaded Cached OWL Graph (path: {input_path}), (triples: {len(graph)}) in {str(sw)}")
+
+            else:
+                graph = Graph()
+                graph.parse(input_path, format=format)
+
+                if isEnabledForDebug(logger):
+                    logger.debug(
+                        f"Parsed OWL Graph (path: {input_path}), (triples: {len(graph)}) in {str(sw)}")
+
+                if graph_cache:
+                    try:
+                        graph_cache.save(cache_key, graph)
+
+                    # the cache is best effort; the parsed graph is still good
+                    except Exception as e:
+                        logger.warning(
+                            f"Graph Cache Write Failed (path: {input_path}), (error: {e})")
+
+            cls._store(key, version, graph)
+            return graph
+
+    @classmethod
+    def _store(cls,
+               key: tuple[str, str],
+               version: tuple[int, int],
+               graph: Graph) -> None:
+        cls._d_graphs[key] = graph
+        cls._d_versions[key] = version
+
+        # drop the versions of freed graphs
+        for stale in cls._d_versions.keys() - cls._d_graphs.keys():
+            del cls._d_versions[stale]
+
+    @classmethod
+    def set_cache_dir(cls,
+                      cache_dir: str | None) -> None:
+        """ Enable (or with None, disable) the On-Disk Graph Cache
+
+        Overrides the 'OWL_GRAPH_CACHE' environment variable.
+
+        Args:
+            cache_dir (str | None): the directory holding the cached graphs
+        """
+        with cls._lock:
+            cls._graph_cache_set = True
+            cls._graph_cache = OwlGraphCache(cache_dir) if cache_dir else None
+
+    @classmethod
+    def graph_cache(cls) -> OwlGraphCache | None:
+        """ Return the On-Disk Graph Cache, if enabled
+
+        Returns:
+            OwlGraphCache | None: the cache set by 'set_cache_dir', else the one named by 'OWL_GRAPH_CACHE'
+        """
+        with cls._lock:
+            if not cls._graph_cache_set and EnvIO.exists('OWL_GRAPH_CACHE'):
+                cls.set_cache_dir(EnvIO.as_str('OWL_GRAPH_CACHE'))
+
+            return cls._graph_cache
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """ Return Registry Statistics
+
+        Returns:
+            CacheInfo: hits, misses, evictions (re-parsed files), maxsize (None) and currsize (graphs in use)
+        """
+        with cls._lock:
+            return CacheInfo(
+                hits=cls._hits,
+                misses=cls._misses,
+                evictions=cls._evictions,
+                maxsize=None,
+                currsize=len(cls._d_graphs))
+
+    @classmethod
+    def clear(cls) -> None:
+        """ Release every Graph and reset statistics """
+        with cls._lock:
+            cls._d_graphs.clear()
+            cls._d_versions.clear()
+            cls._hits = 0
+            cls._misses = 0
+            cls._evictions = 0
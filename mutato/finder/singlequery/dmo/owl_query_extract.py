@@ -5,8 +5,10 @@
 
 from collections import defaultdict
 
-from mutato.core import configure_logging
-from rdflib import Graph, Literal, URIRef, BNode
+from mutato.core import configure_logging, instance_cache
+from rdflib import Graph, Literal, URIRef, BNode, Variable
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
 from rdflib.plugins.sparql.processor import SPARQLResult
 from mutato.finder.singlequery.dto import QueryResultType
 
@@ -47,6 +49,14 @@ class OwlQueryExtract(object):
             ctrim@maryville.edu
             *   handle blank-nodes (BNodes)
                 https://github.com/Maryville-University-DLX/transcriptiq/issues/439
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   transform result rows read straight from the graph index
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   prepare each query once; answer single triple patterns from the graph index
 
         Args:
             graph (Graph): an instantiated RDF graph
@@ -54,6 +64,8 @@ class OwlQueryExtract(object):
         self.logger = configure_logging(__name__)
         self._graph = graph
 
+        self._d_local_names: dict[URIRef, str] = {}
+
     def _log_no_rows_found(self,
                            query_type: QueryResultType) -> None:
         self.logger.debug(
@@ -65,7 +77,11 @@ class OwlQueryExtract(object):
                    iteration_count: int = 0) -> str | list[str]:
 
         if isinstance(value, URIRef):
-            value = str(value).split('#')[-1].strip()
+            local_name = self._d_local_names.get(value)
+            if local_name is None:
+                local_name = str(value).split('#')[-1].strip()
+                self._d_local_names[value] = local_name
+            value = local_name
 
             if to_lowercase:
                 value = value.lower()
@@ -202,15 +218,114 @@ class OwlQueryExtract(object):
         else:
             raise NotImplementedError
 
+    def transform(self,
+                  rows: list[tuple],
+                  to_lowercase: bool,
+                  result_type: QueryResultType) -> object:
+        """ Transform Result Rows that were not produced by a SPARQL Query
+
+        Args:
+            rows (list[tuple]): tuples of RDF terms, in the order the SPARQL query would return them
+            to_lowercase (bool): lowercase all output
+            result_type (QueryResultType): the type of transformation to perform
+
+        Returns:
+            object: the same result as 'process' for the equivalent query
+        """
+        try:
+            return self._update(
+                query_results=rows,
+                to_lowercase=to_lowercase,
+                result_type=result_type)
+        except Exception:
+            self.logger.error(f"Transformation Exception (Rows={len(rows)})")
+            raise ValueError('OWL Query Failed')
+
+    @instance_cache(maxsize=256)
+    def _prepare_query(self,
+                       query: str) -> tuple[Query, tuple | None]:
+        """ Parse and Algebrize a Query once
+
+        Returns:
+            tuple[Query, tuple | None]: the prepared query,
+                and its triple pattern and projection if the query is a single triple pattern
+        """
+        prepared = prepareQuery(query, initNs=dict(self._graph.namespaces()))
+
+        algebra = prepared.algebra
+        if algebra.name != 'SelectQuery' or algebra.datasetClause:
+            return prepared, None
+
+        project = algebra.p
+        if project.name != 'Project' or project.p.name != 'BGP' or len(project.p.triples) != 1:
+            return prepared, None
+
+        pattern = project.p.triples[0]
+        if any(isinstance(term, BNode) for term in pattern):
+            return prepared, None
+
+        variables = [term for term in pattern if isinstance(term, Variable)]
+        if len(set(variables)) != len(variables):
+            return prepared, None
+
+        return prepared, (pattern, project.PV)
+
+    def _pattern_rows(self,
+                      pattern: tuple,
+                      projection: list[Variable],
+                      bindings: dict | None) -> list[tuple]:
+        """ Answer a Single Triple Pattern from the Graph Index
+
+        The SPARQL engine evaluates such a query with one 'graph.triples' call,
+        so the rows are the same, in the same order.
+        """
+        d_bindings = {
+            Variable(name): value for name, value in (bindings or {}).items()
+        }
+
+        lookup = tuple(
+            d_bindings.get(term) if isinstance(term, Variable) else term
+            for term in pattern)
+
+        positions = {
+            term: i for i, term in enumerate(pattern)
+            if isinstance(term, Variable) and term not in d_bindings
+        }
+
+        return [
+            tuple(
+                triple[positions[name]] if name in positions else d_bindings.get(name)
+                for name in projection)
+            for triple in self._graph.triples(lookup)
+        ]
+
     def process(self,
                 query: str,
                 to_lowercase: bool,
-                result_type: QueryResultType) -> dict:
+                result_type: QueryResultType,
+                bindings: dict | None = None) -> dict:
+        """ Execute a SPARQL Query
+
+        Args:
+            query (str): the SPARQL query; prepared once and reused
+            to_lowercase (bool): lowercase all output
+            result_type (QueryResultType): the type of transformation to perform
+            bindings (dict | None, optional): initial variable bindings, by variable name. Defaults to None.
+
+        Returns:
+            dict: the transformed result set
+        """
         try:
 
-            result = self._graph.query(query)
+            prepared, single_pattern = self._prepare_query(query)
+
             if result_type == QueryResultType.DO_NOT_TRANSFORM:
-                return result
+                return self._graph.query(prepared, initBindings=bindings)
+
+            if single_pattern:
+                result = self._pattern_rows(*single_pattern, bindings)
+            else:
+                result = self._graph.query(prepared, initBindings=bindings)
 
             svcresult = self._update(
                 query_results=result,
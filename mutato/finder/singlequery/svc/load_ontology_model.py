@@ -42,6 +42,7 @@ class LoadOntologyModel(object):
         self.ontology_name = self._get_ontology_name(ontology_name)
         self.prefix = self._get_prefix(prefix, ontology_name)
         self.namespace = namespace
+        self.input_path = None
 
         if isEnabledForDebug(self.logger):
             self.logger.debug(
@@ -77,4 +78,6 @@ class LoadOntologyModel(object):
             ontology_name=self.ontology_name,
             absolute_path=self._absolute_path)
 
+        self.input_path = dmo.input_path()
+
         return dmo.graph()
@@ -31,12 +31,22 @@ class QueryOntologyModel(object):
             ctrim@maryville.edu
             *   add 'nill' filter
                 https://github.com/Maryville-University-DLX/transcriptiq/issues/512
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   accept result rows read straight from the graph index
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   accept initial variable bindings for prepared query templates
 
         Args:
             graph (Graph): the instantiated RDF graph
         """
         self.logger = configure_logging(__name__)
-        self._execute_query = OwlQueryExtract(graph).process
+        extract = OwlQueryExtract(graph)
+        self._execute_query = extract.process
+        self._transform_rows = extract.transform
 
     @staticmethod
     def _reverse_order(d_results: dict,
@@ -55,7 +65,8 @@ class QueryOntologyModel(object):
                 sparql: str,
                 result_type: QueryResultType,
                 reverse: bool = False,
-                to_lowercase: bool = True) -> dict | list:
+                to_lowercase: bool = True,
+                bindings: dict | None = None) -> dict | list:
         """ Execute a SPARQL query on the RDF Graph
 
         Args:
@@ -67,6 +78,9 @@ class QueryOntologyModel(object):
                 if "?x implies ?y" and reverse=True
                     the results will be { ?y-1: [x], ?y-2: [x], ?y-N: [x]}
             to_lowercase (bool, optional): Ensures all output is lower-cased. Defaults to True.
+            bindings (dict | None, optional): initial variable bindings, by variable name.
+                Bind per-call values here instead of formatting them into the query,
+                so the prepared query is reused. Defaults to None.
 
         Returns:
             dict or list: the result set
@@ -77,9 +91,46 @@ class QueryOntologyModel(object):
         d_results = self._execute_query(
             query=sparql,
             to_lowercase=to_lowercase,
+            result_type=result_type,
+            bindings=bindings
+        )
+
+        return self._postprocess(d_results, result_type, reverse, sparql, sw)
+
+    def process_rows(self,
+                     rows: list[tuple],
+                     result_type: QueryResultType,
+                     reverse: bool = False,
+                     to_lowercase: bool = True) -> dict | list:
+        """ Transform Result Rows read from the Graph without a SPARQL query
+
+        Args:
+            rows (list[tuple]): tuples of RDF terms, in the order the SPARQL query would return them
+            result_type (QueryResultType): the type of transformation to perform on the rows
+            reverse (bool, optional): reverses the subject/object order. Defaults to False.
+            to_lowercase (bool, optional): Ensures all output is lower-cased. Defaults to True.
+
+        Returns:
+            dict or list: the same result as 'process' for the equivalent query
+        """
+
+        sw = Stopwatch()
+
+        d_results = self._transform_rows(
+            rows=rows,
+            to_lowercase=to_lowercase,
             result_type=result_type
         )
 
+        return self._postprocess(d_results, result_type, reverse, 'rows', sw)
+
+    def _postprocess(self,
+                     d_results: dict | list | None,
+                     result_type: QueryResultType,
+                     reverse: bool,
+                     source: str,
+                     sw: Stopwatch) -> dict | list | None:
+
         if not d_results or not len(d_results):
             if isEnabledForDebug(self.logger):
                 self.logger.debug(
@@ -119,6 +170,6 @@ class QueryOntologyModel(object):
 
         if isEnabledForDebug(self.logger):
             self.logger.debug(
-                f"Ontology Model Service Completed: ({len(d_results)}) for {sparql} in {str(sw)}")
+                f"Ontology Model Service Completed: ({len(d_results)}) for {source} in {str(sw)}")
 
         return d_results
@@ -1 +1,3 @@
 from .mixed_ask_owl_api import MixedAskOwlAPI
+from .triple_scan_extractor import TripleScanExtractor
+from .mixed_triple_scan_extractor import MixedTripleScanExtractor
@@ -8,13 +8,12 @@ rdf:type memberships encoding polyhierarchy, while top-level taxonomy still
 uses owl:Class + rdfs:subClassOf.
 
 Overrides three methods that in the base class assume class-only structure:
-    - children(entity)   - also finds individuals typed as the entity
-    - parents(entity)    - also reads rdf:type for individual parents
-    - ngrams(gram_level) - uses rdfs:label enumeration instead of rdfs:subClassOf
+    - children(entity)     - also finds individuals typed as the entity
+    - parents(entity)      - also reads rdf:type for individual parents
+    - _ngram_candidates()  - uses rdfs:label enumeration instead of rdfs:subClassOf
 """
 
-from functools import lru_cache
-
+from mutato.core import instance_cache
 from mutato.finder.singlequery.bp import AskOwlAPI
 from mutato.finder.singlequery.dto import QueryResultType
 
@@ -28,33 +27,26 @@ _OWL_BUILTINS = {
 class MixedAskOwlAPI(AskOwlAPI):
     """ AskOwlAPI variant for MIXED class+individual OWL ontologies. """
 
-    @lru_cache(maxsize=1024)
-    def ngrams(self, gram_level: int) -> list | None:
-        """ Enumerate all labelled entities and filter by word count.
+    @instance_cache(maxsize=1024)
+    def _ngram_candidates(self) -> list | None:
+        """ Enumerate all labelled entities for n-gram filtering.
 
         The base class queries rdfs:subClassOf which misses individuals.
         Here we enumerate all subjects that have an rdfs:label instead.
-
-        Args:
-            gram_level (int): 1 = unigrams, 2 = bigrams, etc.
+        The query runs once; 'ngrams' filters the result by word count for each gram level.
 
         Returns:
-            list | None: entity local names matching the gram level
+            list | None: entity local names (lowercased)
         """
         sparql = 'SELECT ?a WHERE { ?a rdfs:label ?b }'
 
-        results = self._execute_query(
+        return self._execute_query(
             sparql=sparql,
             to_lowercase=True,
             result_type=QueryResultType.LIST_OF_STRINGS,
         )
 
-        if not results:
-            return None
-
-        return [x for x in results if x.count('_') == gram_level - 1]
-
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def children(self, entity: str) -> list | None:
         """ Return direct children: subclasses OR individuals typed as entity.
 
@@ -81,7 +73,7 @@ class MixedAskOwlAPI(AskOwlAPI):
 
         return results or []
 
-    @lru_cache(maxsize=1024)
+    @instance_cache(maxsize=1024)
     def parents(self, entity: str) -> list | None:
         """ Return direct parents: superclasses OR rdf:type classes for individuals.
 
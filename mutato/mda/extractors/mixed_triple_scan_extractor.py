@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Issue: https://github.com/craigtrim/mutato/issues/4
+""" TripleScanExtractor variant for mixed class/individual OWL ontologies.
+
+Answers the three MixedAskOwlAPI overrides from the scanned triples:
+    - children(entity)     - also finds individuals typed as the entity
+    - parents(entity)      - also reads rdf:type for individual parents
+    - _ngram_candidates()  - uses rdfs:label enumeration instead of rdfs:subClassOf
+"""
+
+from rdflib import URIRef
+
+from mutato.core import instance_cache
+from mutato.finder.singlequery.dto import QueryResultType
+from mutato.mda.extractors.mixed_ask_owl_api import _OWL_BUILTINS
+from mutato.mda.extractors.triple_scan_extractor import TripleScanExtractor
+
+
+class MixedTripleScanExtractor(TripleScanExtractor):
+    """ TripleScanExtractor variant for MIXED class+individual OWL ontologies. """
+
+    @instance_cache(maxsize=1024)
+    def _ngram_candidates(self) -> list | None:
+        rows = self._predicate_rows('rdfs', 'label')
+        if rows is None:
+            return self._api._ngram_candidates()
+
+        return self._process_rows(
+            rows=[(a,) for a, _ in rows],
+            to_lowercase=True,
+            result_type=QueryResultType.LIST_OF_STRINGS)
+
+    @instance_cache(maxsize=16)
+    def _individual_positions(self,
+                              rdf_type: URIRef,
+                              individual: URIRef) -> dict[URIRef, int]:
+        """ Each Named Individual, by its position in the '?a rdf:type owl:NamedIndividual' rows """
+        return {
+            a: i for i, a in enumerate(
+                self._subjects_by_object(rdf_type).get(individual, []))
+        }
+
+    @instance_cache(maxsize=1024)
+    def children(self,
+                 entity: str) -> list | None:
+        uri = self._resolve('', entity)
+        subclass_of = self._resolve('rdfs', 'subClassOf')
+        rdf_type = self._resolve('rdf', 'type')
+        individual = self._resolve('owl', 'NamedIndividual')
+
+        if None in (uri, subclass_of, rdf_type, individual) or uri == individual:
+            return self._api.children(entity)
+
+        positions = self._individual_positions(rdf_type, individual)
+
+        individuals = [
+            a for a in self._subjects_by_object(rdf_type).get(uri, [])
+            if a in positions
+        ]
+
+        # the SPARQL engine evaluates the lesser triple pattern first;
+        # when that is '?a rdf:type owl:NamedIndividual' its order wins
+        if individual < uri:
+            individuals.sort(key=positions.__getitem__)
+
+        rows = self._subjects_by_object(subclass_of).get(uri, []) + individuals
+
+        results = self._process_rows(
+            rows=[(a,) for a in rows],
+            to_lowercase=False,
+            result_type=QueryResultType.LIST_OF_STRINGS,
+        )
+
+        return results or []
+
+    @instance_cache(maxsize=1024)
+    def parents(self,
+                entity: str) -> list | None:
+        uri = self._resolve('', entity)
+        subclass_of = self._resolve('rdfs', 'subClassOf')
+        rdf_type = self._resolve('rdf', 'type')
+        excluded = {
+            self._resolve('owl', name)
+            for name in ['NamedIndividual', 'Thing', 'Class']
+        }
+
+        if None in (uri, subclass_of, rdf_type) or None in excluded:
+            return self._api.parents(entity)
+
+        rows = [
+            a for a in self._graph.objects(uri, subclass_of)
+            if isinstance(a, URIRef)
+        ] + [
+            a for a in self._graph.objects(uri, rdf_type)
+            if isinstance(a, URIRef) and a not in excluded
+        ]
+
+        results = self._process_rows(
+            rows=[(a,) for a in rows],
+            to_lowercase=False,
+            result_type=QueryResultType.LIST_OF_STRINGS,
+        )
+
+        if not results:
+            return []
+
+        return [r for r in results if r not in _OWL_BUILTINS]
@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Answer the MDA Generation Queries from one Scan of the Graph Triples
+
+MDAGenerator.generate asks one SPARQL query per predicate, and one 'children' and one
+'parents' query per entity.  For large ontologies that is thousands of SPARQL parses.
+
+This extractor reads the triples once, grouped by predicate, and answers the same
+questions from those groups.  Rows are built in the order the rdflib SPARQL engine
+returns them and pass through the same transforms as a SPARQL result, so the MDA dict
+is unchanged:
+    ?s ?p ?o        the full triple scan
+    ?a <p> ?b       the predicate index (the grouped triples)
+    :E <p> ?a       the subject index ('Graph.objects')
+
+Anything the scan cannot answer exactly (a name that is not a plain SPARQL local name,
+an unbound prefix) is handed to the wrapped AskOwlAPI.
+"""
+
+import re
+from collections import defaultdict
+
+from rdflib import URIRef
+from rdflib.plugins.sparql.sparql import Prologue
+
+from mutato.core import configure_logging, Stopwatch, instance_cache, isEnabledForDebug
+from mutato.finder.singlequery.bp import AskOwlAPI
+from mutato.finder.singlequery.dmo import EquivalenceClasses
+from mutato.finder.singlequery.dto import QueryResultType
+from mutato.finder.singlequery.svc import (
+    QueryOntologyModel,
+    GenerateViewTrie,
+    GenerateViewSynonyms
+)
+
+# names that parse as the same prefixed name in a SPARQL query
+_PREFIX = re.compile(r'^([A-Za-z][A-Za-z0-9_\-]*)?$')
+_LOCAL_NAME = re.compile(r'^[A-Za-z0-9_][A-Za-z0-9_\-]*$')
+
+
+class TripleScanExtractor(object):
+    """ Answer the MDA Generation Queries from one Scan of the Graph Triples """
+
+    def __init__(self,
+                 api: AskOwlAPI):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   read the graph triples once in place of a SPARQL query per predicate and entity
+
+        Args:
+            api (AskOwlAPI): the loaded ontology; answers anything the scan cannot
+        """
+        self.logger = configure_logging(__name__)
+
+        self._api = api
+        self._graph = api.graph
+        self._process_rows = QueryOntologyModel(api.graph).process_rows
+
+        # prefixed names resolve exactly as they do in 'Graph.query'
+        self._prologue = Prologue()
+        for prefix, namespace in dict(self._graph.namespaces()).items():
+            self._prologue.bind(prefix, namespace)
+
+        self._rows = self._scan()
+
+    def _scan(self) -> dict[URIRef, list[tuple]]:
+        """ Group the Graph Triples by Predicate
+
+        Returns:
+            dict: (subject, object) rows keyed by predicate
+                the keys are in the order of the full triple scan ('?s ?p ?o'),
+                the rows are in the order of the predicate index ('?a <p> ?b')
+        """
+        sw = Stopwatch()
+
+        d_rows: dict[URIRef, list[tuple]] = {}
+        for _, predicate, _ in self._graph.triples((None, None, None)):
+            if predicate not in d_rows:
+                d_rows[predicate] = []
+
+        for predicate, rows in d_rows.items():
+            rows.extend((s, o) for s, _, o in self._graph.triples((None, predicate, None)))
+
+        if isEnabledForDebug(self.logger):
+            self.logger.debug(
+                f"Scanned {len(d_rows)} Predicates in {str(sw)}")
+
+        return d_rows
+
+    def _resolve(self,
+                 prefix: str,
+                 name: str = '') -> URIRef | None:
+        """ Resolve a Prefixed Name
+
+        Returns:
+            URIRef | None: the URI; None if the name would not resolve the same way in a query
+        """
+        if not _PREFIX.match(prefix) or (name and not _LOCAL_NAME.match(name)):
+            return None
+
+        try:
+            return self._prologue.resolvePName(prefix, name)
+        except Exception:
+            return None
+
+    def _predicate_rows(self,
+                        prefix: str,
+                        name: str) -> list[tuple] | None:
+        predicate = self._resolve(prefix, name)
+        if predicate is None:
+            return None
+        return self._rows.get(predicate, [])
+
+    @instance_cache(maxsize=16)
+    def _subjects_by_object(self,
+                            predicate: URIRef) -> dict[URIRef, list]:
+        """ The '?a <p> :E' rows for every object of a predicate """
+        d_subjects = defaultdict(list)
+        for s, o in self._rows.get(predicate, []):
+            d_subjects[o].append(s)
+        return dict(d_subjects)
+
+    @instance_cache(maxsize=1024)
+    def predicates(self) -> dict | None:
+        namespaces = {
+            prefix: self._resolve(prefix)
+            for prefix in ['rdfs', 'skos', 'owl', 'rdf']
+        }
+
+        if None in namespaces.values():
+            return self._api.predicates()
+
+        d_predicates: dict[str, list[str]] = {}
+        s_unique: set[str] = set()
+
+        for prefix, namespace in namespaces.items():
+
+            predicates = self._process_rows(
+                rows=[(p,) for p in self._rows if str(p).startswith(str(namespace))],
+                to_lowercase=False,
+                result_type=QueryResultType.LIST_OF_STRINGS,
+            )
+
+            if predicates and len(predicates):
+                d_predicates[prefix] = predicates
+
+                s_unique.update(x for x in predicates if x)
+
+        predicates = self._process_rows(
+            rows=[(p,) for p in self._rows],
+            to_lowercase=False,
+            result_type=QueryResultType.LIST_OF_STRINGS,
+        )
+
+        d_predicates[""] = [
+            predicate for predicate in predicates
+            if predicate not in s_unique
+        ]
+
+        return d_predicates
+
+    @instance_cache(maxsize=1024)
+    def by_predicate(self,
+                     predicate: str,
+                     to_lowercase: bool = True,
+                     reverse: bool = False) -> list:
+        if ':' in predicate:
+            _prefix = predicate.split(':')[0].strip()
+            _predicate = predicate.split(':')[-1].strip()
+        else:
+            _prefix = self._api.prefix
+            _predicate = predicate
+
+        uri = self._resolve(_prefix, _predicate)
+        if uri is None or uri not in self._rows:
+            return self._api.by_predicate(predicate, to_lowercase, reverse)
+
+        d_results = self._process_rows(
+            rows=self._rows[uri],
+            reverse=reverse,
+            to_lowercase=to_lowercase,
+            result_type=QueryResultType.DICT_OF_STR2LIST,
+        )
+
+        return AskOwlAPI._distinct_values(d_results)
+
+    @instance_cache(maxsize=1024)
+    def keyed_labels(self) -> dict:
+        rows = self._predicate_rows('rdfs', 'label')
+        if rows is None:
+            return self._api.keyed_labels()
+
+        return self._process_rows(
+            rows=rows,
+            to_lowercase=False,
+            result_type=QueryResultType.DICT_OF_STR2STR)
+
+    @instance_cache(maxsize=1024)
+    def labels(self) -> list:
+        rows = self._predicate_rows('rdfs', 'label')
+        if rows is None:
+            return self._api.labels()
+
+        return self._process_rows(
+            rows=[(a,) for _, a in rows],
+            to_lowercase=False,
+            result_type=QueryResultType.LIST_OF_STRINGS)
+
+    @instance_cache(maxsize=1024)
+    def entities(self) -> list:
+        rows = self._predicate_rows('rdfs', 'label')
+        if rows is None:
+            return self._api.entities()
+
+        return self._process_rows(
+            rows=[(x,) for x, _ in rows],
+            to_lowercase=False,
+            result_type=QueryResultType.LIST_OF_STRINGS)
+
+    @instance_cache(maxsize=1024)
+    def ngrams(self,
+               gram_level: int) -> list | None:
+        results = self._ngram_candidates()
+
+        if not results or not len(results):
+            return None
+
+        return [x for x in results if x.count('_') == gram_level - 1]
+
+    @instance_cache(maxsize=1024)
+    def _ngram_candidates(self) -> list | None:
+        rows = self._predicate_rows('rdfs', 'subClassOf')
+        if rows is None:
+            return self._api._ngram_candidates()
+
+        return self._process_rows(
+            rows=[(a,) for a, _ in rows],
+            to_lowercase=True,
+            result_type=QueryResultType.LIST_OF_STRINGS)
+
+    @instance_cache(maxsize=1024)
+    def trie(self) -> dict | None:
+        rows = self._predicate_rows('rdfs', 'subClassOf')
+        if rows is None:
+            return self._api.trie()
+
+        d_results = self._process_rows(
+            rows=rows,
+            to_lowercase=True,
+            result_type=QueryResultType.DICT_OF_STR2LIST)
+
+        if not d_results or not len(d_results):
+            return None
+
+        return GenerateViewTrie().process(d_results)
+
+    def _span_rows(self) -> list[tuple] | None:
+        """ The rows of the 'spans' and '_synonym_query' UNION, branch by branch
+
+        The OPTIONAL patterns of the synonym query bind nothing new, so both
+        queries return the same rows.
+        """
+        rows = []
+        for prefix, name in [('rdfs', 'label'),
+                             ('rdfs', 'seeAlso'),
+                             ('skos', 'altLabel'),
+                             ('', 'inflection')]:
+            branch = self._predicate_rows(prefix, name)
+            if branch is None:
+                return None
+            rows.extend(branch)
+
+        return rows
+
+    @instance_cache(maxsize=1024)
+    def spans(self) -> dict | None:
+        rows = self._span_rows()
+        if rows is None:
+            return self._api.spans()
+
+        d_results = self._process_rows(
+            rows=rows,
+            to_lowercase=True,
+            result_type=QueryResultType.DICT_OF_STR2LIST)
+
+        if not d_results or not len(d_results):
+            return None
+
+        return self._api._merge_spans(d_results)
+
+    @instance_cache(maxsize=1024)
+    def _synonym_query(self) -> dict | None:
+        rows = self._span_rows()
+        if rows is None:
+            return self._api._synonym_query()
+
+        d_results = self._process_rows(
+            rows=rows,
+            to_lowercase=True,
+            result_type=QueryResultType.DICT_OF_STR2LIST)
+
+        if not d_results or not len(d_results):
+            return None
+
+        return AskOwlAPI._normalize_synonyms(d_results)
+
+    @instance_cache(maxsize=1024)
+    def synonyms(self) -> dict | None:
+        d_results = self._synonym_query()
+
+        if not d_results or not len(d_results):
+            return None
+
+        return GenerateViewSynonyms().process(d_results)
+
+    @instance_cache(maxsize=1024)
+    def synonyms_rev(self) -> dict | None:
+        d_results = self._synonym_query()
+
+        if not d_results or not len(d_results):
+            return None
+
+        return GenerateViewSynonyms().process(d_results, reverse=True)
+
+    @instance_cache(maxsize=1024)
+    def equivalents(self) -> dict[str, list[str]] | None:
+        equivalent_class = self._resolve('owl', 'equivalentClass')
+        label = self._resolve('rdfs', 'label')
+
+        if equivalent_class is None or label is None:
+            return self._api.equivalents()
+
+        # one row per label pair, as the basic graph pattern joins them
+        rows = [
+            (a, b)
+            for a, b in self._rows.get(equivalent_class, [])
+            for _ in self._graph.objects(a, label)
+            for _ in self._graph.objects(b, label)
+        ]
+
+        try:
+            d_results = self._process_rows(
+                rows=rows,
+                to_lowercase=True,
+                result_type=QueryResultType.DICT_OF_STR2LIST,
+            )
+        except Exception as e:
+            self.logger.error(f"Equivalent Class Extraction Failed: {e}")
+            return None
+
+        if not d_results:
+            return None
+
+        return AskOwlAPI._bidirectional(d_results)
+
+    @instance_cache(maxsize=1)
+    def equivalence_classes(self) -> dict[str, str] | None:
+        return EquivalenceClasses.of(self.equivalents())
+
+    @instance_cache(maxsize=1024)
+    def children(self,
+                 entity: str) -> list | None:
+        uri = self._resolve('', entity)
+        subclass_of = self._resolve('rdfs', 'subClassOf')
+
+        if uri is None or subclass_of is None:
+            return self._api.children(entity)
+
+        return self._process_rows(
+            rows=[(a,) for a in self._subjects_by_object(subclass_of).get(uri, [])],
+            to_lowercase=False,
+            result_type=QueryResultType.LIST_OF_STRINGS)
+
+    @instance_cache(maxsize=1024)
+    def parents(self,
+                entity: str) -> list | None:
+        uri = self._resolve('', entity)
+        subclass_of = self._resolve('rdfs', 'subClassOf')
+
+        if uri is None or subclass_of is None:
+            return self._api.parents(entity)
+
+        return self._process_rows(
+            rows=[(a,) for a in self._graph.objects(uri, subclass_of)],
+            to_lowercase=False,
+            result_type=QueryResultType.LIST_OF_STRINGS)
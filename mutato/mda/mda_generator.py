@@ -6,6 +6,7 @@
 from mutato.core import configure_logging
 from mutato.finder.singlequery import AskOwlAPI
 from mutato.finder.multiquery.dmo import ViewGeneratorLookup
+from mutato.mda.extractors import TripleScanExtractor
 
 class MDAGenerator(object):
     """ MDA Generation Code """
@@ -57,8 +58,23 @@ class MDAGenerator(object):
     # ----------------------------------------------------------------------------------------------------
 
     def generate(self) -> dict:
+        """ Generate the MDA dict
 
-        d_predicates: dict[str, list[str]] = self.api.predicates()
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   answer every query from one scan of the graph triples
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   store equivalence class IDs ('equivalence_classes')
+
+        Returns:
+            dict: the MDA dict
+        """
+        api = TripleScanExtractor(self.api)
+
+        d_predicates: dict[str, list[str]] = api.predicates()
 
         d_by_predicate: dict[str, list[str]] = {}
         for prefix in d_predicates:
@@ -83,12 +99,12 @@ class MDAGenerator(object):
             ]
 
             for predicate in predicates:
-                d_by_predicate[predicate] = self.api.by_predicate(predicate)
+                d_by_predicate[predicate] = api.by_predicate(predicate)
 
-        d_synonyms_fwd = self.api.synonyms()
+        d_synonyms_fwd = api.synonyms()
 
         d_ner = {}
-        for entity in self.api.labels():
+        for entity in api.labels():
             # ----------------------------------------------------------------------------
             # Purpose:  Hard-Code NER lookup label
             # Issue:    https://github.com/Maryville-University-DLX/transcriptiq/issues/21
@@ -115,27 +131,27 @@ class MDAGenerator(object):
         #     assert isinstance(key, str)
         # # -----------------------------------------------------------------------------
 
-        entities: list[str] = sorted(self.api.entities(), reverse=True)
+        entities: list[str] = sorted(api.entities(), reverse=True)
 
         d_children: dict[str, list[str]] = {}
         for entity in entities:
-            children: list[str] | None = self.api.children(entity)
+            children: list[str] | None = api.children(entity)
             if children and len(children):
                 d_children[entity] = children
 
         d_parents: dict[str, list[str]] = {}
         for entity in entities:
-            parents: list[str] | None = self.api.parents(entity)
+            parents: list[str] | None = api.parents(entity)
             if parents and len(parents):
                 d_parents[entity] = parents
 
         return {
             "children": d_children,
             "parents": d_parents,
-            "trie": self.api.trie(),
-            "ngrams": self._ngrams(),
-            "spans": self.api.spans(),
-            "labels": self.api.keyed_labels(),
+            "trie": api.trie(),
+            "ngrams": self._ngrams(api),
+            "spans": api.spans(),
+            "labels": api.keyed_labels(),
             # -----------------------------------------------------------------------------
             # Purpose:  Exclude Useless Predicates
             # Issue:    https://github.com/Maryville-University-DLX/transcriptiq/issues/351
@@ -144,23 +160,25 @@ class MDAGenerator(object):
             # -----------------------------------------------------------------------------
             # "comments": self.api.comments(),
             # -----------------------------------------------------------------------------
-            "equivalents": self.api.equivalents(),
+            "equivalents": api.equivalents(),
+            "equivalence_classes": api.equivalence_classes(),
             "predicates": predicates,
             "by_predicate": d_by_predicate,
             "ner": d_ner,
             "synonyms": {
                 "lookup": d_lookup,
-                "fwd": self.api.synonyms(),
-                "rev": self.api.synonyms_rev(),
+                "fwd": api.synonyms(),
+                "rev": api.synonyms_rev(),
             },
         }
 
-    def _ngrams(self) -> dict[int, list[str]]:
+    @staticmethod
+    def _ngrams(api: TripleScanExtractor) -> dict[int, list[str]]:
 
         d_gram_levels: dict[int, list[str]] = {}
 
         for gram_level in range(1, 10):
 
-            d_gram_levels[gram_level] = self.api.ngrams(gram_level=gram_level)
+            d_gram_levels[gram_level] = api.ngrams(gram_level=gram_level)
 
         return d_gram_levels
@@ -8,6 +8,7 @@ from rdflib.namespace import SKOS
 
 from mutato.mda.owl_schema import OWLSchema
 from mutato.core import configure_logging
+from mutato.finder.singlequery.dmo import OwlGraphRegistry
 
 
 class OWLSchemaDetector:
@@ -25,6 +26,28 @@ class OWLSchemaDetector:
         self.logger = configure_logging(__name__)
         self._graph = graph
 
+    @classmethod
+    def from_path(cls,
+                  input_path: str,
+                  format: str = 'ttl') -> 'OWLSchemaDetector':
+        """ Detect the Schema of an OWL File
+
+        The graph comes from 'OwlGraphRegistry', so detection does not parse
+        a file that the generator or finder parses again.
+
+        Args:
+            input_path (str): the path to the OWL file
+            format (str, optional): the RDF format. Defaults to 'ttl'.
+
+        Returns:
+            OWLSchemaDetector: a detector over the shared graph
+        """
+        return cls(OwlGraphRegistry.graph(input_path, format=format))
+
+    @property
+    def graph(self) -> Graph:
+        return self._graph
+
     def _has_skos_concepts(self) -> bool:
         return any(self._graph.triples((None, RDF.type, SKOS.Concept)))
 
@@ -16,11 +16,13 @@ The output dict is identical in shape to MDAGenerator.generate() regardless
 of the underlying OWL pattern (CLASS_BASED, MIXED, INDIVIDUAL, SKOS).
 """
 
+from rdflib import Graph
+
 from mutato.core import configure_logging
 from mutato.mda.mda_generator import MDAGenerator
 from mutato.mda.owl_schema import OWLSchema
 from mutato.mda.owl_schema_detector import OWLSchemaDetector
-from mutato.mda.extractors import MixedAskOwlAPI
+from mutato.mda.extractors import MixedAskOwlAPI, MixedTripleScanExtractor
 from mutato.finder.singlequery.svc import LoadOntologyModel
 from mutato.finder.multiquery.dmo import ViewGeneratorLookup
 
@@ -42,14 +44,13 @@ class UniversalMDAGenerator:
         self._absolute_path = absolute_path
         self._namespace = namespace
 
-    def _detect_schema(self) -> OWLSchema:
+    def _load_graph(self) -> Graph:
         loader = LoadOntologyModel(
             ontology_name=self._ontology_name,
             absolute_path=self._absolute_path,
             namespace=self._namespace,
         )
-        graph = loader.process()
-        return OWLSchemaDetector(graph).detect()
+        return loader.process()
 
     def _generate_class_based(self) -> dict:
         """ Delegate to the existing MDAGenerator for CLASS_BASED ontologies. """
@@ -63,13 +64,14 @@ class UniversalMDAGenerator:
         """ Use MixedAskOwlAPI for MIXED class+individual ontologies.
 
         Runs the same generation pipeline as MDAGenerator but substitutes
-        MixedAskOwlAPI for the standard AskOwlAPI.
+        MixedAskOwlAPI for the standard AskOwlAPI.  Queries are answered
+        from one scan of the graph triples (MixedTripleScanExtractor).
         """
-        api = MixedAskOwlAPI(
+        api = MixedTripleScanExtractor(MixedAskOwlAPI(
             ontology_name=self._ontology_name,
             absolute_path=self._absolute_path,
             namespace=self._namespace,
-        )
+        ))
 
         d_predicates: dict[str, list[str]] = api.predicates()
 
@@ -120,6 +122,7 @@ class UniversalMDAGenerator:
             'spans': api.spans(),
             'labels': api.keyed_labels(),
             'equivalents': api.equivalents(),
+            'equivalence_classes': api.equivalence_classes(),
             'predicates': predicates,
             'by_predicate': d_by_predicate,
             'ner': d_ner,
@@ -135,9 +138,12 @@ class UniversalMDAGenerator:
 
         Returns:
             dict: MDA dict with keys: children, parents, trie, ngrams, spans,
-                  labels, equivalents, predicates, by_predicate, ner, synonyms.
+                  labels, equivalents, equivalence_classes, predicates, by_predicate, ner, synonyms.
         """
-        schema = self._detect_schema()
+        # the registry holds graphs weakly; holding this one lets the
+        # generator below reuse the parse
+        graph = self._load_graph()
+        schema = OWLSchemaDetector(graph).detect()
         self.logger.info(f"OWL schema detected: {schema.value} ({self._ontology_name})")
 
         if schema == OWLSchema.CLASS_BASED:
@@ -3,6 +3,12 @@
 """ Mutato API """
 
 
+import time
+import contextvars
+from typing import Callable
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
 import spacy
 from mutato.parser.svc import (
     AugmentTokenHierarchy,
@@ -12,8 +18,21 @@ from mutato.parser.svc import (
 )
 from spacy.lang.en import English
 from lingpatlab import SpacyResult, LingPatLab, Sentence
+from mutato.parser.dto import Record, SwapResult, TokenRecord
 from mutato.finder.multiquery.bp import FindOntologyData, FindOntologyJSON
-from mutato.core import Stopwatch, Enforcer, configure_logging, isEnabledForDebug
+from mutato.core import (
+    EnvIO,
+    Enforcer,
+    Instrumentation,
+    MetricsRegistry,
+    Tracing,
+    TraceHook,
+    Deadline,
+    CacheInfo,
+    ResultCache,
+    PersistentCache,
+    configure_logging
+)
 
 
 class MutatoAPI(object):
@@ -21,9 +40,17 @@ class MutatoAPI(object):
 
     __lingpat_api: LingPatLab = None
 
+    PROVENANCE = ('nested', 'compact')
+
     def __init__(self,
                  find_ontology_data: FindOntologyData | FindOntologyJSON,
-                 en_spacy_model: English | None = None):
+                 en_spacy_model: English | None = None,
+                 cache_size: int = 0,
+                 persistent_cache: PersistentCache | None = None,
+                 production: bool = False,
+                 enable_metrics: bool = False,
+                 slow_input_ms: float | None = None,
+                 provenance: str = 'nested'):
         """ Change Log
 
         Created:
@@ -55,33 +82,86 @@ class MutatoAPI(object):
             ctrim@maryville.edu
             *   add 'swap-input-text' and rename 'swap' to 'swap-input-tokens'
                 https://github.com/Maryville-University-DLX/transcriptiq/issues/19#issuecomment-2132417516
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   add optional bounded result cache to 'swap-input-text'
+            *   add optional two-tier on-disk cache for tokenization and swap results
+            *   add 'production' mode; resolve logging, timing and validation once per pipeline
+            *   add opt-in per-stage metrics registry
+            *   add stage tracing hooks and 'swap-input-texts' for batches
+            *   add time budgets with graceful pass degradation, and a slow-input log
+            *   hold tokens and swaps as compact records inside the pipeline
+            *   add opt-in 'compact' swap provenance (index ranges and a swap chain)
+            *   add 'swap-input-records' to skip building result dicts
 
         Args:
             find_ontology_data (FindOntologyData): an instantiation of this object
+            en_spacy_model (English, optional): a pre-loaded spaCy model. Defaults to None.
+            cache_size (int, optional): the maximum number of cached results. Defaults to 0.
+                a value of 0 disables the result cache
+            persistent_cache (PersistentCache, optional): an on-disk cache shared across runs. Defaults to None.
+            production (bool, optional): skip all per-call logging, timing and validation. Defaults to False.
+            enable_metrics (bool, optional): record per-stage counters and latency histograms. Defaults to False.
+            slow_input_ms (float, optional): log a warning with per-stage timings for any input slower than this.
+                Defaults to None.
+            provenance (str, optional): how a swap records the tokens it replaced. Defaults to 'nested'.
+                'nested' holds the full replaced tokens (and earlier swaps, recursively) in 'swaps.tokens'
+                'compact' holds their [start, end) range in the input tokens in 'swaps.range',
+                and the earlier swaps it absorbed in 'swaps.chain'
         """
         self.logger = configure_logging(__name__)
         if not find_ontology_data.lookup():
             raise ValueError('Empty Ontology')
 
+        if provenance not in self.PROVENANCE:
+            raise ValueError(f'Unknown Provenance: {provenance}')
+
         self._finder = find_ontology_data
+        self._provenance = provenance
 
         if en_spacy_model is not None:
             self._en_spacy_model = en_spacy_model
         else:
             self._en_spacy_model = spacy.load('en_core_web_sm')
 
+        self._hooks = []
+        self._slow_input_ms = slow_input_ms
+
+        self._metrics = None
+        if enable_metrics:
+            self._metrics = self._create_metrics()
+
+        self._instrumentation = Instrumentation(
+            production=production,
+            metrics=self._metrics)
+
         self._perform_exact_matching = PerformExactMatching(
-            find_ontology_data).process
+            find_ontology_data,
+            instrumentation=self._instrumentation).process
 
         self._perform_span_matching = PerformSpanMatching(
-            find_ontology_data).process
+            find_ontology_data,
+            instrumentation=self._instrumentation).process
 
         self._perform_hierarchal_matching = PerformHierarchyMatching(
-            find_ontology_data).process
+            find_ontology_data,
+            instrumentation=self._instrumentation).process
 
         self._augment_hierarchy = AugmentTokenHierarchy(
             find_ontology_data).process
 
+        self._cache = None
+        if cache_size:
+            self._cache = ResultCache(maxsize=cache_size)
+
+        self._persistent_cache = persistent_cache
+        if persistent_cache is not None:
+            self._model_version = self.model_version(self._en_spacy_model)
+
+        if self._cache is not None or self._persistent_cache is not None:
+            self._fingerprint = find_ontology_data.fingerprint()
+
         # ----------------------------------------------------------
         # Change Log:
         # 20220214  Disable Environment Check
@@ -90,38 +170,357 @@ class MutatoAPI(object):
         #     find_ontology_data).process
         # ----------------------------------------------------------
 
+    @staticmethod
+    def pipeline_config() -> tuple:
+        """ Runtime Settings that alter the Matching Pipeline output
+
+        Returns:
+            tuple: the current pipeline configuration
+        """
+        return (
+            EnvIO.is_true('SLIDING_WINDOW_BLACKLIST'),
+            EnvIO.int_or_default('SPAN_DISTANCE', 4),
+        )
+
+    @staticmethod
+    def model_version(en_spacy_model: English) -> str:
+        """ Identify the spaCy Model that produced a Tokenization
+
+        Args:
+            en_spacy_model (English): a loaded spaCy model
+
+        Returns:
+            str: the model language, name and version
+        """
+        meta = en_spacy_model.meta
+        return f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}"
+
+    def _create_metrics(self) -> MetricsRegistry:
+        metrics = MetricsRegistry()
+
+        metrics.describe('mutato_stage_seconds', 'Latency of each pipeline stage')
+        metrics.describe('mutato_gram_size_iterations_total', 'Gram sizes visited by the exact and hierarchy passes')
+        metrics.describe('mutato_windows_examined_total', 'Candidate sliding windows examined')
+        metrics.describe('mutato_cartesian_probes_total', 'Entity lookups made by hierarchy matching')
+        metrics.describe('mutato_swaps_total', 'Swap tokens created, by swap type')
+        metrics.describe('mutato_degraded_total', 'Stages skipped or truncated by a time budget')
+        metrics.describe('mutato_cache_hits', 'Cache hits, by cache')
+        metrics.describe('mutato_cache_misses', 'Cache misses, by cache')
+        metrics.describe('mutato_cache_hit_ratio', 'Cache hit ratio, by cache')
+
+        metrics.register_collector(self._cache_gauges)
+        return metrics
+
+    def _cache_gauges(self) -> list:
+        """ Read hit and miss counts from the finder caches and the result cache """
+        d_caches = {}
+
+        # FindOntologyJSON keeps no method caches
+        finder_cache_info = getattr(self._finder, 'cache_info', None)
+        if finder_cache_info:
+            for qualname, info in finder_cache_info().items():
+                d_caches[f"finder.{qualname.rsplit('.', 1)[-1]}"] = info
+
+        if self._cache is not None:
+            d_caches['result'] = self._cache.cache_info()
+
+        gauges = []
+        for cache, info in sorted(d_caches.items()):
+            total = info.hits + info.misses
+            gauges.append(('mutato_cache_hits', {'cache': cache}, info.hits))
+            gauges.append(('mutato_cache_misses', {'cache': cache}, info.misses))
+            gauges.append(('mutato_cache_hit_ratio', {'cache': cache},
+                           round(info.hits / total, 4) if total else 0.0))
+
+        return gauges
+
+    def metrics(self) -> MetricsRegistry | None:
+        """ Return the Metrics Registry
+
+        Returns:
+            MetricsRegistry | None: per-stage counters and latency histograms (if enabled)
+                use snapshot() for a dict or prometheus() for the text exposition format
+        """
+        return self._metrics
+
+    def add_hook(self,
+                 hook: TraceHook) -> None:
+        """ Register a Stage Hook
+
+        Hooks are called on the thread that runs the stage;
+        a hook shared by batch workers must be thread-safe.
+
+        Args:
+            hook (TraceHook): receives 'on-stage-start' and 'on-stage-end' callbacks
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self,
+                    hook: TraceHook) -> None:
+        """ Unregister a Stage Hook
+
+        Args:
+            hook (TraceHook): a previously registered hook
+        """
+        self._hooks.remove(hook)
+
+    def _run_stage(self,
+                   stage: str,
+                   process: Callable,
+                   tokens: list | str,
+                   deadline: Deadline | None = None) -> list:
+        if self._metrics is None and not self._hooks and deadline is None:
+            return process(tokens)
+
+        def token_count(value: object) -> int | None:
+            if isinstance(value, list):
+                return len(value)
+            if value is not None and hasattr(value, 'tokens'):
+                return len(value.tokens)
+            return None
+
+        context = Tracing.current()
+        for hook in self._hooks:
+            hook.on_stage_start(stage, token_count(tokens), context)
+
+        start = time.perf_counter()
+        swaps = process(tokens)
+        elapsed = time.perf_counter() - start
+
+        if self._metrics is not None:
+            self._metrics.observe('mutato_stage_seconds', elapsed, stage=stage)
+
+        if deadline is not None:
+            deadline.record(stage, elapsed)
+
+        for hook in self._hooks:
+            hook.on_stage_end(stage, token_count(swaps), elapsed, context)
+
+        return swaps
+
+    def _tokenize(self,
+                  input_text: str,
+                  deadline: Deadline | None) -> Sentence:
+        return self._run_stage(
+            'tokenization',
+            lambda text: self.__lingpat_api.parse_input_text(
+                input_text=text,
+                en_spacy_model=self._en_spacy_model),
+            input_text,
+            deadline)
+
+    def _deadline(self,
+                  budget_ms: float | None) -> Deadline | None:
+        if budget_ms is None and self._slow_input_ms is None:
+            return None
+        return Deadline(budget_ms)
+
+    def _finish(self,
+                swaps: list | None,
+                deadline: Deadline | None,
+                describe: Callable) -> list | None:
+        """ Flag a Budgeted Result and log Slow Inputs """
+        if deadline is None:
+            return swaps
+
+        if self._metrics is not None:
+            for stage in deadline.skipped:
+                self._metrics.inc('mutato_degraded_total', stage=stage)
+
+        elapsed_ms = deadline.elapsed_ms()
+        if self._slow_input_ms is not None and elapsed_ms >= self._slow_input_ms:
+            timings = ', '.join(
+                f'{stage}={seconds * 1000:.2f}ms'
+                for stage, seconds in deadline.timings.items())
+            self.logger.warning('\n'.join([
+                'Slow Input',
+                f'\tElapsed: {elapsed_ms:.2f}ms',
+                f'\tStages: {timings}',
+                f'\tDegraded: {deadline.skipped or False}',
+                f'\tInput: {describe()[:200]}']))
+
+        if swaps is None:
+            return None
+
+        return SwapResult(
+            swaps,
+            degraded=deadline.degraded,
+            skipped=deadline.skipped)
+
+    def cache_info(self) -> CacheInfo | None:
+        """ Return Result Cache Statistics
+
+        Returns:
+            CacheInfo | None: hits, misses, evictions, maxsize and currsize (if caching is enabled)
+        """
+        if self._cache is not None:
+            return self._cache.cache_info()
+
     def swap_input_text(self,
                         input_text: str,
-                        ctr: int = 0) -> list | None:
+                        ctr: int = 0,
+                        budget_ms: float | None = None) -> list | None:
         """
         Perform synonym swapping on the given input text.
 
         Args:
             input_text (str): The input text to perform synonym swapping on.
             ctr (int, optional): The counter to keep track of the number of recursive calls. Defaults to 0.
+            budget_ms (float, optional): The time budget in milliseconds. Defaults to None.
+                Once it runs out, the remaining span and hierarchy work is skipped.
 
         Returns:
             list: The list of tokens after performing synonym swapping.
+                A SwapResult (flagged 'degraded' if work was skipped) when a budget is given.
 
         """
 
         if not input_text or not isinstance(input_text, str) or not len(input_text):
             return None
 
+        deadline = self._deadline(budget_ms)
+
+        if self._cache is None:
+            swaps = self._swap_input_text(
+                input_text=input_text, ctr=ctr, deadline=deadline)
+            return self._finish(swaps, deadline, lambda: input_text)
+
+        # the key uses the exact input text; token offsets depend on whitespace
+        key = ResultCache.key(
+            self._fingerprint, self.pipeline_config(), ctr, input_text)
+
+        swaps = self._cache.get(key)
+        if swaps is None:
+            swaps = self._swap_input_text(
+                input_text=input_text, ctr=ctr, deadline=deadline)
+
+            # partial results are never cached
+            if deadline is None or not deadline.degraded:
+                self._cache.put(key, swaps)
+
+        return self._finish(swaps, deadline, lambda: input_text)
+
+    def swap_input_records(self,
+                           input_text: str,
+                           budget_ms: float | None = None) -> list | None:
+        """
+        Perform synonym swapping on the given input text, without building result dicts.
+
+        The pipeline's token records are returned as they are. They are read-only mappings
+        read like the dicts of 'swap_input_text' (token['text'], token['swaps']['canon']),
+        but no token, swap or provenance dict is built. Use this when only the canonical
+        forms or offsets are needed. Results are not held in the result cache.
+
+        Args:
+            input_text (str): The input text to perform synonym swapping on.
+            budget_ms (float, optional): The time budget in milliseconds. Defaults to None.
+
+        Returns:
+            list: The token records after performing synonym swapping.
+                A SwapResult (flagged 'degraded' if work was skipped) when a budget is given.
+        """
+
+        if not input_text or not isinstance(input_text, str) or not len(input_text):
+            return None
+
+        deadline = self._deadline(budget_ms)
+
+        swaps = self._swap_input_text(
+            input_text=input_text, ctr=0, deadline=deadline, materialize=False)
+
+        return self._finish(swaps, deadline, lambda: input_text)
+
+    def swap_input_texts(self,
+                         input_texts: list[str],
+                         max_workers: int | None = None,
+                         budget_ms: float | None = None) -> list[list | None]:
+        """
+        Perform synonym swapping on a batch of input texts.
+
+        Each text runs inside Tracing.context(batch_index=i), on top of the caller's trace attributes.
+        Workers start from a copy of the caller's context, so the attributes reach every hook.
+
+        Args:
+            input_texts (list[str]): The input texts to perform synonym swapping on.
+            max_workers (int, optional): The number of worker threads. Defaults to None.
+                None runs the batch sequentially on the calling thread.
+            budget_ms (float, optional): The time budget for each input text. Defaults to None.
+
+        Returns:
+            list[list | None]: The swapped tokens for each input text, in input order.
+        """
+
+        def swap(i: int, input_text: str) -> list | None:
+            with Tracing.context(batch_index=i):
+                return self.swap_input_text(input_text, budget_ms=budget_ms)
+
+        if not max_workers:
+            return [swap(i, input_text) for i, input_text in enumerate(input_texts)]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, swap, i, input_text)
+                for i, input_text in enumerate(input_texts)
+            ]
+            return [future.result() for future in futures]
+
+    def _swap_input_text(self,
+                         input_text: str,
+                         ctr: int,
+                         deadline: Deadline | None,
+                         materialize: bool = True) -> list | None:
+
         if not self.__lingpat_api:
             self.__lingpat_api = LingPatLab()
 
-        sentence: Sentence = self.__lingpat_api.parse_input_text(
-            input_text=input_text,
-            en_spacy_model=self._en_spacy_model
-        )
+        # persisted results are always dicts; they are read the same way as records
+        if self._persistent_cache is not None:
+            return self._swap_input_text_persistent(
+                input_text=input_text, ctr=ctr, deadline=deadline)
+
+        sentence: Sentence = self._tokenize(input_text, deadline)
 
         if sentence and sentence.tokens:
-            return self.swap_input_tokens(tokens=sentence.tokens, ctr=ctr)
+            return self._swap_input_tokens(
+                tokens=sentence.tokens, ctr=ctr, deadline=deadline,
+                materialize=materialize)
+
+    def _swap_input_text_persistent(self,
+                                    input_text: str,
+                                    ctr: int,
+                                    deadline: Deadline | None) -> list | None:
+
+        tokens_key = PersistentCache.tokens_key(input_text, self._model_version)
+        tokens = self._persistent_cache.get(PersistentCache.TOKENS, tokens_key)
+
+        if tokens is None:
+            sentence: Sentence = self._tokenize(input_text, deadline)
+
+            if not sentence or not sentence.tokens:
+                return None
+
+            tokens = [token.to_json() for token in sentence.tokens]
+            self._persistent_cache.put(PersistentCache.TOKENS, tokens_key, tokens)
+
+        # computed before the pipeline runs; the passes may annotate the input tokens
+        swaps_key = PersistentCache.swaps_key(
+            tokens, self._fingerprint, (self.pipeline_config(), ctr, self._provenance))
+
+        swaps = self._persistent_cache.get(PersistentCache.SWAPS, swaps_key)
+        if swaps is None:
+            swaps = self._swap_input_tokens(
+                tokens=tokens, ctr=ctr, deadline=deadline)
+
+            if deadline is None or not deadline.degraded:
+                self._persistent_cache.put(PersistentCache.SWAPS, swaps_key, swaps)
+
+        return swaps
 
     def swap_input_tokens(self,
                           tokens: list[dict] | list[SpacyResult],
-                          ctr: int = 0) -> list:
+                          ctr: int = 0,
+                          budget_ms: float | None = None,
+                          deadline: Deadline | None = None) -> list:
         """
         Perform synonym swapping on the given tokens.
 
@@ -130,22 +529,59 @@ class MutatoAPI(object):
                 Some implementations may use spacy-core and send a list of SpacyResult objects.
                 This route will convert these objects to native dictionaries for processing.
             ctr (int, optional): The counter to keep track of the number of recursive calls. Defaults to 0.
+            budget_ms (float, optional): The time budget in milliseconds. Defaults to None.
+                Once it runs out, the remaining span and hierarchy work is skipped.
+            deadline (Deadline, optional): A deadline shared with the caller; overrides 'budget_ms'. Defaults to None.
+                Use this to read per-stage timings after the call.
 
         Returns:
             list: The list of tokens after performing synonym swapping.
+                A SwapResult (flagged 'degraded' if work was skipped) when a budget or deadline is given.
 
         """
 
-        sw = Stopwatch()
+        if deadline is None:
+            deadline = self._deadline(budget_ms)
 
-        if tokens and len(tokens):
-            if isinstance(tokens[0], SpacyResult):
-                tokens: list[dict] = [
-                    token.to_json() for token in tokens
-                ]
+        swaps = self._swap_input_tokens(tokens=tokens, ctr=ctr, deadline=deadline)
 
-        if isEnabledForDebug(self.logger):
+        return self._finish(
+            swaps, deadline,
+            lambda: ' '.join(str(token['text']) for token in swaps))
+
+    def _swap_input_tokens(self,
+                           tokens: list[dict] | list[SpacyResult],
+                           ctr: int,
+                           deadline: Deadline | None,
+                           materialize: bool = True) -> list:
+
+        # ----------------------------------------------------------
+        # Purpose:  Parsed tokens are read in place through compact records;
+        #           records become dicts once, when the result leaves the pipeline
+        # ----------------------------------------------------------
+        if tokens and len(tokens) and isinstance(tokens[0], SpacyResult):
+            tokens = [TokenRecord(token) for token in tokens]
+
+        elif self._instrumentation.debug:
             Enforcer.is_list_of_dicts(tokens)
+
+        if not materialize:
+            return self._sweep(tokens, ctr, deadline)
+
+        positions = None
+        if self._provenance == 'compact':
+            positions = {id(token): i for i, token in enumerate(tokens)}
+
+        return Record.to_dicts(self._sweep(tokens, ctr, deadline), positions)
+
+    def _sweep(self,
+               tokens: list,
+               ctr: int,
+               deadline: Deadline | None) -> list:
+
+        sw = self._instrumentation.stopwatch()
+
+        if self._instrumentation.debug:
             Enforcer.is_int(ctr)
 
         # ----------------------------------------------------------
@@ -153,19 +589,35 @@ class MutatoAPI(object):
         # Reference:  GRAFFL-CORE-0074
         # ----------------------------------------------------------
         # swaps = self._augment_hierarchy(tokens)
-        swaps = self._perform_exact_matching(tokens)
+        swaps = self._run_stage(
+            'exact', self._perform_exact_matching, tokens, deadline)
+
+        # ----------------------------------------------------------
+        # Purpose:  Exact matching always runs; once a budget runs out
+        #           the span and hierarchy passes and further sweeps are skipped
+        # ----------------------------------------------------------
+        def expired(stage: str) -> bool:
+            if deadline is not None and deadline.expired():
+                deadline.degrade(stage)
+                return True
+            return False
 
         # ----------------------------------------------------------
         # Change Log:
         # 20221129  OWL-FINDER-0005  It is possible that spans may not exist
         # ----------------------------------------------------------
-        if self._finder.has_spans():
-            swaps = self._perform_span_matching(swaps)
+        if self._finder.has_spans() and not expired('span'):
+            swaps = self._run_stage(
+                'span', self._perform_span_matching, swaps, deadline)
 
-        swaps = self._perform_hierarchal_matching(swaps)
+        if not expired('hierarchy'):
+            swaps = self._run_stage(
+                'hierarchy',
+                partial(self._perform_hierarchal_matching, deadline=deadline),
+                swaps, deadline)
 
-        if ctr < 2:
-            swaps = self.swap_input_tokens(swaps, ctr + 1)
+        if ctr < 2 and not expired('sweep'):
+            swaps = self._sweep(swaps, ctr + 1, deadline)
 
         # ----------------------------------------------------------
         # Change Log:
@@ -175,7 +627,7 @@ class MutatoAPI(object):
         #   swaps = self._perform_spacy_matching(swaps)
         # ----------------------------------------------------------
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             self.logger.debug(f"Synonym Swap Completed in {str(sw)}")
 
         return swaps
@@ -1 +1,4 @@
 from .swap_token_generator import SwapTokenGenerator
+from .token_windows import TokenWindows
+from .ontology_vocabulary import OntologyVocabulary
+from .token_lattice import TokenLattice
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Token Vocabulary of the Ontology """
+
+
+class OntologyVocabulary(object):
+    """ Token Vocabulary of the Ontology
+
+    Every token normal that occurs in the n-gram lookup or in a span rule.
+
+    A window whose text is a lookup entry is made only of vocabulary tokens,
+    so any window that touches an out-of-vocabulary token can be skipped
+    without a lookup.  Most tokens in running text are out-of-vocabulary.
+
+    Usage:
+        vocabulary = OntologyVocabulary(d_lookup, d_spans)
+        mask = vocabulary.mask(tokens)      # [False, True, True, False, ...]
+    """
+
+    def __init__(self,
+                 d_lookup: dict | None,
+                 d_spans: dict | None = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   prefilter candidate windows against the ontology vocabulary
+
+        Args:
+            d_lookup (dict): lookup entries keyed by gram size
+            d_spans (dict, optional): span rules keyed by their first token. Defaults to None.
+        """
+        vocabulary = set()
+
+        for entries in (d_lookup or {}).values():
+            for entry in entries:
+                vocabulary.update(entry.lower().split(' '))
+
+        for key, rules in (d_spans or {}).items():
+            vocabulary.add(key.strip())
+            for rule in rules:
+                vocabulary.update(token.strip() for token in rule['content'])
+
+        self._vocabulary = frozenset(vocabulary)
+
+    def __len__(self) -> int:
+        return len(self._vocabulary)
+
+    def __contains__(self,
+                     normal: str) -> bool:
+        # a normal may itself hold spaces; each part must be known
+        normal = normal.lower()
+        if normal in self._vocabulary:
+            return True
+        return ' ' in normal and all(
+            part in self._vocabulary for part in normal.split(' '))
+
+    def mask(self,
+             tokens: list) -> list[bool]:
+        """ Mark each Token as in or out of Vocabulary
+
+        Args:
+            tokens (list): the tokens
+
+        Returns:
+            list[bool]: True for each token whose normal is in the vocabulary
+        """
+        return [token['normal'] in self for token in tokens]
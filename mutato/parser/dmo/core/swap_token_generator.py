@@ -3,13 +3,15 @@
 """ Generate a Swapped Token """
 
 
-from mutato.core import configure_logging, Enforcer
+from mutato.core import configure_logging, Enforcer, Instrumentation
+from mutato.parser.dto import SwapRecord, SwapTokenRecord
 
 class SwapTokenGenerator(object):
     """ Generate a Swapped Token """
 
     def __init__(self,
-                 ontologies: list):
+                 ontologies: list,
+                 instrumentation: Instrumentation | None = None):
         """ Change Log
 
         Created:
@@ -27,12 +29,21 @@ class SwapTokenGenerator(object):
             craigtrim@gmail.com
             *   remove all params in place of 'find-ontology-data'
                 https://github.com/grafflr/deepnlu/issues/13
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   return a compact 'swap-token-record' in place of nested dicts
 
         Args:
             ontologies (list): list of OWL models
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
         self._ontologies = ontologies
+        instrumentation = instrumentation or Instrumentation()
+        self._validate = instrumentation.validate
+        self._metrics = instrumentation.metrics
 
     def process(self,
                 normal: str,
@@ -40,13 +51,17 @@ class SwapTokenGenerator(object):
                 ner: str,
                 tokens: list,
                 swap_type: str,
-                confidence: float = 100.0) -> dict:
+                confidence: float = 100.0) -> SwapTokenRecord:
+
+        if self._validate:
+            Enforcer.is_str(normal)
+            Enforcer.is_str(canon)
+            Enforcer.is_optional_str(ner)
+            Enforcer.is_list(tokens)
+            Enforcer.is_optional_str(normal)
 
-        Enforcer.is_str(normal)
-        Enforcer.is_str(canon)
-        Enforcer.is_optional_str(ner)
-        Enforcer.is_list(tokens)
-        Enforcer.is_optional_str(normal)
+        if self._metrics is not None:
+            self._metrics.inc('mutato_swaps_total', type=swap_type)
 
         if ner:
             ner = ner.upper()
@@ -56,18 +71,15 @@ class SwapTokenGenerator(object):
                 return self._ontologies
             return [self._ontologies]
 
-        return {
-            'id': tokens[0]['id'],
-            'x': tokens[0]['x'],
-            'y': tokens[-1]['y'],
-            'ner': ner,
-            'text': ' '.join([x['text'].strip() for x in tokens]),
-            'normal': normal,
-            'swaps': {
-                'tokens': tokens,
-                'canon': canon,
-                'type': swap_type,
-                'ontologies': get_ontologies(),
-                'confidence': confidence
-            }
-        }
+        return SwapTokenRecord(
+            id=tokens[0]['id'],
+            x=tokens[0]['x'],
+            y=tokens[-1]['y'],
+            ner=ner,
+            normal=normal,
+            swaps=SwapRecord(
+                tokens=tokens,
+                canon=canon,
+                type=swap_type,
+                ontologies=get_ontologies(),
+                confidence=confidence))
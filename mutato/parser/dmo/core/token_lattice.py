@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Mutable Token Sequence for Swap Application """
+
+
+from mutato.parser.dmo.core.ontology_vocabulary import OntologyVocabulary
+from mutato.parser.dmo.core.token_windows import TokenWindows
+
+
+class TokenLattice(object):
+    """ Mutable Token Sequence for Swap Application
+
+    A swap replaces the range of tokens it covers with one swap token, in place.
+    The lowercased normals and the vocabulary mask are kept in step with the
+    tokens, so nothing is recomputed per token after a swap; the window view
+    is rebuilt from them on demand.
+
+    Replacement is a slice assignment: a memory move inside the list rather than
+    a scan by id and a rebuilt list.
+
+    Usage:
+        lattice = TokenLattice(tokens, vocabulary)
+        lattice.replace(start, end, d_swap)
+        tokens = lattice.to_list()
+    """
+
+    def __init__(self,
+                 tokens: list,
+                 vocabulary: OntologyVocabulary | None = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   in-place swap application for the exact matching pass
+
+        Args:
+            tokens (list): the tokens
+            vocabulary (OntologyVocabulary, optional): mask out-of-vocabulary tokens. Defaults to None.
+        """
+        self._vocabulary = vocabulary
+
+        self.tokens = list(tokens)
+        self.normals = [token['normal'].lower() for token in self.tokens]
+        self.mask = None
+        if vocabulary is not None:
+            self.mask = vocabulary.mask(self.tokens)
+
+        self._windows = None
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def windows(self) -> TokenWindows:
+        """ Return a Window View of the current Tokens
+
+        Returns:
+            TokenWindows: the view (shared until the next replace)
+        """
+        if self._windows is None:
+            self._windows = TokenWindows(
+                self.tokens, mask=self.mask, normals=self.normals)
+        return self._windows
+
+    def replace(self,
+                start: int,
+                end: int,
+                token: dict) -> None:
+        """ Replace a Range of Tokens with a single Token
+
+        Args:
+            start (int): the first token position
+            end (int): one past the last token position
+            token (dict): the replacement (typically a swap token)
+        """
+        self.tokens[start:end] = [token]
+        self.normals[start:end] = [token['normal'].lower()]
+        if self.mask is not None:
+            self.mask[start:end] = [token['normal'] in self._vocabulary]
+
+        self._windows = None
+
+    def to_list(self) -> list:
+        """ Return the Tokens as a plain List
+
+        The list is the lattice's own; the lattice should not be used afterwards.
+        """
+        return self.tokens
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Index-Range Views over a Token List """
+
+
+class TokenWindows(object):
+    """ Index-Range Views over a Token List
+
+    Windows are (start, end) ranges over the token list rather than list slices.
+    The lowercased normals are computed once per view (or handed in by a
+    TokenLattice, which keeps them in step with its swaps).
+
+    Given a mask (e.g., from OntologyVocabulary), ranges() skips every window
+    that holds a masked-out token, jumping past the masked-out token.
+
+    A view is cheap to build: it holds references to the lists it is given.
+
+    Usage:
+        windows = TokenWindows(tokens)
+        for start, end in windows.ranges(gram_size=2):
+            windows.text(start, end)    # 'fiscal policy'
+        windows.tokens_at(start, end)   # the tokens of a matching window
+    """
+
+    def __init__(self,
+                 tokens: list,
+                 mask: list[bool] | None = None,
+                 normals: list[str] | None = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   shared window primitive for the exact, blacklist and hierarchy finders
+            *   skip windows that hold a masked-out token
+            *   accept lowercased normals maintained by a 'token-lattice'
+
+        Args:
+            tokens (list): the tokens
+            mask (list[bool], optional): the tokens a window may hold. Defaults to None (any token).
+            normals (list[str], optional): the lowercased normal of each token. Defaults to None (derived).
+        """
+        self.tokens = tokens
+        self.normals = normals
+        self._mask = mask
+
+        if self.normals is None:
+            self.normals = [token['normal'].lower() for token in tokens]
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def ranges(self,
+               gram_size: int,
+               first: int = 0,
+               last: int | None = None):
+        """ Yield the (start, end) Range of each Window
+
+        Args:
+            gram_size (int): the window size
+            first (int, optional): the first window start. Defaults to 0.
+            last (int, optional): the last window start. Defaults to None (the last window).
+        """
+        final = len(self.tokens) - gram_size
+        if last is None or last > final:
+            last = final
+
+        mask = self._mask
+
+        start = max(first, 0)
+        while start <= last:
+            end = start + gram_size
+
+            if mask is not None:
+                window = mask[start:end]
+                if not all(window):
+
+                    # no window that holds the masked-out token can qualify
+                    start = end - window[::-1].index(False)
+                    continue
+
+            yield start, end
+            start += 1
+
+    def text(self,
+             start: int,
+             end: int) -> str:
+        """ Return the space-joined lowercased Normals of a Window
+
+        Args:
+            start (int): the first token position
+            end (int): one past the last token position
+
+        Returns:
+            str: the window text
+        """
+        return ' '.join(self.normals[start:end])
+
+    def tokens_at(self,
+                  start: int,
+                  end: int) -> list:
+        """ Materialize the Tokens of a Window
+
+        Args:
+            start (int): the first token position
+            end (int): one past the last token position
+
+        Returns:
+            list: the tokens
+        """
+        return self.tokens[start:end]
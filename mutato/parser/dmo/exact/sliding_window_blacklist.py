@@ -3,47 +3,64 @@
 """ Filter Extracted Candidate Sequences """
 
 
-from mutato.core import configure_logging, Stopwatch, isEnabledForDebug
+from mutato.core import configure_logging, Instrumentation
+from mutato.parser.dmo.core import TokenWindows
 
 class SlidingWindowBlacklist(object):
     """ Filter Extracted Candidate Sequences """
 
     def __init__(self,
-                 candidates: list,
                  gram_size: int,
-                 blacklist: list):
+                 blacklist: list,
+                 instrumentation: Instrumentation | None = None):
         """
         Created:
             8-Oct-2021
             craigtrim@gmail.com
             *   https://github.com/grafflr/graffl-core/issues/14#issuecomment-939029052
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   candidates are (start, end) ranges over 'windows'
+            *   build once per finder; resolve logging and timing via 'instrumentation'
+
+        Args:
+            gram_size (int): the window size
+            blacklist (list): blacklisted window texts
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
         self._gram_size = gram_size
         self._blacklist = blacklist
-        self._candidates = candidates
+        self._instrumentation = instrumentation or Instrumentation()
 
-    def _process(self) -> list:
-        filtered = []
+    def _process(self,
+                 candidates: list,
+                 windows: TokenWindows) -> list:
+        text = windows.text
 
-        for candidate in self._candidates:
+        return [
+            (start, end) for start, end in candidates
+            if text(start, end).strip() not in self._blacklist
+        ]
 
-            normalized_text = ' '.join([
-                x['normal']
-                for x in candidate
-            ]).strip().lower()
-            
-            if normalized_text not in self._blacklist:
-                filtered.append(candidate)
+    def process(self,
+                candidates: list,
+                windows: TokenWindows) -> list:
+        """ Drop the Candidate Ranges whose Text is Blacklisted
 
-        return filtered
+        Args:
+            candidates (list): (start, end) window ranges
+            windows (TokenWindows): the token view the ranges refer to
 
-    def process(self) -> list:
-        sw = Stopwatch()
+        Returns:
+            list: the remaining ranges
+        """
+        sw = self._instrumentation.stopwatch()
 
-        results = self._process()
+        results = self._process(candidates, windows)
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             self.logger.debug(
                 f"Sliding Window Blacklist Completed for gram-size {self._gram_size} in {str(sw)}")
 
@@ -3,15 +3,16 @@
 """ Filter Extracted Candidate against known KBs """
 
 
-from mutato.core import configure_logging, Stopwatch, isEnabledForDebug
+from mutato.core import configure_logging, Instrumentation
+from mutato.parser.dmo.core import TokenWindows
 
 class SlidingWindowLookup(object):
     """ Filter Extracted Candidate against known KBs """
 
     def __init__(self,
-                 candidates: list,
                  gram_size: int,
-                 d_runtime_kb: dict):
+                 d_runtime_kb: dict,
+                 instrumentation: Instrumentation | None = None):
         """ Change Log:
 
         Created:
@@ -23,15 +24,20 @@ class SlidingWindowLookup(object):
             ctrim@maryville.edu
             *   Check for int(gram-size) and str(gram-size)
                 https://github.com/Maryville-University-DLX/transcriptiq/issues/513
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   candidates are (start, end) ranges over 'windows'
+            *   build once per finder; resolve logging and timing via 'instrumentation'
 
         Args:
-            candidates (list): _description_
-            gram_size (int): _description_
-            d_runtime_kb (dict): _description_
+            gram_size (int): the window size
+            d_runtime_kb (dict): lookup entries keyed by gram size
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
         self._gram_size = gram_size
-        self._candidates = candidates
+        self._instrumentation = instrumentation or Instrumentation()
 
         def get_runtime_kb() -> dict:
             # -----------------------------------------------------------------------------
@@ -46,28 +52,40 @@ class SlidingWindowLookup(object):
 
         self._d_runtime_kb = get_runtime_kb()
 
-    def _process(self) -> list:
-        filtered = []
-        for token in self._candidates:
-            normal = ' '.join([x['normal'] for x in token]).lower()
+    def _process(self,
+                 candidates: list,
+                 windows: TokenWindows) -> list:
+        text = windows.text
+        d_runtime_kb = self._d_runtime_kb
 
-            if normal in self._d_runtime_kb:
-                filtered.append(token)
+        return [
+            (start, end) for start, end in candidates
+            if text(start, end) in d_runtime_kb
+        ]
 
-        return filtered
+    def process(self,
+                candidates: list,
+                windows: TokenWindows) -> list | None:
+        """ Keep the Candidate Ranges that exist in the Lookup
 
-    def process(self) -> list | None:
-        sw = Stopwatch()
+        Args:
+            candidates (list): (start, end) window ranges
+            windows (TokenWindows): the token view the ranges refer to
+
+        Returns:
+            list | None: the matching ranges, or None if there are none
+        """
+        sw = self._instrumentation.stopwatch()
 
-        results = self._process()
+        results = self._process(candidates, windows)
 
         if not len(results):
-            if isEnabledForDebug(self.logger):
+            if self._instrumentation.debug:
                 self.logger.debug(
                     f"Sliding Window Lookup Completed for gram-size {self._gram_size} with no results in {str(sw)}")
             return None
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             self.logger.debug(
                 f"Sliding Window Lookup Completed for gram-size {self._gram_size} with {len(results)} results in {str(sw)}")
 
@@ -3,16 +3,20 @@
 """ Perform Sliding Window Extraction for Candidate Synonym Swapping """
 
 
-from mutato.core import configure_logging, EnvIO, Stopwatch, isEnabledForInfo, isEnabledForDebug
-from mutato.parser.dmo.exact import SlidingWindowExtract, SlidingWindowBlacklist, SlidingWindowLookup
+from mutato.core import configure_logging, EnvIO, Instrumentation
+from mutato.parser.dmo.core import TokenWindows
+from mutato.parser.dmo.exact import SlidingWindowBlacklist, SlidingWindowLookup
 from mutato.parser.dto import d_candidate_synonym_blacklist
 
 class ExactMatchFinder(object):
     """ Perform Sliding Window Extraction for Candidate Synonym Swapping """
 
+    _CHUNK_SIZE = 32
+
     def __init__(self,
                  gram_size: int,
-                 d_lookup: dict):
+                 d_lookup: dict,
+                 instrumentation: Instrumentation | None = None):
         """
         Created:
             8-Oct-2021
@@ -23,83 +27,173 @@ class ExactMatchFinder(object):
             craigtrim@gmail.com
             *   renamed from 'perform-sliding-window'
                 GRAFFL-CORE-0077
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   resolve 'gram-size-exists' once; finders are built once per pipeline
+            *   scan (start, end) ranges over a shared 'token-windows' view
+                instead of materialized slices
+            *   find the leftmost match without checking every window
+            *   build the window blacklist and lookup once, with the shared instrumentation
         """
         self.logger = configure_logging(__name__)
         self._d_lookup = d_lookup
         self._gram_size = gram_size
-        self._lookup_keys = list(self._d_lookup.keys())
-
-    def _process(self,
-                 tokens: list) -> list:
+        self._instrumentation = instrumentation or Instrumentation()
+        self._metrics = self._instrumentation.metrics
 
         # -----------------------------------------------------------------------------
         # Purpose:  Must Check int(gram-size) and str(gram-size)
         # Issue:    https://github.com/Maryville-University-DLX/transcriptiq/issues/513
         #           ssuecomment-2608665973
         # -----------------------------------------------------------------------------
-        gram_size_exists: bool = self._gram_size in self._d_lookup or \
-            str(self._gram_size) in self._lookup_keys
+        self._gram_size_exists: bool = gram_size in d_lookup or \
+            str(gram_size) in d_lookup
         # -----------------------------------------------------------------------------
 
+        self._sliding_window_blacklist = None
+        if gram_size in d_candidate_synonym_blacklist:
+            self._sliding_window_blacklist = SlidingWindowBlacklist(
+                gram_size=gram_size,
+                blacklist=d_candidate_synonym_blacklist[gram_size],
+                instrumentation=self._instrumentation).process
+
+        self._sliding_window_lookup = SlidingWindowLookup(
+            gram_size=gram_size,
+            d_runtime_kb=d_lookup,
+            instrumentation=self._instrumentation).process
+
+    def _process(self,
+                 windows: TokenWindows,
+                 first: int,
+                 last: int | None) -> list:
+
         # check if valid synonyms or entities exist at this gram size level
-        if not gram_size_exists:
+        if not self._gram_size_exists:
 
             # ... then there is no point in proceeding any further
             return None
 
-        candidates = SlidingWindowExtract(
-            tokens=tokens,
-            gram_size=self._gram_size).process()
+        candidates = list(windows.ranges(self._gram_size, first, last))
 
         if not candidates or not len(candidates):
             return None
 
+        if self._metrics is not None:
+            self._metrics.inc('mutato_windows_examined_total',
+                              len(candidates), stage='exact')
+
         if self._gram_size == 1:
+            tokens = windows.tokens
             candidates = [
-                x for x in candidates
-                if len([
-                    token for token in x
-                    if 'swaps' not in token
-                ])
+                (start, end) for start, end in candidates
+                if 'swaps' not in tokens[start]
             ]
 
         if EnvIO.is_true('SLIDING_WINDOW_BLACKLIST'):  # optional step; defaults to False
-            if self._gram_size in d_candidate_synonym_blacklist:
-                blacklist = d_candidate_synonym_blacklist[self._gram_size]
-
-                candidates = SlidingWindowBlacklist(
-                    candidates=candidates,
-                    blacklist=blacklist,
-                    gram_size=self._gram_size).process()
+            if self._sliding_window_blacklist:
+                candidates = self._sliding_window_blacklist(candidates, windows)
 
                 if not candidates or not len(candidates):
                     return None
 
-        candidates = SlidingWindowLookup(
-            candidates=candidates,
-            gram_size=self._gram_size,
-            d_runtime_kb=self._d_lookup).process()
+        candidates = self._sliding_window_lookup(candidates, windows)
 
         if not candidates or not len(candidates):
             return None
 
         return candidates
 
-    def process(self,
-                tokens: list) -> list:
-        sw = Stopwatch()
+    def ranges(self,
+               windows: TokenWindows,
+               first: int = 0,
+               last: int | None = None) -> list | None:
+        """ Find the Window Ranges at this Gram Size that exist in the Lookup
+
+        Args:
+            windows (TokenWindows): a view over the tokens
+            first (int, optional): the first window start to consider. Defaults to 0.
+            last (int, optional): the last window start to consider. Defaults to None (the last window).
+
+        Returns:
+            list | None: the matching (start, end) ranges, left to right
+        """
+        sw = self._instrumentation.stopwatch()
 
-        results = self._process(tokens)
+        results = self._process(windows, first, last)
 
-        if isEnabledForInfo(self.logger):
+        if self._instrumentation.debug:
 
             def total_results() -> int:
                 if results:
                     return len(results)
                 return 0
 
-            if isEnabledForDebug(self.logger):
-                self.logger.debug(
-                    f"Sliding Window Completed gram-size={self._gram_size}, total-results={total_results()} in {str(sw)}")
+            self.logger.debug(
+                f"Sliding Window Completed gram-size={self._gram_size}, total-results={total_results()} in {str(sw)}")
 
         return results
+
+    def leftmost(self,
+                 windows: TokenWindows,
+                 first: int = 0,
+                 last: int | None = None) -> tuple | None:
+        """ Find the leftmost Window Range at this Gram Size that exists in the Lookup
+
+        Windows are checked in chunks that double in size, so the work done
+        is proportional to the distance to the match rather than to the whole
+        token list.
+
+        Args:
+            windows (TokenWindows): a view over the tokens
+            first (int, optional): the first window start to consider. Defaults to 0.
+            last (int, optional): the last window start to consider. Defaults to None (the last window).
+
+        Returns:
+            tuple | None: the (start, end) range of the leftmost match
+        """
+        if not self._gram_size_exists:
+            return None
+
+        final = len(windows) - self._gram_size
+        if last is None or last > final:
+            last = final
+
+        start = max(first, 0)
+        chunk = self._CHUNK_SIZE
+        while start <= last:
+            stop = min(start + chunk - 1, last)
+
+            results = self.ranges(windows, start, stop)
+            if results:
+                return results[0]
+
+            start = stop + 1
+            chunk *= 2
+
+        return None
+
+    def process(self,
+                tokens: list,
+                windows: TokenWindows | None = None) -> list:
+        """ Find the Windows at this Gram Size that exist in the Lookup
+
+        Args:
+            tokens (list): the tokens
+            windows (TokenWindows, optional): a view over 'tokens' shared across gram sizes. Defaults to None.
+
+        Returns:
+            list: the matching windows (as token lists), or None
+        """
+        if windows is None:
+            windows = TokenWindows(tokens)
+
+        results = self.ranges(windows)
+        if not results:
+            return None
+
+        return [
+            windows.tokens_at(start, end)
+            for start, end in results
+        ]
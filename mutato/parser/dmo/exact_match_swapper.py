@@ -5,13 +5,14 @@
 
 from mutato.parser.dmo.core import SwapTokenGenerator
 from mutato.finder.multiquery.bp import FindOntologyData
-from mutato.core import configure_logging, Enforcer, isEnabledForDebug
+from mutato.core import configure_logging, Enforcer, Instrumentation
 
 class ExactMatchSwapper(object):
     """ Perform Synonym Swapping with Exact Matches """
 
     def __init__(self,
-                 find_ontology_data: FindOntologyData):
+                 find_ontology_data: FindOntologyData,
+                 instrumentation: Instrumentation | None = None):
         """ Change Log
 
         Created:
@@ -43,16 +44,24 @@ class ExactMatchSwapper(object):
             ctrim@maryville.edu
             *   fix lookup defect
                 https://github.com/Maryville-University-DLX/transcriptiq/issues/113
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
 
         Args:
             find_ontology_data (FindOntologyData): an instantiation of this object
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
+        instrumentation = instrumentation or Instrumentation()
+        self._debug = instrumentation.debug
         self._find_ner = find_ontology_data.find_ner
         self._find_canon = find_ontology_data.find_canon
         self._find_variants = find_ontology_data.find_variants
         self._create_swap = SwapTokenGenerator(
-            find_ontology_data.ontologies()).process
+            find_ontology_data.ontologies(),
+            instrumentation=instrumentation).process
 
     def process(self,
                 tokens: list) -> list:
@@ -84,7 +93,7 @@ class ExactMatchSwapper(object):
                 )
         # -----------------------------------------------------------------------------
 
-        if isEnabledForDebug(self.logger):
+        if self._debug:
             Enforcer.is_optional_str(canon)
 
         if not canon:
@@ -3,93 +3,186 @@
 """ Use Token Hierarchies to Find Matches """
 
 
-from mutato.parser.dmo import SlidingWindowExtract
-from mutato.core import configure_logging, Stopwatch, Enforcer, isEnabledForDebug
+from itertools import accumulate
+
+from mutato.core import configure_logging, Enforcer, Instrumentation
+from mutato.parser.dmo.core import TokenWindows
 
 class HierarchyMatchFinder(object):
     """ Use Token Hierarchies to Find Matches """
 
-    def __init__(self):
+    def __init__(self,
+                 instrumentation: Instrumentation | None = None):
         """
         Created:
             14-Feb-2022
             craigtrim@gmail.com
             *   https://github.com/grafflr/graffl-core/issues/188
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   evaluate each token once into a validity mask, and list qualifying
+                windows from prefix sums instead of re-extracting and re-checking every window
+            *   scan (start, end) ranges over a 'token-windows' view
+            *   accept token records as well as dicts
+            *   return each window with its start, and splice a swap into the mask and
+                prefix sums in place
+            *   a compact swap (no 'swaps.tokens') counts as having no children
+
+        Args:
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
+        self._instrumentation = instrumentation or Instrumentation()
+        self._debug = self._instrumentation.debug
+        self._metrics = self._instrumentation.metrics
 
-    def _filter(self,
-                window: list) -> list:
-        results = []
+    def is_valid(self,
+                 d_token: dict) -> bool:
+        """ Check if a Token can take part in a Hierarchy Match
 
-        for candidates in window:
+        Args:
+            d_token (dict): a token
 
-            # print ("candidates: ---> ", [x['normal'] for x in candidates])
+        Returns:
+            bool: True if the token (or a token it swapped) has ancestors or descendants
+        """
 
-            def is_valid(d_token: dict) -> bool:
+        if 'ancestors' in d_token and len(d_token['ancestors']):
+            return True
 
-                # from pprint import pprint
-                # print ('\n'*3)
-                # pprint (d_token)
-                # print ('\n'*3)
+        if 'descendants' in d_token and len(d_token['descendants']):
+            return True
 
-                if 'ancestors' in d_token and len(d_token['ancestors']):
-                    return True
+        if 'swaps' in d_token:
 
-                if 'descendants' in d_token and len(d_token['descendants']):
-                    return True
+            if self._debug:
+                Enforcer.is_str(d_token['swaps']['type'])
 
-                if 'swaps' in d_token:
+            if d_token['swaps']['type'] == 'hierarchy':
+                return False
 
-                    if isEnabledForDebug(self.logger):
-                        Enforcer.is_str(d_token['swaps']['type'])
+            # a compact swap (provenance='compact') carries no child tokens
+            for child in d_token['swaps'].get('tokens', ()):
 
-                    if d_token['swaps']['type'] == 'hierarchy':
-                        return False
+                if self._debug:
+                    Enforcer.is_mapping(child)
 
-                    for child in d_token['swaps']['tokens']:
+                if 'ancestors' in child and len(child['ancestors']):
+                    return True
 
-                        if isEnabledForDebug(self.logger):
-                            Enforcer.is_dict(child)
+                if 'descendants' in child and len(child['descendants']):
+                    return True
 
-                        if 'ancestors' in child and len(child['ancestors']):
-                            return True
+        return False
 
-                        if 'descendants' in child and len(child['descendants']):
-                            return True
+    def mask(self,
+             tokens: list) -> list[bool]:
+        """ Evaluate every Token once
 
-                # print ("is not valid ... ", d_token['normal'])
-                return False
+        Args:
+            tokens (list): the tokens
 
-            has_valid_tokens = len([token for token
-                                    in candidates if is_valid(token)])
+        Returns:
+            list[bool]: the validity of each token
+        """
+        return [self.is_valid(token) for token in tokens]
 
-            if has_valid_tokens:
-                results.append(candidates)
+    @staticmethod
+    def prefix_sums(mask: list[bool]) -> list[int]:
+        """ Running Count of Valid Tokens
 
-        return results
+        Args:
+            mask (list[bool]): the validity of each token
 
-    def _process(self,
-                 tokens: list,
-                 gram_size: int) -> list:
+        Returns:
+            list[int]: prefix[i] is the number of valid tokens before position i
+        """
+        return list(accumulate(mask, initial=0))
+
+    @staticmethod
+    def splice(mask: list[bool],
+               prefix: list[int],
+               start: int,
+               end: int,
+               valid: bool) -> None:
+        """ Replace a Range of the Mask with one Token, in place
+
+        The prefix sums up to 'start' are unchanged; the rest shift by the change in valid tokens.
+
+        Args:
+            mask (list[bool]): the validity of each token
+            prefix (list[int]): prefix sums of the mask
+            start (int): the first replaced position
+            end (int): one past the last replaced position
+            valid (bool): the validity of the replacement token
+        """
+        delta = valid - (prefix[end] - prefix[start])
 
-        window = SlidingWindowExtract(
-            tokens=tokens,
-            gram_size=gram_size).process()
+        mask[start:end] = [valid]
+        prefix[start + 1:end + 1] = [prefix[start] + valid]
 
-        return self._filter(window)
+        if delta:
+            for i in range(start + 2, len(prefix)):
+                prefix[i] += delta
+
+    def _process(self,
+                 windows: TokenWindows,
+                 gram_size: int,
+                 prefix: list[int],
+                 first: int,
+                 last: int) -> list:
+
+        ranges = [
+            (start, end)
+            for start, end in windows.ranges(gram_size, first, last)
+        ]
+
+        if self._metrics is not None and ranges:
+            self._metrics.inc('mutato_windows_examined_total',
+                              len(ranges), stage='hierarchy')
+
+        # a window qualifies if it holds at least one valid token
+        return [
+            (start, windows.tokens_at(start, end))
+            for start, end in ranges
+            if prefix[end] > prefix[start]
+        ]
 
     def process(self,
                 tokens: list,
-                gram_size: int) -> list:
-        Enforcer.is_list(tokens)
+                gram_size: int,
+                prefix: list[int] | None = None,
+                first: int = 0,
+                last: int | None = None) -> list:
+        """ Find the Windows that hold at least one valid Token
+
+        Args:
+            tokens (list): the tokens
+            gram_size (int): the window size
+            prefix (list[int], optional): prefix sums from prefix_sums(). Defaults to None (computed here).
+            first (int, optional): the first window start to consider. Defaults to 0.
+            last (int, optional): the last window start to consider. Defaults to None (the last window).
+
+        Returns:
+            list: the (start, tokens) of each qualifying window, left to right
+        """
+        if self._instrumentation.validate:
+            Enforcer.is_list(tokens)
+
+        sw = self._instrumentation.stopwatch()
 
-        sw = Stopwatch()
+        if prefix is None:
+            prefix = self.prefix_sums(self.mask(tokens))
 
-        swaps = self._process(tokens=tokens,
-                              gram_size=gram_size)
+        swaps = self._process(windows=TokenWindows(tokens),
+                              gram_size=gram_size,
+                              prefix=prefix,
+                              first=first,
+                              last=last)
 
-        if isEnabledForDebug(self.logger):
+        if self._debug:
             self.logger.debug(
                 f"Hierarchy Match Finding Completed in {str(sw)}")
 
@@ -7,13 +7,14 @@ import itertools
 
 from mutato.parser.dmo import SwapTokenGenerator
 from mutato.finder.multiquery.bp import FindOntologyData
-from mutato.core import configure_logging, Enforcer, Stopwatch, isEnabledForDebug
+from mutato.core import configure_logging, Enforcer, Instrumentation, Deadline
 
 class HierarchyMatchSwapper(object):
     """ Perform Synonym Swapping with Hierarchal Matches """
 
     def __init__(self,
-                 find_ontology_data: FindOntologyData):
+                 find_ontology_data: FindOntologyData,
+                 instrumentation: Instrumentation | None = None):
         """ Change Log
 
         Created:
@@ -30,14 +31,25 @@ class HierarchyMatchSwapper(object):
             craigtrim@gmail.com
             *   remove 'ontologies' and integrate 'find-ontology-data'
                 https://github.com/grafflr/deepnlu/issues/13
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   splice the swap in by position instead of two scans by id
+            *   return the swap token and its window start; the caller applies it in place
+            *   a compact swap (no 'swaps.tokens') has no children to draw surface forms from
 
         Args:
             find_ontology_data (FindOntologyData): an instantiation of this object
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
+        self._instrumentation = instrumentation or Instrumentation()
+        self._metrics = self._instrumentation.metrics
         self._exists = find_ontology_data.entity_exists
         self._create_swap = SwapTokenGenerator(
-            find_ontology_data.ontologies()).process
+            find_ontology_data.ontologies(),
+            instrumentation=self._instrumentation).process
 
     @staticmethod
     def _cartesian(matches: list) -> list:
@@ -72,7 +84,8 @@ class HierarchyMatchSwapper(object):
                     [s.add(x) for x in token['descendants']]
 
                 if 'swaps' in token:
-                    children = token['swaps']['tokens']
+                    # a compact swap (provenance='compact') carries no child tokens
+                    children = token['swaps'].get('tokens', ())
 
                     for child in [x for x in children
                                   if 'descendants' in x]:
@@ -89,95 +102,79 @@ class HierarchyMatchSwapper(object):
         return matches
 
     def _perform_swap(self,
-                      tokens: list,
-                      gram_size: int,
                       match_text: str,
-                      candidates: list) -> list:
+                      candidates: list) -> dict:
 
         def ner() -> str:
             if 'ner' in candidates[0]:
                 return candidates[0]['ner']
             return candidates[0]['ent']
 
-        d_swap = self._create_swap(normal=match_text,
-                                   canon=match_text,
-                                   ner=ner(),
-                                   tokens=candidates,
-                                   swap_type='hierarchy',
-                                   confidence=75.0)
-
-        def prior_tokens() -> list:
-            results = []
-            for token in tokens:
-                if token['id'] != candidates[0]['id']:
-                    results.append(token)
-                else:
-                    return results
-            raise ValueError
-
-        def post_tokens() -> list:
-            results = []
-
-            is_post = False
-            for token in tokens:
-                if is_post:
-                    results.append(token)
-                if token['id'] == candidates[-1]['id']:
-                    is_post = True
-
-            return results
-
-        normalized = prior_tokens()
-        normalized.append(d_swap)
-        [normalized.append(x) for x in post_tokens()]
-
-        return normalized
+        return self._create_swap(normal=match_text,
+                                 canon=match_text,
+                                 ner=ner(),
+                                 tokens=candidates,
+                                 swap_type='hierarchy',
+                                 confidence=75.0)
 
     def _process(self,
-                 tokens: list,
-                 gram_size: int,
-                 list_of_candidates: list) -> list:
+                 list_of_candidates: list,
+                 deadline: Deadline | None = None) -> tuple | None:
 
-        for candidates in list_of_candidates:
+        for start, candidates in list_of_candidates:
 
             matches = self._surface_forms(candidates)
             if not matches or not len(matches):
                 continue
 
-            for match in self._cartesian(matches):
+            # a budgeted parse walks the product lazily, so it can stop part-way
+            if deadline is None:
+                product = self._cartesian(matches)
+            else:
+                product = itertools.product(*matches)
+
+            for match in product:
+
+                if deadline is not None and deadline.expired():
+                    deadline.degrade('hierarchy')
+                    return None
+
                 match_text = '_'.join(match).strip().lower()
+
+                if self._metrics is not None:
+                    self._metrics.inc('mutato_cartesian_probes_total')
+
                 if not self._exists(match_text):
                     continue
 
-                results = self._perform_swap(
-                    tokens=tokens,
-                    gram_size=gram_size,
-                    match_text=match_text,
-                    candidates=candidates
-                )
+                return start, self._perform_swap(match_text, candidates)
 
-                if results:
-                    return results
-                
-        return tokens
+        return None
 
     def process(self,
-                tokens: list,
-                gram_size: int,
-                list_of_candidates: list) -> list:
+                list_of_candidates: list,
+                deadline: Deadline | None = None) -> tuple | None:
+        """ Find the first Window with a Hierarchy Match
+
+        Args:
+            list_of_candidates (list): the (start, tokens) windows from 'HierarchyMatchFinder'
+            deadline (Deadline, optional): stop early and flag the deadline once it expires. Defaults to None.
+
+        Returns:
+            tuple | None: the window start and the swap token, if any
+        """
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             Enforcer.is_list(list_of_candidates)
 
-        sw = Stopwatch()
+        sw = self._instrumentation.stopwatch()
 
-        swaps = self._process(
-            tokens=tokens,
-            gram_size=gram_size,
-            list_of_candidates=list_of_candidates)
+        swap = self._process(
+            list_of_candidates=list_of_candidates,
+            deadline=deadline)
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             self.logger.debug(
-                f"Hierarchy Match Swapping Completed: ({len(swaps)}) in {str(sw)}")
+                f"Hierarchy Match Swapping Completed: ({swap is not None}) in {str(sw)}")
 
-        return swaps
+        return swap
@@ -6,7 +6,7 @@
 from mutato.parser.dmo.spans import SpanContentCheck
 from mutato.parser.dmo.spans import SpanContextCheck
 from mutato.parser.dmo.spans import SpanDistanceCheck
-from mutato.core import configure_logging, Stopwatch, isEnabledForDebug
+from mutato.core import configure_logging, Instrumentation
 
 class SpanMatchFinder(object):
     """ Find Candidate Span Matches
@@ -16,7 +16,8 @@ class SpanMatchFinder(object):
 
     def __init__(self,
                  d_spans: dict,
-                 span_keys: list):
+                 span_keys: list,
+                 instrumentation: Instrumentation | None = None):
         """_summary_
 
         Created:
@@ -29,14 +30,27 @@ class SpanMatchFinder(object):
             craigtrim@gmail.com
             *   pass in-memory dictionaries in pursuit of
                 https://github.com/grafflr/deepnlu/issues/13
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   compile the span rules once at construction
+            *   build the distance and context checks once, with the shared instrumentation
 
         Args:
             d_spans (dict): full dictionary of span data
             span_keys (list): span dictionary keys sorted by length
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
-        self._d_spans = d_spans
-        self._span_keys = span_keys
+        self._instrumentation = instrumentation or Instrumentation()
+        self._span_content_check = SpanContentCheck(
+            d_rules=d_spans,
+            rule_keys=span_keys).process
+        self._span_distance_check = SpanDistanceCheck(
+            instrumentation=self._instrumentation).process
+        self._span_context_check = SpanContextCheck(
+            instrumentation=self._instrumentation).process
 
     def _process(self,
                  tokens: list) -> list:
@@ -44,9 +58,7 @@ class SpanMatchFinder(object):
         # ----------------------------------------------------------
         # Find Candidate Spans via Content Matching
         # ----------------------------------------------------------
-        matching_rules = SpanContentCheck(
-            d_rules=self._d_spans,
-            rule_keys=self._span_keys).process(tokens)
+        matching_rules = self._span_content_check(tokens)
 
         if not matching_rules or not len(matching_rules):
             return None
@@ -54,8 +66,7 @@ class SpanMatchFinder(object):
         # ----------------------------------------------------------
         # Filter Candidate Spans via Distance Analysis
         # ----------------------------------------------------------
-        matching_rules = SpanDistanceCheck(
-            d_rules=matching_rules).process(tokens)
+        matching_rules = self._span_distance_check(matching_rules, tokens)
 
         if not matching_rules or not len(matching_rules):
             return None
@@ -63,8 +74,7 @@ class SpanMatchFinder(object):
         # ----------------------------------------------------------
         # Filter Candidate Spans via Context Analysis
         # ----------------------------------------------------------
-        matching_rules = SpanContextCheck(
-            d_rules=matching_rules).process(tokens)
+        matching_rules = self._span_context_check(matching_rules, tokens)
 
         if not matching_rules or not len(matching_rules):
             return None
@@ -73,11 +83,11 @@ class SpanMatchFinder(object):
 
     def process(self,
                 tokens: list) -> list:
-        sw = Stopwatch()
+        sw = self._instrumentation.stopwatch()
 
         results = self._process(tokens)
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
 
             def total_results() -> int:
                 if results:
@@ -3,7 +3,7 @@
 """ Perform Synonym Swapping with Spanned Matches """
 
 
-from mutato.core import configure_logging
+from mutato.core import configure_logging, Instrumentation
 from mutato.parser.dmo.core import SwapTokenGenerator
 from mutato.finder.multiquery.bp import FindOntologyData
 
@@ -11,7 +11,8 @@ class SpanMatchSwapper(object):
     """ Perform Synonym Swapping with Spanned Matches """
 
     def __init__(self,
-                 find_ontology_data: FindOntologyData):
+                 find_ontology_data: FindOntologyData,
+                 instrumentation: Instrumentation | None = None):
         """ Change Log
 
         Created:
@@ -29,18 +30,37 @@ class SpanMatchSwapper(object):
             craigtrim@gmail.com
             *   remove 'ontologies' and integrate 'find-ontology-data'
                 https://github.com/grafflr/deepnlu/issues/13
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   apply every matching rule in one pass (previously only the first)
 
         Args:
             find_ontology_data (FindOntologyData): an instantiation of this object
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
         self._find_ner = find_ontology_data.find_ner
         self._create_swap = SwapTokenGenerator(
-            find_ontology_data.ontologies()).process
+            find_ontology_data.ontologies(),
+            instrumentation=instrumentation).process
 
     def process(self,
-                tokens: list,
-                matching_rules: list) -> list:
+                 tokens: list,
+                 matching_rules: list) -> list:
+        """ Apply every Matching Rule in a single Pass
+
+        Args:
+            tokens (list): the input tokens
+            matching_rules (list): non-overlapping rules ordered left to right
+
+        Returns:
+            list: the tokens with each matched span collapsed into a swap
+        """
+
+        normalized = []
+        cursor = 0
 
         for matching_rule in matching_rules:
 
@@ -71,8 +91,10 @@ class SpanMatchSwapper(object):
                                        tokens=subset,
                                        swap_type='spans')
 
-            normalized = tokens[:x]
+            normalized.extend(tokens[cursor:x])
             normalized.append(d_swap)
-            [normalized.append(x) for x in tokens[y:]]
+            cursor = y
+
+        normalized.extend(tokens[cursor:])
 
-            return normalized
+        return normalized
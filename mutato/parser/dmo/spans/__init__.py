@@ -1,3 +1,5 @@
+from .span_rule_index import SpanRuleIndex
 from .span_content_check import SpanContentCheck
 from .span_context_check import SpanContextCheck
 from .span_distance_check import SpanDistanceCheck
+from .span_match_selector import SpanMatchSelector
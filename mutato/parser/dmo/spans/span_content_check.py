@@ -3,6 +3,7 @@
 
 
 from mutato.core import configure_logging, Stopwatch, isEnabledForDebug
+from mutato.parser.dmo.spans.span_rule_index import SpanRuleIndex
 
 class SpanContentCheck(object):
     """ 
@@ -32,27 +33,19 @@ class SpanContentCheck(object):
             craigtrim@gmail.com
             *   strip erronenous whitespace
                 https://github.com/Maryville-University-DLX/transcriptiq/issues/351#issuecomment-2435992591
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   match against a 'span-rule-index' compiled once, instead of checking
+                (and rewriting the content of) every rule on each call
 
         Args:
             d_rules (dict): A dictionary mapping tokens to their corresponding rules.
             rule_keys (set): A set of rule keys.
         """
         self.logger = configure_logging(__name__)
-        self._d_rules = d_rules
         self.rule_keys = rule_keys
-
-    # -----------------------------------------------------------------------------
-    @staticmethod
-    def _cleanse(value: str) -> str:
-        # Purpose:  Strip erronenous Whitespace
-        # Issue:    https://github.com/Maryville-University-DLX/transcriptiq/issues/351
-        #           issuecomment-2435992591
-        # Updated:  24-Oct-2024
-        # -----------------------------------------------------------------------------
-        while '  ' in value:
-            value = value.replace('  ', ' ')
-        return value.strip()
-    # -----------------------------------------------------------------------------
+        self._rule_index = SpanRuleIndex(d_rules, rule_keys)
 
     def _process(self,
                  tokens: list[dict]) -> list[dict]:
@@ -69,32 +62,11 @@ class SpanContentCheck(object):
         # Create a set of normal form tokens.
         token_keys = {token['normal'] for token in tokens}
 
-        # Find common tokens between token_keys and rule_keys.
-        common_tokens = token_keys.intersection(self.rule_keys)
-
-        # If no common tokens, return an empty list.
-        if not common_tokens:
-            return []
-
-        matching_rules = []
-
-        # Iterate over the common tokens.
-        for token in common_tokens:
-            for rule in self._d_rules[token]:
-
-                # If the rule content is a subset of the token keys, add the rule to the matching rules.
-                if set(rule['content']).issubset(token_keys):
-
-                    # Create a unique set of rule contents and sort them.
-                    rule['content'] = sorted(set([
-                        self._cleanse(token)
-                        for token in [token] + rule['content']
-                    ]), key=len)
-
-                    # Add the rule to the matching rules.
-                    matching_rules.append(rule)
-
-        return matching_rules
+        # Each match is a copy; the compiled rules are shared and never mutated.
+        return [
+            self._rule_index.rule(rule_id)
+            for rule_id in self._rule_index.match(token_keys)
+        ]
 
     def process(self,
                 tokens: list[dict]) -> list[dict]:
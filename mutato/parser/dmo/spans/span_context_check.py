@@ -3,7 +3,7 @@
 """ Filter Candidate Span Matches by Context """
 
 
-from mutato.core import configure_logging, Stopwatch, isEnabledForDebug
+from mutato.core import configure_logging, Instrumentation
 
 class SpanContextCheck(object):
     """Filter Candidate Span Matches by Context
@@ -23,23 +23,31 @@ class SpanContextCheck(object):
     """
 
     def __init__(self,
-                 d_rules: dict):
+                 instrumentation: Instrumentation | None = None):
         """
         Created:
             20-Oct-2021
             craigtrim@gmail.com
             *   https://github.com/grafflr/graffl-core/issues/70
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   build once per pipeline; resolve logging and timing via 'instrumentation'
+
+        Args:
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
-        self._d_rules = d_rules
+        self._instrumentation = instrumentation or Instrumentation()
 
     def _process(self,
+                 d_rules: list,
                  tokens: list) -> list:
 
         normal = None
 
         matching_rules = []
-        for d_rule in self._d_rules:
+        for d_rule in d_rules:
 
             def has_context_requirement() -> bool:
                 if 'context' not in d_rule:
@@ -68,13 +76,23 @@ class SpanContextCheck(object):
         return matching_rules
 
     def process(self,
+                d_rules: list,
                 tokens: list) -> list:
+        """ Keep the Rules whose Context is in the Tokens
+
+        Args:
+            d_rules (list): the candidate rules
+            tokens (list): the tokens
+
+        Returns:
+            list: the rules without a context requirement, or whose context is present
+        """
 
-        sw = Stopwatch()
+        sw = self._instrumentation.stopwatch()
 
-        matching_rules = self._process(tokens)
+        matching_rules = self._process(d_rules, tokens)
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             self.logger.debug(
                 f"Span Context Check Completed for {len(matching_rules)} rules in {str(sw)}")
 
@@ -3,7 +3,9 @@
 """ Filter Candidate Span Matches by Distance """
 
 
-from mutato.core import configure_logging, Stopwatch, isEnabledForDebug
+from itertools import product
+
+from mutato.core import configure_logging, Instrumentation
 
 class SpanDistanceCheck(object):
     """Filter Candidate Span Matches by Distance
@@ -34,59 +36,124 @@ class SpanDistanceCheck(object):
     -   Each rule will have a `content` attribute that lists the required tokens
         in natural order of occurence
     -   If the reverse attribute is set to True, the natural order can be disregarded
+
+    The Output is one candidate per placement of a rule in the input
+    (a copy of the rule with 'delta' and 'positions'); repeated tokens
+    may produce several candidates for the same rule.
     """
 
     def __init__(self,
-                 d_rules: dict):
+                 instrumentation: Instrumentation | None = None):
         """
         Created:
             20-Oct-2021
             craigtrim@gmail.com
             *   https://github.com/grafflr/graffl-core/issues/70
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   track every occurrence of a token, not just the last one;
+                a rule yields one candidate per valid placement
+            *   build once per pipeline; resolve logging and timing via 'instrumentation'
+
+        Args:
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
-        self._d_rules = d_rules
+        self._instrumentation = instrumentation or Instrumentation()
+
+    @staticmethod
+    def _nearest(anchor: int,
+                 candidates: list[int]) -> int:
+        return min(candidates, key=lambda i: (abs(anchor - i), i))
+
+    def _placements(self,
+                    d_rule: dict,
+                    d_token_pos: dict[str, list[int]]):
+        """ Yield every Placement of a Rule within its Distance
+
+        The first and last required tokens are paired over all of their occurrences
+        (subject to the rule distance and direction).  Any other required token may
+        take each of its occurrences within the distance of either end, or else the
+        occurrence nearest to the first.
+        """
+        content = d_rule['content']
+        distance = d_rule['distance']
 
-    def _process(self,
-                 tokens: list) -> list:
+        def is_valid(delta: int) -> bool:
+            if abs(delta) > distance:
+                return False
+            if delta < 0 and not d_rule['reverse']:
+                return False
+            if delta > 0 and not d_rule['forward']:
+                return False
+            return True
+
+        def middle(first: int, last: int) -> list[list[int]]:
+            results = []
+            for token in content[1:-1]:
+                occurrences = d_token_pos[token]
+                nearby = [
+                    i for i in occurrences
+                    if abs(first - i) <= distance or abs(last - i) <= distance
+                ]
+                results.append(nearby or [self._nearest(first, occurrences)])
+            return results
 
-        d_token_pos = {}
-        for i in range(len(tokens)):
-            d_token_pos[tokens[i]['normal']] = i
+        for first in d_token_pos[content[0]]:
 
-        matching_rules = []
-        for d_rule in self._d_rules:
+            if len(content) == 1:
+                yield 0, [first]
+                continue
 
-            positions = [d_token_pos[x] for x in d_rule['content']]
-            delta = positions[0] - positions[-1]
+            for last in d_token_pos[content[-1]]:
+                if not is_valid(first - last):
+                    continue
 
-            if abs(delta) > d_rule['distance']:
-                continue
+                for positions in product(*middle(first, last)):
+                    yield first - last, [first, *positions, last]
 
-            if delta < 0 and not d_rule['reverse']:
-                continue
+    def _process(self,
+                 d_rules: list,
+                 tokens: list) -> list:
 
-            if delta > 0 and not d_rule['forward']:
-                continue
+        d_token_pos = {}
+        for i in range(len(tokens)):
+            d_token_pos.setdefault(tokens[i]['normal'], []).append(i)
 
-            # for debug only, but could be used in confidence levels downstream
-            d_rule['delta'] = delta
+        matching_rules = []
+        for d_rule in d_rules:
+            for delta, positions in self._placements(d_rule, d_token_pos):
+                matching_rules.append({
+                    **d_rule,
 
-            # used in the synonym swapping stage ...
-            d_rule['positions'] = sorted(positions)
+                    # for debug only, but could be used in confidence levels downstream
+                    'delta': delta,
 
-            matching_rules.append(d_rule)
+                    # used in the synonym swapping stage ...
+                    'positions': sorted(positions),
+                })
 
         return matching_rules
 
     def process(self,
+                d_rules: list,
                 tokens: list) -> list:
+        """ Place each Rule in the Tokens
+
+        Args:
+            d_rules (list): the candidate rules
+            tokens (list): the tokens
+
+        Returns:
+            list: one candidate per placement, with 'delta' and 'positions'
+        """
 
-        sw = Stopwatch()
+        sw = self._instrumentation.stopwatch()
 
-        matching_rules = self._process(tokens)
+        matching_rules = self._process(d_rules, tokens)
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             self.logger.debug(
                 f"Span Distance Check Completed for {len(matching_rules)} rules in {str(sw)}")
 
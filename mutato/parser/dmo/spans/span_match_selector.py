@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Select Non-Overlapping Span Matches """
+
+
+from mutato.core import configure_logging, Instrumentation
+
+
+class SpanMatchSelector(object):
+    """ Select Non-Overlapping Span Matches
+
+    Phase 4 in
+        GRAFFL-CORE-0077#issuecomment-947342784
+
+    Candidates are ranked best-first:
+    1.  the most specific canon (the most underscores; COR-137)
+    2.  the most required tokens
+    3.  the span that ends first
+    4.  the narrowest span
+    5.  the order the candidates were found in
+
+    Among equally specific rules, taking the earliest-ending span first
+    keeps the largest number of non-overlapping matches.
+
+    A candidate is accepted if its span (first to last position) does not
+    overlap a span that was already accepted.  The accepted candidates are
+    returned left to right, so all of them can be applied in a single pass.
+    """
+
+    def __init__(self,
+                 instrumentation: Instrumentation | None = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   apply every non-conflicting span in one pass instead of one span per sweep
+            *   build once per pipeline; resolve logging and timing via 'instrumentation'
+
+        Args:
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
+        """
+        self.logger = configure_logging(__name__)
+        self._instrumentation = instrumentation or Instrumentation()
+
+    @staticmethod
+    def _rank(d_rule: dict) -> tuple:
+        positions = d_rule['positions']
+        return (
+            -d_rule['canon'].count('_'),
+            -len(d_rule['content']),
+            positions[-1],
+            positions[-1] - positions[0],
+        )
+
+    def _process(self,
+                 d_rules: list) -> list:
+
+        taken = set()
+        matching_rules = []
+
+        for d_rule in sorted(d_rules, key=self._rank):
+            positions = d_rule['positions']
+            span = range(positions[0], positions[-1] + 1)
+
+            if taken.intersection(span):
+                continue
+
+            taken.update(span)
+            matching_rules.append(d_rule)
+
+        return sorted(matching_rules, key=lambda d_rule: d_rule['positions'][0])
+
+    def process(self,
+                d_rules: list) -> list:
+        """ Select the Non-Overlapping Matches
+
+        Args:
+            d_rules (list): candidate rules with 'positions'
+
+        Returns:
+            list: the accepted rules, left to right
+        """
+
+        sw = self._instrumentation.stopwatch()
+
+        matching_rules = self._process(d_rules)
+
+        if self._instrumentation.debug:
+            self.logger.debug(
+                f"Span Match Selection Completed for {len(matching_rules)} rules in {str(sw)}")
+
+        return matching_rules
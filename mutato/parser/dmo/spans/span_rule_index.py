@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Inverted Index of Span Rules """
+
+
+from mutato.core import configure_logging
+
+
+class SpanRuleIndex(object):
+    """ Inverted Index of Span Rules
+
+    The span rules are compiled once into an immutable index:
+    -   each rule is assigned an id and its required tokens are cleansed, de-duplicated and sorted
+    -   each required token points to the ids of the rules that need it
+
+    A match is a counter per rule id; a rule matches when every one of its required
+    tokens has been seen in the input.  Work is proportional to the rules touched
+    by the input rather than to the size of the rule set.
+
+    Compiled rules are never mutated, so one index can be shared by concurrent callers.
+    """
+
+    def __init__(self,
+                 d_rules: dict[str, list[dict]],
+                 rule_keys: list[str] | set[str] | None = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   compile span rules once instead of re-checking (and mutating) every rule per call
+
+        Args:
+            d_rules (dict): A dictionary mapping tokens to their corresponding rules.
+            rule_keys (list | set, optional): restrict the index to these rule keys. Defaults to None (all keys).
+        """
+        self.logger = configure_logging(__name__)
+
+        self._rules: tuple[dict, ...] = ()
+        self._sizes: tuple[int, ...] = ()
+        self._d_index: dict[str, tuple[int, ...]] = {}
+
+        self._compile(d_rules or {}, rule_keys)
+
+    # -----------------------------------------------------------------------------
+    @staticmethod
+    def _cleanse(value: str) -> str:
+        # Purpose:  Strip erronenous Whitespace
+        # Issue:    https://github.com/Maryville-University-DLX/transcriptiq/issues/351
+        #           issuecomment-2435992591
+        # Updated:  24-Oct-2024
+        # -----------------------------------------------------------------------------
+        while '  ' in value:
+            value = value.replace('  ', ' ')
+        return value.strip()
+    # -----------------------------------------------------------------------------
+
+    def _compile(self,
+                 d_rules: dict[str, list[dict]],
+                 rule_keys: list[str] | set[str] | None) -> None:
+
+        if rule_keys is None:
+            rule_keys = d_rules.keys()
+
+        rules = []
+        sizes = []
+        d_index = {}
+
+        for key in rule_keys:
+            for rule in d_rules.get(key, []):
+
+                # The rule key is itself a required token
+                content = sorted(set([
+                    self._cleanse(token)
+                    for token in [key] + list(rule['content'])
+                ]), key=len)
+
+                rule_id = len(rules)
+                rules.append({**rule, 'content': content})
+                sizes.append(len(content))
+
+                for token in content:
+                    d_index.setdefault(token, []).append(rule_id)
+
+        self._rules = tuple(rules)
+        self._sizes = tuple(sizes)
+        self._d_index = {k: tuple(v) for k, v in d_index.items()}
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def tokens(self) -> set[str]:
+        """ Return every Token required by at least one Rule
+
+        Returns:
+            set[str]: the indexed tokens
+        """
+        return set(self._d_index)
+
+    def rule(self,
+             rule_id: int) -> dict:
+        """ Return a copy of a Compiled Rule
+
+        Args:
+            rule_id (int): the rule id
+
+        Returns:
+            dict: the rule, with 'content' holding every required token
+        """
+        rule = self._rules[rule_id]
+        return {**rule, 'content': list(rule['content'])}
+
+    def match(self,
+              token_keys: set[str]) -> list[int]:
+        """ Find the Rules whose Required Tokens are all present
+
+        Args:
+            token_keys (set[str]): the distinct normal forms in the input
+
+        Returns:
+            list[int]: the matching rule ids in compile order
+        """
+        d_counts = {}
+        matches = []
+
+        for token in token_keys:
+            for rule_id in self._d_index.get(token, ()):
+                count = d_counts.get(rule_id, 0) + 1
+                d_counts[rule_id] = count
+                if count == self._sizes[rule_id]:
+                    matches.append(rule_id)
+
+        return sorted(matches)
@@ -3,6 +3,8 @@
 """ Summarize the Results of a Token Swap """
 
 
+from collections.abc import Mapping
+
 from mutato.core import configure_logging
 
 class SwapResultSummarizer(object):
@@ -16,6 +18,10 @@ class SwapResultSummarizer(object):
             craigtrim@gmail.com
             *   created in pursuit of
                 https://github.com/craigtrim/owl-parser/issues/1
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   accept token records as well as dicts
         """
         self.logger = configure_logging(__name__)
 
@@ -25,22 +31,19 @@ class SwapResultSummarizer(object):
         entities = []
         for result in results:
 
-            t_result = type(result)
-
-            if t_result == dict:
+            if isinstance(result, Mapping):
                 entities.append(result['normal'])
 
-            elif t_result == list:
+            elif type(result) == list:
                 for item in result:
 
-                    t_item = type(item)
-                    if t_item == dict:
+                    if isinstance(item, Mapping):
                         entities.append(item['normal'])
                     else:
-                        raise TypeError(f'Unexpected Type-2: {t_item}')
+                        raise TypeError(f'Unexpected Type-2: {type(item)}')
 
             else:
 
-                raise TypeError(f'Unexpected Type-2: {t_result}')
+                raise TypeError(f'Unexpected Type-2: {type(result)}')
 
         return entities
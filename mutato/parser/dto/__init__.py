@@ -1 +1,6 @@
 from .candidate_synonym_blacklist_kb import d_candidate_synonym_blacklist
+from .swap_result import SwapResult
+from .record import Record
+from .token_record import TokenRecord
+from .swap_record import SwapRecord
+from .swap_token_record import SwapTokenRecord
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Compact Token Record """
+
+
+from abc import abstractmethod
+from collections.abc import Mapping
+
+
+class Record(Mapping):
+    """ Compact Token Record
+
+    A read-only mapping over '__slots__' attributes.
+
+    Records are read like the dicts they replace ('token['normal']', "'swaps' in token"),
+    so the matching passes handle records and dicts alike.  The dict form is only built
+    when 'to_dict()' is called, at the edge of the pipeline.
+    """
+
+    __slots__ = ()
+
+    # the keys, in the order of the dict form
+    _KEYS: tuple[str, ...] = ()
+    _KEY_SET: frozenset[str] = frozenset()
+
+    def __getitem__(self,
+                    key: str) -> object:
+        if key in self._KEY_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self,
+                     key: object) -> bool:
+        return key in self._KEY_SET
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+    @abstractmethod
+    def to_dict(self) -> dict:
+        """ Build the Dict Form
+
+        Returns:
+            dict: the JSON-compatible shape of this record
+        """
+
+    def to_compact_dict(self,
+                        positions: dict[int, int]) -> dict:
+        """ Build the Compact Dict Form
+
+        Args:
+            positions (dict): the position of each input token, keyed by 'id()'
+
+        Returns:
+            dict: the dict form, with swap provenance as index ranges into the input tokens
+        """
+        return self.to_dict()
+
+    @staticmethod
+    def to_dicts(tokens: list,
+                 positions: dict[int, int] | None = None) -> list:
+        """ Build the Dict Form of a Token List
+
+        Args:
+            tokens (list): records and dicts
+            positions (dict, optional): the position of each input token, keyed by 'id()'. Defaults to None.
+                None nests the full replaced tokens in every swap;
+                otherwise swaps record index ranges and a swap chain
+
+        Returns:
+            list: the same tokens as dicts
+        """
+        if positions is None:
+            return [token.to_dict() if isinstance(token, Record) else token
+                    for token in tokens]
+
+        return [token.to_compact_dict(positions) if isinstance(token, Record) else token
+                for token in tokens]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Compact Record of a Swap """
+
+
+from mutato.parser.dto.record import Record
+
+
+class SwapRecord(Record):
+    """ Compact Record of a Swap
+
+    The provenance of a swap token: the tokens it replaced, the canonical form,
+    the swap type, the source ontologies and the confidence.
+
+    Dict form:
+        {'tokens': [...], 'canon': str, 'type': str, 'ontologies': list, 'confidence': float}
+    """
+
+    __slots__ = ('tokens', 'canon', 'type', 'ontologies', 'confidence')
+
+    _KEYS = ('tokens', 'canon', 'type', 'ontologies', 'confidence')
+    _KEY_SET = frozenset(_KEYS)
+
+    def __init__(self,
+                 tokens: list,
+                 canon: str,
+                 type: str,
+                 ontologies: list,
+                 confidence: float):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   compact '__slots__' record in place of a nested dict per swap
+
+        Args:
+            tokens (list): the replaced tokens
+            canon (str): the canonical form
+            type (str): the swap type (e.g., 'exact', 'span', 'hierarchy')
+            ontologies (list): the source ontologies
+            confidence (float): the swap confidence
+        """
+        self.tokens = tokens
+        self.canon = canon
+        self.type = type
+        self.ontologies = ontologies
+        self.confidence = confidence
+
+    def to_dict(self) -> dict:
+        return {
+            'tokens': Record.to_dicts(self.tokens),
+            'canon': self.canon,
+            'type': self.type,
+            'ontologies': self.ontologies,
+            'confidence': self.confidence
+        }
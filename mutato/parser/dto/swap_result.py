@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Swapped Tokens from a Budgeted Parse """
+
+
+class SwapResult(list):
+    """ Swapped Tokens from a Budgeted Parse
+
+    A plain list of swap tokens, flagged when the time budget ran out
+    and span or hierarchy work was skipped.
+
+    Attributes:
+        degraded (bool): True if the result is partial
+        skipped (list): the stages that were skipped or truncated
+    """
+
+    def __init__(self,
+                 swaps: list,
+                 degraded: bool = False,
+                 skipped: list | None = None):
+        super().__init__(swaps)
+        self.degraded = degraded
+        self.skipped = list(skipped or [])
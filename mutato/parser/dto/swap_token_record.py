@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Compact Record of a Swap Token """
+
+
+from mutato.parser.dto.record import Record
+from mutato.parser.dto.swap_record import SwapRecord
+
+
+class SwapTokenRecord(Record):
+    """ Compact Record of a Swap Token
+
+    The token that replaces a matched sequence of tokens.
+    Its 'text' is joined from the replaced tokens on first access.
+
+    Dict form:
+        {'id': ..., 'x': int, 'y': int, 'ner': str, 'text': str, 'normal': str, 'swaps': {...}}
+
+    Compact dict form:
+        the same, with 'swaps.tokens' replaced by
+        'swaps.range'   [start, end) of the replaced input tokens
+        'swaps.chain'   the earlier swaps this swap absorbed, in the order they were made
+    """
+
+    __slots__ = ('id', 'x', 'y', 'ner', '_text', 'normal', 'swaps')
+
+    _KEYS = ('id', 'x', 'y', 'ner', 'text', 'normal', 'swaps')
+    _KEY_SET = frozenset(_KEYS)
+
+    def __init__(self,
+                 id: object,
+                 x: int,
+                 y: int,
+                 ner: str | None,
+                 normal: str,
+                 swaps: SwapRecord,
+                 text: str | None = None):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   compact '__slots__' record in place of a dict per swap token
+            *   add a compact dict form with index-range provenance
+
+        Args:
+            id (object): the id of the first replaced token
+            x (int): the start offset of the first replaced token
+            y (int): the end offset of the last replaced token
+            ner (str): the entity type (if any)
+            normal (str): the normal form
+            swaps (SwapRecord): the swap provenance
+            text (str, optional): the surface text. Defaults to None.
+                None joins the text of the replaced tokens on first access
+        """
+        self.id = id
+        self.x = x
+        self.y = y
+        self.ner = ner
+        self.normal = normal
+        self.swaps = swaps
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = ' '.join(
+                token['text'].strip() for token in self.swaps.tokens)
+        return self._text
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'x': self.x,
+            'y': self.y,
+            'ner': self.ner,
+            'text': self.text,
+            'normal': self.normal,
+            'swaps': self.swaps.to_dict()
+        }
+
+    def _range(self,
+               positions: dict[int, int]) -> list[int]:
+        """ The Input Token Range this Swap covers """
+
+        def position(token: object, edge: int) -> int:
+            # descend through earlier swaps to an input token; every swap made in
+            # this run is a record with 'swaps.tokens', and an input token (even a
+            # re-fed compact swap without them) ends the descent
+            while id(token) not in positions:
+                token = token['swaps']['tokens'][edge]
+            return positions[id(token)]
+
+        return [position(self, 0), position(self, -1) + 1]
+
+    def _chain(self,
+               positions: dict[int, int],
+               chain: list) -> list:
+        """ The Earlier Swaps this Swap absorbed, innermost first """
+        for token in self.swaps.tokens:
+            if id(token) not in positions:
+                token._chain(positions, chain)
+                chain.append({
+                    'range': token._range(positions),
+                    'normal': token.normal,
+                    'ner': token.ner,
+                    'canon': token.swaps.canon,
+                    'type': token.swaps.type,
+                    'confidence': token.swaps.confidence
+                })
+        return chain
+
+    def to_compact_dict(self,
+                        positions: dict[int, int]) -> dict:
+        return {
+            'id': self.id,
+            'x': self.x,
+            'y': self.y,
+            'ner': self.ner,
+            'text': self.text,
+            'normal': self.normal,
+            'swaps': {
+                'range': self._range(positions),
+                'canon': self.swaps.canon,
+                'type': self.swaps.type,
+                'ontologies': self.swaps.ontologies,
+                'confidence': self.swaps.confidence,
+                'chain': self._chain(positions, [])
+            }
+        }
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Compact Record of a Parsed Token """
+
+
+from dataclasses import asdict, is_dataclass
+
+from mutato.parser.dto.record import Record
+
+
+class TokenRecord(Record):
+    """ Compact Record of a Parsed Token
+
+    Wraps a parsed token dataclass (e.g., a lingpatlab 'SpacyResult') instead of
+    copying it into a dict of every field up front.  Fields are read from the
+    token on demand; 'to_dict()' gives the same dict as 'asdict()'.
+    """
+
+    __slots__ = ('_source',)
+
+    def __init__(self,
+                 source: object):
+        """ Change Log
+
+        Created:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   read parsed tokens in place rather than converting each one to a dict
+
+        Args:
+            source (object): a parsed token dataclass
+        """
+        self._source = source
+
+    def __getitem__(self,
+                    key: str) -> object:
+        if key not in self._source.__dataclass_fields__:
+            raise KeyError(key)
+
+        value = getattr(self._source, key)
+        if is_dataclass(value):
+            return asdict(value)
+        return value
+
+    def __contains__(self,
+                     key: object) -> bool:
+        return key in self._source.__dataclass_fields__
+
+    def __iter__(self):
+        return iter(self._source.__dataclass_fields__)
+
+    def __len__(self) -> int:
+        return len(self._source.__dataclass_fields__)
+
+    def to_dict(self) -> dict:
+        return asdict(self._source)
@@ -5,12 +5,16 @@
 
 from mutato.core import (
     Enforcer,
-    Stopwatch,
+    Instrumentation,
     configure_logging,
-    isEnabledForInfo,
-    isEnabledForDebug,
 )
-from mutato.parser.dmo import ExactMatchFinder, ExactMatchSwapper, SwapResultSummarizer
+from mutato.parser.dmo import (
+    ExactMatchFinder,
+    ExactMatchSwapper,
+    OntologyVocabulary,
+    SwapResultSummarizer,
+    TokenLattice
+)
 from mutato.finder.multiquery.bp import FindOntologyData
 
 
@@ -20,7 +24,8 @@ class PerformExactMatching(object):
     _MAX_GRAM_SIZE = 10
 
     def __init__(self,
-                 find_ontology_data: FindOntologyData):
+                 find_ontology_data: FindOntologyData,
+                 instrumentation: Instrumentation | None = None):
         """ Change Log
 
         Created:
@@ -53,64 +58,125 @@ class PerformExactMatching(object):
             ctrim@maryville.edu
             *   increase gram-size to 10
                 https://github.com/Maryville-University-DLX/transcriptiq/issues/324
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   build one 'exact-match-finder' per gram-size up front
+            *   share one 'token-windows' view across gram sizes
+            *   compile the lookup to sets, and skip windows with out-of-vocabulary tokens
+            *   apply swaps in place on a 'token-lattice' and rescan locally,
+                instead of rebuilding the token list and recursing per swap
 
         Args:
             find_ontology_data (FindOntologyData): an instantiation of this object
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
-        self._d_lookup = find_ontology_data.lookup()
+        self._instrumentation = instrumentation or Instrumentation()
+        self._metrics = self._instrumentation.metrics
+        # membership tests against lists are linear; compile each gram size to a set
+        self._d_lookup = {
+            gram_size: set(entries)
+            for gram_size, entries in (find_ontology_data.lookup() or {}).items()
+        }
+        self._vocabulary = OntologyVocabulary(
+            self._d_lookup,
+            find_ontology_data.spans() if find_ontology_data.has_spans() else None)
         self._exact_match_swapper = ExactMatchSwapper(
-            find_ontology_data).process
+            find_ontology_data,
+            instrumentation=self._instrumentation).process
+
+        self._exact_match_finders = {
+            gram_size: ExactMatchFinder(
+                gram_size=gram_size,
+                d_lookup=self._d_lookup,
+                instrumentation=self._instrumentation)
+            for gram_size in range(1, self._MAX_GRAM_SIZE + 1)
+        }
+
+    @staticmethod
+    def _bounds(gram_size: int,
+                swapped: tuple | None,
+                cursors: list[int]) -> tuple:
+        """ Window Starts that may still match
+
+        After a swap of 'n' tokens at position 'x', the windows that do not hold
+        the new token are known failures if they are larger than 'n', or of size 'n'
+        and to the left of 'x'.  Smaller windows to the left of their cursor are
+        known failures from an earlier scan.  Only the rest are rescanned.
+        """
+        if swapped is None:
+            return cursors[gram_size], None
+
+        x, n = swapped
+        if gram_size > n:
+            return x - gram_size + 1, x
+        if gram_size == n:
+            return x - gram_size + 1, None
+        return cursors[gram_size], None
 
     def _process(self,
                  tokens: list) -> list:
 
+        lattice = TokenLattice(tokens, self._vocabulary)
+        swapped = None
+
+        # windows of each size that start before the cursor are known failures
+        cursors = [0] * (self._MAX_GRAM_SIZE + 1)
+
         gram_size = self._MAX_GRAM_SIZE
         while gram_size > 0:
 
-            exact_match_finder = ExactMatchFinder(
-                gram_size=gram_size,
-                d_lookup=self._d_lookup).process
+            if self._metrics is not None:
+                self._metrics.inc('mutato_gram_size_iterations_total', stage='exact')
+
+            first, last = self._bounds(gram_size, swapped, cursors)
+            contiguous = swapped is None or gram_size < swapped[1]
 
-            results = exact_match_finder(tokens)
+            match = self._exact_match_finders[gram_size].leftmost(
+                lattice.windows(), first, last)
 
-            if not results:
+            if not match:
+                if contiguous:
+                    cursors[gram_size] = len(lattice)
                 gram_size -= 1
                 continue
 
-            for exact_match in results:
+            # -----------------------------------------------------------
+            # Purpose:  Swap the leftmost match, then restart from the largest gram size
+            # Issue:    https://github.com/craigtrim/owl-parser/issues/10
+            #           issuecomment-1331531086
+            # Updated:  19-Oct-2026
+            #           swap in place and rescan only the windows that may have changed
+            # -----------------------------------------------------------
+            start, end = match
+            if contiguous:
+                cursors[gram_size] = start
 
-                d_swap = self._exact_match_swapper(exact_match)
-                ids = [x['id'] for x in d_swap['swaps']['tokens']]
+            d_swap = self._exact_match_swapper(lattice.tokens[start:end])
+            lattice.replace(start, end, d_swap)
 
-                merged = []
-                for token in tokens:
-                    if token['id'] not in ids:
-                        merged.append(token)
-                    elif token['id'] == ids[0]:
-                        merged.append(d_swap)
+            # windows that overlap the swap (or lie beyond it) are no longer known
+            for size in range(1, self._MAX_GRAM_SIZE + 1):
+                cursors[size] = min(cursors[size], max(0, start - size + 1))
 
-                # -----------------------------------------------------------
-                # Purpose:  Use Early Return
-                # Issue:    https://github.com/craigtrim/owl-parser/issues/10
-                #           issuecomment-1331531086
-                # Updated:  29-Nov-2022
-                # -----------------------------------------------------------
-                return self._process(merged)
+            swapped = (start, end - start)
+            gram_size = self._MAX_GRAM_SIZE
 
-        return tokens
+        return lattice.to_list()
 
     def process(self,
                 tokens: list) -> list:
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             Enforcer.is_list(tokens)
 
-        sw = Stopwatch()
+        sw = self._instrumentation.stopwatch()
 
         swaps = self._process(tokens)
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             summary = SwapResultSummarizer().process(swaps)
             self.logger.debug(
                 f"Exact Swapping Completed: ({summary}) in {str(sw)}")
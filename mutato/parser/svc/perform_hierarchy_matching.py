@@ -4,8 +4,8 @@
 
 
 from mutato.finder.multiquery.bp import FindOntologyData
-from mutato.parser.dmo import HierarchyMatchFinder, HierarchyMatchSwapper
-from mutato.core import configure_logging, Stopwatch, Enforcer, isEnabledForDebug
+from mutato.parser.dmo import HierarchyMatchFinder, HierarchyMatchSwapper, TokenLattice
+from mutato.core import configure_logging, Enforcer, Instrumentation, Deadline
 
 class PerformHierarchyMatching(object):
     """ Use Token Hierarchies to perform Inferred Matching """
@@ -13,7 +13,8 @@ class PerformHierarchyMatching(object):
     _MAX_GRAM_SIZE = 9
 
     def __init__(self,
-                 find_ontology_data: FindOntologyData):
+                 find_ontology_data: FindOntologyData,
+                 instrumentation: Instrumentation | None = None):
         """ Change Log
 
         Created:
@@ -30,51 +31,124 @@ class PerformHierarchyMatching(object):
             craigtrim@gmail.com
             *   remove 'ontologies' and integrate 'find-ontology-data'
                 https://github.com/grafflr/deepnlu/issues/13
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   build a validity mask once per token list, and after a swap rescan
+                only the windows around the new token instead of restarting
+            *   apply each swap in place at its window start, and splice the mask and
+                prefix sums instead of rebuilding them
 
         Args:
             find_ontology_data (FindOntologyData): an instantiation of this object
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
-        self._finder = HierarchyMatchFinder().process
-        self._swapper = HierarchyMatchSwapper(find_ontology_data).process
+        self._instrumentation = instrumentation or Instrumentation()
+        self._metrics = self._instrumentation.metrics
+        finder = HierarchyMatchFinder(
+            instrumentation=self._instrumentation)
+        self._finder = finder.process
+        self._is_valid = finder.is_valid
+        self._mask = finder.mask
+        self._prefix_sums = finder.prefix_sums
+        self._splice = finder.splice
+        self._swapper = HierarchyMatchSwapper(
+            find_ontology_data,
+            instrumentation=self._instrumentation).process
+
+    @staticmethod
+    def _bounds(gram_size: int,
+                size: int,
+                swapped: tuple | None) -> tuple:
+        """ Window Starts that may still match
+
+        After a swap of 'n' tokens at position 'x', the windows that do not hold
+        the new token are known failures if they are larger than 'n', or of size 'n'
+        and to the left of 'x'; only the rest are rescanned.
+        """
+        if swapped is None:
+            return 0, size - gram_size
+
+        x, n = swapped
+        if gram_size > n:
+            return x - gram_size + 1, x
+        if gram_size == n:
+            return x - gram_size + 1, size - gram_size
+        return 0, size - gram_size
 
     def _process(self,
-                 tokens: list) -> tuple:
+                 tokens: list,
+                 deadline: Deadline | None) -> list:
+
+        lattice = TokenLattice(tokens)
+        mask = self._mask(lattice.tokens)
+        prefix = self._prefix_sums(mask)
+        swapped = None
 
         gram_size = self._MAX_GRAM_SIZE
         while gram_size > 1:  # GRAFFLR-188-1039702022; No Unigrams!
 
+            if deadline is not None and deadline.expired():
+                deadline.degrade('hierarchy')
+                return lattice.to_list()
+
+            if self._metrics is not None:
+                self._metrics.inc('mutato_gram_size_iterations_total', stage='hierarchy')
+
+            first, last = self._bounds(gram_size, len(lattice), swapped)
+
             list_of_candidates = self._finder(
-                tokens=tokens,
-                gram_size=gram_size)
+                tokens=lattice.tokens,
+                gram_size=gram_size,
+                prefix=prefix,
+                first=first,
+                last=last)
 
             if len(list_of_candidates):
 
-                results = self._swapper(
-                    tokens=tokens,
-                    gram_size=gram_size,
-                    list_of_candidates=list_of_candidates)
+                swap = self._swapper(
+                    list_of_candidates=list_of_candidates,
+                    deadline=deadline)
 
-                if results is not None:
-                    return results, True
+                if swap is not None:
+
+                    # the swap replaces 'gram_size' tokens at 'x' with one token
+                    x, d_swap = swap
+                    lattice.replace(x, x + gram_size, d_swap)
+                    self._splice(mask, prefix, x, x + gram_size,
+                                 self._is_valid(d_swap))
+
+                    swapped = (x, gram_size)
+                    gram_size = self._MAX_GRAM_SIZE
+                    continue
 
             gram_size -= 1
 
-        return tokens, False
+        return lattice.to_list()
 
     def process(self,
-                tokens: list) -> list:
+                tokens: list,
+                deadline: Deadline | None = None) -> list:
+        """ Perform Hierarchy Matching
+
+        Args:
+            tokens (list): the tokens from the prior pass
+            deadline (Deadline, optional): stop early and flag the deadline once it expires. Defaults to None.
+
+        Returns:
+            list: the swapped tokens
+        """
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             Enforcer.is_list(tokens)
 
-        sw = Stopwatch()
+        sw = self._instrumentation.stopwatch()
 
-        recurse = True
-        while recurse:
-            tokens, recurse = self._process(tokens)
+        tokens = self._process(tokens, deadline)
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             self.logger.debug(f"Hierarchy Match Completed in {str(sw)}")
 
         return tokens
@@ -4,14 +4,12 @@
 
 
 from mutato.core import (
-    Stopwatch,
     Enforcer,
-    configure_logging,
-    isEnabledForDebug,
-    isEnabledForInfo
+    Instrumentation,
+    configure_logging
 )
 from mutato.finder.multiquery.bp import FindOntologyData
-from mutato.parser.dmo import SpanMatchFinder, SpanMatchSwapper
+from mutato.parser.dmo import SpanMatchFinder, SpanMatchSelector, SpanMatchSwapper
 
 
 class PerformSpanMatching(object):
@@ -31,7 +29,8 @@ class PerformSpanMatching(object):
     """
 
     def __init__(self,
-                 find_ontology_data: FindOntologyData):
+                 find_ontology_data: FindOntologyData,
+                 instrumentation: Instrumentation | None = None):
         """ Change Log
 
         Created:
@@ -53,15 +52,27 @@ class PerformSpanMatching(object):
             craigtrim@gmail.com
             *   choose optimal rule when multiple rules exist
                 https://bast-ai.atlassian.net/browse/COR-137
+        Updated:
+            19-Oct-2026
+            ctrim@maryville.edu
+            *   resolve logging, timing and validation once via 'instrumentation'
+            *   apply every non-overlapping span match in a single pass (best-first)
 
         Args:
             find_ontology_data (FindOntologyData): an instantiation of this object
+            instrumentation (Instrumentation, optional): shared pipeline instrumentation. Defaults to None.
         """
         self.logger = configure_logging(__name__)
+        self._instrumentation = instrumentation or Instrumentation()
         self._span_match_finder = SpanMatchFinder(
             d_spans=find_ontology_data.spans(),
-            span_keys=find_ontology_data.span_keys()).process
-        self._span_match_swapper = SpanMatchSwapper(find_ontology_data)
+            span_keys=find_ontology_data.span_keys(),
+            instrumentation=self._instrumentation).process
+        self._span_match_selector = SpanMatchSelector(
+            instrumentation=self._instrumentation).process
+        self._span_match_swapper = SpanMatchSwapper(
+            find_ontology_data,
+            instrumentation=self._instrumentation)
 
     def _process(self,
                  tokens: list) -> list:
@@ -71,15 +82,9 @@ class PerformSpanMatching(object):
             return tokens
 
         # COR-137-10660
+        # The most specific rule still wins an overlap; every non-conflicting match is kept
         if len(matching_rules) > 1:
-
-            # Use the max function with a key that counts the number of underscores in the canon attribute
-            matching_rules = [
-                max(
-                    matching_rules,
-                    key=lambda rule: rule['canon'].count('_')
-                )
-            ]
+            matching_rules = self._span_match_selector(matching_rules)
 
         tokens = self._span_match_swapper.process(
             tokens=tokens,
@@ -90,13 +95,14 @@ class PerformSpanMatching(object):
     def process(self,
                 tokens: list) -> list:
 
-        if isEnabledForInfo(self.logger):
-            sw = Stopwatch()
+        if self._instrumentation.validate:
             Enforcer.is_list(tokens)
 
+        sw = self._instrumentation.stopwatch()
+
         swaps = self._process(tokens)
 
-        if isEnabledForDebug(self.logger):
+        if self._instrumentation.debug:
             self.logger.debug(f"Span Swapping Completed in {str(sw)}")
 
         return swaps
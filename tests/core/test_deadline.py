@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests Deadline: expiry, degradation flags and per-stage timings.
+
+import unittest
+
+from mutato.core import Deadline
+
+
+class TestDeadline(unittest.TestCase):
+
+    def test_no_budget_never_expires(self) -> None:
+        deadline = Deadline()
+        self.assertFalse(deadline.expired())
+        self.assertFalse(deadline.degraded)
+
+    def test_zero_budget_is_expired(self) -> None:
+        self.assertTrue(Deadline(budget_ms=0).expired())
+
+    def test_generous_budget_is_not_expired(self) -> None:
+        self.assertFalse(Deadline(budget_ms=60000).expired())
+
+    def test_degrade_records_each_stage_once(self) -> None:
+        deadline = Deadline(budget_ms=0)
+        deadline.degrade('span')
+        deadline.degrade('hierarchy')
+        deadline.degrade('hierarchy')
+        self.assertTrue(deadline.degraded)
+        self.assertEqual(deadline.skipped, ['span', 'hierarchy'])
+
+    def test_timings_accumulate_per_stage(self) -> None:
+        deadline = Deadline()
+        deadline.record('exact', 0.001)
+        deadline.record('exact', 0.002)
+        self.assertAlmostEqual(deadline.timings['exact'], 0.003)
+
+    def test_negative_budget(self) -> None:
+        with self.assertRaises(ValueError):
+            Deadline(budget_ms=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
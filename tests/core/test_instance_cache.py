@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests instance_cache: one bounded cache per instance and method, argument
+# normalization, seeded entries, statistics, clearing, and that a cached instance
+# can be collected.
+
+import gc
+import unittest
+import weakref
+
+from mutato.core import InstanceCache, instance_cache
+
+
+class Squares(object):
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @instance_cache(maxsize=2)
+    def square(self, value: int, offset: int = 0) -> int:
+        self.calls += 1
+        return value * value + offset
+
+
+class Cubes(Squares):
+
+    @instance_cache(maxsize=2)
+    def square(self, value: int, offset: int = 0) -> int:
+        return Squares.square(self, value, offset) * value
+
+
+class TestInstanceCache(unittest.TestCase):
+
+    def test_miss_then_hit(self) -> None:
+        squares = Squares()
+        self.assertEqual(squares.square(3), 9)
+        self.assertEqual(squares.square(3), 9)
+        self.assertEqual(squares.calls, 1)
+
+        info = InstanceCache.info(squares)['Squares.square']
+        self.assertEqual((info.hits, info.misses, info.currsize, info.maxsize), (1, 1, 1, 2))
+
+    def test_call_forms_share_an_entry(self) -> None:
+        squares = Squares()
+        squares.square(3)
+        squares.square(3, 0)
+        squares.square(value=3)
+        squares.square(3, offset=0)
+        self.assertEqual(squares.calls, 1)
+
+        squares.square(3, 1)
+        self.assertEqual(squares.calls, 2)
+
+    def test_lru_eviction(self) -> None:
+        squares = Squares()
+        squares.square(1)
+        squares.square(2)
+        squares.square(1)
+        squares.square(3)
+
+        info = InstanceCache.info(squares)['Squares.square']
+        self.assertEqual((info.currsize, info.evictions), (2, 1))
+
+        squares.square(1)
+        self.assertEqual(squares.calls, 3)
+        squares.square(2)
+        self.assertEqual(squares.calls, 4)
+
+    def test_instances_do_not_share(self) -> None:
+        first, second = Squares(), Squares()
+        first.square(3)
+        second.square(3)
+        self.assertEqual((first.calls, second.calls), (1, 1))
+
+    def test_override_has_its_own_cache(self) -> None:
+        cubes = Cubes()
+        self.assertEqual(cubes.square(2), 8)
+        self.assertEqual(cubes.square(2), 8)
+        self.assertEqual(Squares.square(cubes, 2), 4)
+        self.assertEqual(sorted(InstanceCache.info(cubes)), ['Cubes.square', 'Squares.square'])
+
+    def test_seeded_entry(self) -> None:
+        squares = Squares()
+        method = Squares.square
+        InstanceCache.of(squares, method.cache_name, method.maxsize).put(
+            method.cache_key((), {'value': 3}), -1)
+
+        self.assertEqual(squares.square(3, 0), -1)
+        self.assertEqual(squares.calls, 0)
+
+    def test_clear(self) -> None:
+        squares = Squares()
+        squares.square(3)
+        InstanceCache.clear(squares)
+        self.assertEqual(InstanceCache.info(squares), {})
+
+        squares.square(3)
+        self.assertEqual(squares.calls, 2)
+
+    def test_instance_is_collected(self) -> None:
+        squares = Squares()
+        squares.square(3)
+
+        ref = weakref.ref(squares)
+        del squares
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_invalid_maxsize(self) -> None:
+        for maxsize in [0, -1, None]:
+            with self.subTest(maxsize=maxsize):
+                self.assertRaises(ValueError, InstanceCache, maxsize)
+
+
+if __name__ == '__main__':
+    unittest.main()
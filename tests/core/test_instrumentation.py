@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests Instrumentation: production mode disables debug output, timing and validation.
+
+import logging
+import unittest
+
+from mutato.core import Instrumentation, NullStopwatch, Stopwatch
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.logger = logging.getLogger('mutato')
+        self.level = self.logger.level
+
+    def tearDown(self) -> None:
+        self.logger.setLevel(self.level)
+
+    def test_production_disables_everything(self) -> None:
+        self.logger.setLevel(logging.DEBUG)
+        instrumentation = Instrumentation(production=True)
+        self.assertFalse(instrumentation.debug)
+        self.assertFalse(instrumentation.validate)
+        self.assertIsInstance(instrumentation.stopwatch(), NullStopwatch)
+
+    def test_debug_follows_logger_level(self) -> None:
+        self.logger.setLevel(logging.DEBUG)
+        instrumentation = Instrumentation()
+        self.assertTrue(instrumentation.debug)
+        self.assertTrue(instrumentation.validate)
+        self.assertIsInstance(instrumentation.stopwatch(), Stopwatch)
+
+        self.logger.setLevel(logging.INFO)
+        instrumentation = Instrumentation()
+        self.assertFalse(instrumentation.debug)
+        self.assertTrue(instrumentation.validate)
+
+    def test_null_stopwatch_is_shared(self) -> None:
+        instrumentation = Instrumentation(production=True)
+        self.assertIs(instrumentation.stopwatch(), instrumentation.stopwatch())
+        self.assertEqual(str(instrumentation.stopwatch()), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
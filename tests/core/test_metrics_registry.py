@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests MetricsRegistry: counters, latency histograms, collectors and Prometheus rendering.
+
+import unittest
+
+from mutato.core import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def test_counters_by_label(self) -> None:
+        metrics = MetricsRegistry()
+        metrics.inc('mutato_swaps_total', type='exact')
+        metrics.inc('mutato_swaps_total', type='exact')
+        metrics.inc('mutato_swaps_total', type='spans')
+        metrics.inc('mutato_cartesian_probes_total', 5)
+
+        counters = metrics.snapshot()['counters']
+        self.assertEqual(counters['mutato_swaps_total{type="exact"}'], 2)
+        self.assertEqual(counters['mutato_swaps_total{type="spans"}'], 1)
+        self.assertEqual(counters['mutato_cartesian_probes_total'], 5)
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        metrics = MetricsRegistry(buckets=(0.01, 0.1))
+        for seconds in (0.005, 0.05, 0.5):
+            metrics.observe('mutato_stage_seconds', seconds, stage='exact')
+
+        d = metrics.snapshot()['histograms']['mutato_stage_seconds{stage="exact"}']
+        self.assertEqual(d['count'], 3)
+        self.assertAlmostEqual(d['sum'], 0.555)
+        self.assertEqual(d['buckets'], {'0.01': 1, '0.1': 2, '+Inf': 3})
+
+    def test_collectors_are_read_on_snapshot(self) -> None:
+        metrics = MetricsRegistry()
+        state = {'hits': 1}
+        metrics.register_collector(
+            lambda: [('mutato_cache_hits', {'cache': 'result'}, state['hits'])])
+
+        state['hits'] = 7
+        self.assertEqual(
+            metrics.snapshot()['gauges']['mutato_cache_hits{cache="result"}'], 7)
+
+    def test_prometheus_text(self) -> None:
+        metrics = MetricsRegistry(buckets=(0.01,))
+        metrics.describe('mutato_swaps_total', 'Swap tokens created, by swap type')
+        metrics.inc('mutato_swaps_total', type='exact')
+        metrics.observe('mutato_stage_seconds', 0.002, stage='span')
+
+        text = metrics.prometheus()
+        self.assertIn('# HELP mutato_swaps_total Swap tokens created, by swap type', text)
+        self.assertIn('# TYPE mutato_swaps_total counter', text)
+        self.assertIn('mutato_swaps_total{type="exact"} 1', text)
+        self.assertIn('# TYPE mutato_stage_seconds histogram', text)
+        self.assertIn('mutato_stage_seconds_bucket{stage="span",le="0.01"} 1', text)
+        self.assertIn('mutato_stage_seconds_bucket{stage="span",le="+Inf"} 1', text)
+        self.assertIn('mutato_stage_seconds_count{stage="span"} 1', text)
+
+    def test_reset(self) -> None:
+        metrics = MetricsRegistry()
+        metrics.inc('mutato_swaps_total', type='exact')
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()['counters'], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests PersistentCache: two-tier storage, batched writes, eviction and reopen.
+
+import os
+import tempfile
+import unittest
+
+from mutato.core import PersistentCache
+
+
+class TestPersistentCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._dir.name, 'mutato.db')
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_tiers_are_independent(self) -> None:
+        with PersistentCache(self.db_path) as cache:
+            cache.put(PersistentCache.TOKENS, 'k', [{'id': 1}])
+            self.assertEqual(cache.get(PersistentCache.TOKENS, 'k'), [{'id': 1}])
+            self.assertIsNone(cache.get(PersistentCache.SWAPS, 'k'))
+
+    def test_values_survive_reopen(self) -> None:
+        with PersistentCache(self.db_path) as cache:
+            cache.put(PersistentCache.SWAPS, 'k', [{'canon': 'geometry'}])
+
+        with PersistentCache(self.db_path) as cache:
+            self.assertEqual(
+                cache.get(PersistentCache.SWAPS, 'k'), [{'canon': 'geometry'}])
+
+    def test_batch_flush(self) -> None:
+        with PersistentCache(self.db_path, batch_size=2) as cache:
+            cache.put(PersistentCache.TOKENS, 'a', 1)
+            self.assertEqual(cache.cache_info()['tokens']['currsize'], 1)
+            cache.put(PersistentCache.TOKENS, 'b', 2)
+
+            other = PersistentCache(self.db_path)
+            self.assertEqual(other.get(PersistentCache.TOKENS, 'b'), 2)
+            other.close()
+
+    def test_eviction_is_bounded(self) -> None:
+        with PersistentCache(self.db_path, max_entries=2, batch_size=1) as cache:
+            for key in ('a', 'b', 'c'):
+                cache.put(PersistentCache.TOKENS, key, key)
+
+            info = cache.cache_info()['tokens']
+            self.assertEqual(info['currsize'], 2)
+            self.assertEqual(info['evictions'], 1)
+
+    def test_keys(self) -> None:
+        self.assertNotEqual(
+            PersistentCache.tokens_key('some text', 'en_core_web_sm-3.7.1'),
+            PersistentCache.tokens_key('some text', 'en_core_web_sm-3.8.0'))
+        self.assertNotEqual(
+            PersistentCache.swaps_key([{'id': 1}], 'fp-1', (False, 4)),
+            PersistentCache.swaps_key([{'id': 1}], 'fp-2', (False, 4)))
+
+    def test_unknown_tier(self) -> None:
+        with PersistentCache(self.db_path) as cache:
+            with self.assertRaises(ValueError):
+                cache.get('lemmas', 'k')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests ResultCache: LRU eviction, hit/miss statistics and copy-on-read isolation.
+
+import unittest
+
+from mutato.core import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_miss_then_hit(self) -> None:
+        cache = ResultCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 'alpha')
+        self.assertEqual(cache.get('a'), 'alpha')
+
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.currsize, 1)
+
+    def test_lru_eviction(self) -> None:
+        cache = ResultCache(maxsize=2)
+        cache.put('a', 'alpha')
+        cache.put('b', 'beta')
+        cache.get('a')
+        cache.put('c', 'gamma')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'alpha')
+        self.assertEqual(cache.get('c'), 'gamma')
+        self.assertEqual(cache.cache_info().evictions, 1)
+
+    def test_returned_value_is_a_copy(self) -> None:
+        cache = ResultCache(maxsize=2)
+        tokens = [{'id': 1, 'swaps': {'canon': 'geometry'}}]
+        cache.put('k', tokens)
+
+        tokens[0]['swaps']['canon'] = 'mutated-by-producer'
+        result = cache.get('k')
+        self.assertEqual(result[0]['swaps']['canon'], 'geometry')
+
+        result[0]['swaps']['canon'] = 'mutated-by-consumer'
+        self.assertEqual(cache.get('k')[0]['swaps']['canon'], 'geometry')
+
+    def test_none_is_not_cached(self) -> None:
+        cache = ResultCache(maxsize=2)
+        cache.put('k', None)
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+    def test_clear_resets_statistics(self) -> None:
+        cache = ResultCache(maxsize=2)
+        cache.put('a', 'alpha')
+        cache.get('a')
+        cache.clear()
+
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+    def test_invalid_maxsize(self) -> None:
+        with self.assertRaises(ValueError):
+            ResultCache(maxsize=0)
+
+    def test_key_is_stable(self) -> None:
+        self.assertEqual(
+            ResultCache.key('fp', (True, 4), 'some text'),
+            ResultCache.key('fp', (True, 4), 'some text'))
+        self.assertNotEqual(
+            ResultCache.key('fp-1', (True, 4), 'some text'),
+            ResultCache.key('fp-2', (True, 4), 'some text'))
+
+    def test_normalize(self) -> None:
+        self.assertEqual(ResultCache.normalize('  fiscal   policy \n'), 'fiscal policy')
+
+    def test_fingerprint_tracks_content(self) -> None:
+        d_owl = {'ngrams': {1: ['a'], 2: ['a_b']}, 'labels': {'a': 'A'}}
+        self.assertEqual(ResultCache.fingerprint(d_owl), ResultCache.fingerprint(dict(d_owl)))
+        self.assertNotEqual(
+            ResultCache.fingerprint(d_owl),
+            ResultCache.fingerprint({**d_owl, 'labels': {'a': 'B'}}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests Tracing: trace attributes nest, reset and follow copied contexts into threads.
+
+import contextvars
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from mutato.core import Tracing, InMemoryTraceCollector
+
+
+class TestTracing(unittest.TestCase):
+
+    def test_context_nests_and_resets(self) -> None:
+        self.assertEqual(Tracing.current(), {})
+        with Tracing.context(request_id='r1'):
+            with Tracing.context(batch_index=3):
+                self.assertEqual(Tracing.current(), {'request_id': 'r1', 'batch_index': 3})
+            self.assertEqual(Tracing.current(), {'request_id': 'r1'})
+        self.assertEqual(Tracing.current(), {})
+
+    def test_context_follows_copied_context_into_threads(self) -> None:
+        with Tracing.context(request_id='r1'):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future = executor.submit(contextvars.copy_context().run, Tracing.current)
+                self.assertEqual(future.result(), {'request_id': 'r1'})
+
+    def test_collector_records_events(self) -> None:
+        collector = InMemoryTraceCollector()
+        collector.on_stage_start('exact', 4, {'request_id': 'r1'})
+        collector.on_stage_end('exact', 3, 0.002, {'request_id': 'r1'})
+
+        self.assertEqual([e['event'] for e in collector.events], ['start', 'end'])
+        self.assertEqual(collector.events[1]['token_count'], 3)
+        self.assertEqual(collector.events[1]['elapsed'], 0.002)
+
+        collector.clear()
+        self.assertEqual(collector.events, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
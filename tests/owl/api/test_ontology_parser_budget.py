@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests time budgets on OntologyParser.parse and MutatoAPI.swap_input_text:
+# an exhausted budget still performs exact matching, skips the remaining passes
+# and flags the result as degraded.
+
+import os
+import unittest
+
+os.environ['SPAN_DISTANCE'] = '4'
+
+ANIMALS_OWL = 'tests/test_data/ontologies/animals-test.owl'
+NAMESPACE = 'http://test.ai/animals'
+
+
+class TestOntologyParserBudget(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        from mutato.api import OntologyParser
+        cls.parser = OntologyParser(ANIMALS_OWL, namespace=NAMESPACE, cache_size=16)
+
+    def test_no_budget_returns_plain_str(self) -> None:
+        result = self.parser.parse('the dog chased the cat')
+        self.assertIs(type(result), str)
+
+    def test_generous_budget_is_not_degraded(self) -> None:
+        result = self.parser.parse('the dog chased the horse', budget_ms=60000)
+        self.assertFalse(result.degraded)
+        self.assertEqual(result, self.parser.parse('the dog chased the horse'))
+
+    def test_exhausted_budget_is_degraded(self) -> None:
+        result = self.parser.parse('the cat chased the horse', budget_ms=0)
+        self.assertTrue(result.degraded)
+
+    def test_degraded_results_are_not_cached(self) -> None:
+        before = self.parser.cache_info().currsize
+        self.parser.parse('a lion and a tiger', budget_ms=0)
+        self.assertEqual(self.parser.cache_info().currsize, before)
+
+    def test_swap_result_lists_skipped_stages(self) -> None:
+        swaps = self.parser._api.swap_input_text('the bear', budget_ms=0)
+        self.assertTrue(swaps.degraded)
+        self.assertIn('hierarchy', swaps.skipped)
+        self.assertTrue(all(isinstance(token, dict) for token in swaps))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests the OntologyParser output modes: 'text' and 'offsets' read the pipeline's
+# token records directly and agree with the swap dicts of MutatoAPI.swap_input_text;
+# cached offsets are keyed on the exact input text.
+
+import os
+import unittest
+
+os.environ['SPAN_DISTANCE'] = '4'
+
+ANIMALS_OWL = 'tests/test_data/ontologies/animals-test.owl'
+NAMESPACE = 'http://test.ai/animals'
+INPUT_TEXT = 'the dog chased the cat past the horse'
+
+
+class TestOntologyParserOutput(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        from mutato.api import OntologyParser
+        cls.parser = OntologyParser(ANIMALS_OWL, namespace=NAMESPACE)
+        cls.offsets_parser = OntologyParser.from_dict(
+            cls.parser.to_dict(), name='animals-test', output='offsets', cache_size=4)
+
+    def test_text_matches_swap_dicts(self) -> None:
+        tokens = self.parser._api.swap_input_text(INPUT_TEXT)
+        expected = ' '.join(
+            t['swaps']['canon'] if t.get('swaps') else t['text'].strip()
+            for t in tokens
+            if t.get('swaps') or t['text'].strip())
+        self.assertEqual(self.parser.parse(INPUT_TEXT), expected)
+
+    def test_offsets_match_swap_dicts(self) -> None:
+        tokens = self.parser._api.swap_input_text(INPUT_TEXT)
+        expected = [(t['x'], t['y'], t['swaps']['canon'], t['swaps']['type'])
+                    for t in tokens if 'swaps' in t]
+        self.assertTrue(expected)
+        self.assertEqual(self.offsets_parser.parse(INPUT_TEXT), expected)
+
+    def test_offsets_are_cached(self) -> None:
+        first = self.offsets_parser.parse('a lion and a tiger')
+        self.assertEqual(self.offsets_parser.parse('a lion and a tiger'), first)
+        self.assertGreaterEqual(self.offsets_parser.cache_info().hits, 1)
+
+    def test_offsets_keyed_on_exact_text(self) -> None:
+        spaced = '   a   lion and a tiger'
+        self.offsets_parser.parse('a lion and a tiger')
+
+        expected = self.offsets_parser._parse(spaced)
+        self.assertTrue(expected)
+        self.assertEqual(self.offsets_parser.parse(spaced), expected)
+
+    def test_offsets_with_budget(self) -> None:
+        result = self.offsets_parser.parse('the bear', budget_ms=0)
+        self.assertTrue(result.degraded)
+        self.assertIsInstance(result, list)
+
+    def test_records_are_not_dicts(self) -> None:
+        tokens = self.parser._api.swap_input_records(INPUT_TEXT)
+        self.assertFalse(any(isinstance(token, dict) for token in tokens))
+
+    def test_unknown_output(self) -> None:
+        from mutato.api import OntologyParser
+        self.assertRaises(ValueError, OntologyParser.from_dict,
+                          self.parser.to_dict(), name='animals-test', output='json')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Docs: docs/architecture.md
+# Tests stage hooks on OntologyParser: every stage fires start/end events,
+# and trace attributes reach hooks in sequential and threaded batches.
+
+import os
+import unittest
+
+from mutato.core import Tracing, InMemoryTraceCollector
+
+os.environ['SPAN_DISTANCE'] = '4'
+
+ANIMALS_OWL = 'tests/test_data/ontologies/animals-test.owl'
+NAMESPACE = 'http://test.ai/animals'
+
+
+class TestOntologyParserTracing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        from mutato.api import OntologyParser
+        cls.parser = OntologyParser(ANIMALS_OWL, namespace=NAMESPACE)
+
+    def setUp(self) -> None:
+        self.collector = InMemoryTraceCollector()
+        self.parser.add_hook(self.collector)
+
+    def tearDown(self) -> None:
+        self.parser.remove_hook(self.collector)
+
+    def test_stages_fire_start_and_end(self) -> None:
+        self.parser.parse('the dog chased the cat')
+
+        stages = [e['stage'] for e in self.collector.events if e['event'] == 'end']
+        self.assertEqual(stages[0], 'tokenization')
+        self.assertIn('exact', stages)
+        self.assertIn('hierarchy', stages)
+
+        for event in self.collector.events:
+            if event['event'] == 'end':
+                self.assertGreaterEqual(event['elapsed'], 0.0)
+
+    def test_context_reaches_hooks(self) -> None:
+        with Tracing.context(request_id='r1'):
+            self.parser.parse('the dog')
+
+        self.assertTrue(all(
+            e['context'] == {'request_id': 'r1'} for e in self.collector.events))
+
+    def test_threaded_batch_propagates_context(self) -> None:
+        texts = ['the dog', 'the cat', 'the horse']
+        expected = self.parser.parse_batch(texts)
+        self.collector.clear()
+
+        with Tracing.context(request_id='r2'):
+            results = self.parser.parse_batch(texts, max_workers=2)
+
+        self.assertEqual(results, expected)
+        self.assertEqual(
+            {e['context']['batch_index'] for e in self.collector.events}, {0, 1, 2})
+        self.assertTrue(all(
+            e['context']['request_id'] == 'r2' for e in self.collector.events))
+
+
+if __name__ == '__main__':
+    unittest.main()
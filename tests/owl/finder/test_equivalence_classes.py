@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates equivalence classes: union-find closes owl:equivalentClass chains,
+# classes are joined across ontologies, FindOntologyData answers equivalents and
+# batch class lookups from them, and the MDA snapshot stores the same class IDs.
+
+import unittest
+
+from mutato.finder.multiquery.bp import FindOntologyData, FindOntologyJSON
+from mutato.finder.multiquery.svc import FindEquivalents
+from mutato.finder.singlequery.bp import AskJsonAPI
+from mutato.finder.singlequery.dmo import EquivalenceClasses
+from mutato.mda import MDAGenerator
+
+ONTOLOGY_NAME = 'courses-20251028'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+NAMESPACE = 'http://graffl.ai/skills#'
+
+
+class TestEquivalenceClasses(unittest.TestCase):
+
+    def test_chain_closed(self) -> None:
+        d_class_ids = EquivalenceClasses.of({
+            'c': ['b'], 'b': ['c', 'a'], 'a': ['b'], 'x': ['y'], 'y': ['x']})
+
+        self.assertEqual(d_class_ids, {'a': 'a', 'b': 'a', 'c': 'a', 'x': 'x', 'y': 'x'})
+
+    def test_no_equivalents(self) -> None:
+        self.assertIsNone(EquivalenceClasses.of(None))
+        self.assertIsNone(EquivalenceClasses.of({}))
+
+    def test_joined_across_ontologies(self) -> None:
+        svc = FindEquivalents([
+            AskJsonAPI({'equivalents': {'film': ['cinema'], 'cinema': ['film']}}),
+            AskJsonAPI({'equivalence_classes': {'cinema': 'cinema', 'movies': 'cinema'}}),
+            AskJsonAPI({}),
+        ])
+
+        self.assertEqual(svc.process(['film']), {'film': ['cinema', 'movies']})
+        self.assertEqual(svc.classes(['Film', 'movies', 'theatre']),
+                         {'film': 'cinema', 'movies': 'cinema', 'theatre': None})
+
+
+class TestFinderEquivalenceClasses(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.finder = FindOntologyData(
+            ontologies=[ONTOLOGY_NAME],
+            absolute_path=ABSOLUTE_PATH,
+            namespace=None)
+
+        cls.d_owl = MDAGenerator(
+            ontology_name=ONTOLOGY_NAME,
+            absolute_path=ABSOLUTE_PATH,
+            namespace=NAMESPACE).generate()
+
+    def test_chain_closed(self) -> None:
+        # italian_film and italian_theater are each equivalent only to italian_cinema
+        self.assertEqual(
+            self.finder.equivalents(['italian_film'], flat_list=False),
+            {'italian film': ['italian_cinema', 'italian_theater', 'italian_theatre']})
+
+    def test_underscores_and_spaces(self) -> None:
+        self.assertEqual(self.finder.equivalents(['aerobic_fitness']), ['aerobics'])
+        self.assertEqual(self.finder.equivalents(['Aerobic Fitness']), ['aerobics'])
+
+    def test_batch(self) -> None:
+        d_classes = self.finder.equivalence_classes(['italian film', 'italian_theatre', 'aerobics', 'calculus'])
+
+        self.assertEqual(d_classes['italian film'], d_classes['italian theatre'])
+        self.assertNotEqual(d_classes['italian film'], d_classes['aerobics'])
+        self.assertIsNone(d_classes['calculus'])
+
+    def test_snapshot_matches(self) -> None:
+        api = self.finder._d_ontologies[ONTOLOGY_NAME]
+        self.assertEqual(self.d_owl['equivalence_classes'], api.equivalence_classes())
+
+        finder_json = FindOntologyJSON(d_owl=self.d_owl, ontology_name=ONTOLOGY_NAME)
+        entities = list(api.equivalents())
+        self.assertEqual(
+            finder_json.equivalents(entities, flat_list=False),
+            self.finder.equivalents(entities, flat_list=False))
+        self.assertEqual(finder_json.equivalence_classes(entities), self.finder.equivalence_classes(entities))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates the precomputed NER table: FindNER.table resolves every entity, with
+# depth-based tie-breaking, to the same answer as FindNER.find_ner, and
+# FindOntologyData.find_ner answers from one table built once.
+
+import unittest
+from unittest import mock
+
+from mutato.finder.multiquery.bp import FindOntologyData
+from mutato.finder.multiquery.svc import FindNER
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+
+class TestFindNerTable(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.svc = FindNER(
+            d_ner_depth={'PERSON': [1], 'ORG': [2], 'GPE': [3]},
+            d_ner_taxo={},
+            d_graffl_ner={'alan turing': ['PERSON'], 'acme': ['ORG'], 'new_york': ['GPE']},
+            d_spacy_ner={'acme': ['GPE'], 'paris': ['GPE'], 'alan turing': ['ORG']})
+
+    def test_same_answers_as_find_ner(self) -> None:
+        d_table = self.svc.table()
+        for input_text in ['alan turing', 'alan_turing', 'acme', 'paris', 'new_york', 'new york', 'unknown']:
+            with self.subTest(input_text=input_text):
+                self.assertEqual(FindNER.probe(d_table, input_text), self.svc.find_ner(input_text))
+
+    def test_depth_tie_break(self) -> None:
+        d_table = self.svc.table()
+        self.assertEqual(d_table['acme'], 'GPE')
+        self.assertEqual(d_table['alan turing'], 'ORG')
+
+    def test_empty_sources(self) -> None:
+        svc = FindNER(d_ner_depth={}, d_ner_taxo={}, d_graffl_ner={}, d_spacy_ner={})
+        self.assertEqual(svc.table(), {})
+        self.assertEqual(FindNER.probe(svc.table(), 'anything'), 'NER')
+
+
+class TestFinderNerTable(unittest.TestCase):
+
+    def _finder(self) -> FindOntologyData:
+        return FindOntologyData(
+            ontologies=[ONTOLOGY_NAME],
+            absolute_path=ABSOLUTE_PATH,
+            namespace=None)
+
+    def test_no_labels_no_queries(self) -> None:
+        finder = self._finder()
+        with mock.patch.object(finder, '_query_ner_depth') as query_ner_depth, \
+                mock.patch.object(finder, '_query_ner_taxo') as query_ner_taxo:
+            self.assertEqual(finder.find_ner('cat'), 'NER')
+
+        query_ner_depth.assert_not_called()
+        query_ner_taxo.assert_not_called()
+
+    def test_built_once(self) -> None:
+        finder = self._finder()
+        with mock.patch.object(finder, 'spacy_ner', return_value={'cat': ['ANIMAL']}) as spacy_ner:
+            self.assertEqual(finder.find_ner('cat'), 'ANIMAL')
+            self.assertEqual(finder.find_ner('dog'), 'NER')
+
+        spacy_ner.assert_called_once()
+
+    def test_warm(self) -> None:
+        finder = self._finder()
+        finder.warm(['ner'])
+        self.assertIn('ner_table', finder._d_views)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates lazy view construction in FindOntologyData: nothing is built at
+# construction, taxonomy calls do not build the synonym pipeline, concurrent
+# first calls build a view once, and warm() builds views on request.
+
+import unittest
+from threading import Barrier, Thread
+from unittest import mock
+
+from mutato.finder.multiquery.bp import FindOntologyData
+from mutato.finder.multiquery.bp import find_ontology_data
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+
+class TestFindOntologyDataLazy(unittest.TestCase):
+
+    def _finder(self) -> FindOntologyData:
+        return FindOntologyData(
+            ontologies=[ONTOLOGY_NAME],
+            absolute_path=ABSOLUTE_PATH,
+            namespace=None)
+
+    def test_nothing_built_at_construction(self) -> None:
+        self.assertEqual(self._finder()._d_views, {})
+
+    def test_taxonomy_skips_synonyms(self) -> None:
+        finder = self._finder()
+        entity = finder.types_rev() and next(iter(finder.types_rev()))
+
+        self.assertTrue(finder.children(entity))
+        self.assertIn('_find_types', finder._d_views)
+        for view in ['_load_synonyms', '_find_synonyms', 'synonyms', 'lookup']:
+            self.assertNotIn(view, finder._d_views)
+
+    def test_built_once_under_concurrency(self) -> None:
+        finder = self._finder()
+
+        with mock.patch.object(find_ontology_data, 'LoadSynonyms',
+                               wraps=find_ontology_data.LoadSynonyms) as load_synonyms:
+            barrier = Barrier(8)
+            results = []
+
+            def call() -> None:
+                barrier.wait()
+                results.append(finder.lookup())
+
+            threads = [Thread(target=call) for _ in range(8)]
+            [thread.start() for thread in threads]
+            [thread.join() for thread in threads]
+
+        self.assertEqual(load_synonyms.call_count, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_same_results_as_eager(self) -> None:
+        lazy = self._finder()
+        warm = self._finder()
+        warm.warm()
+
+        self.assertTrue(set(warm._d_views).issuperset({'lookup', '_find_types', '_find_synonyms'}))
+        self.assertEqual(lazy.lookup(), warm.lookup())
+        self.assertEqual(lazy.synonyms(), warm.synonyms())
+        self.assertEqual(lazy.types(), warm.types())
+        self.assertEqual(lazy.spans(), warm.spans())
+
+    def test_warm_named_views(self) -> None:
+        finder = self._finder()
+        finder.warm(['types'])
+
+        self.assertIn('_find_types', finder._d_views)
+        self.assertNotIn('_find_synonyms', finder._d_views)
+
+    def test_warm_unknown_view(self) -> None:
+        self.assertRaises(ValueError, self._finder().warm, ['bogus'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates the per-instance caches of AskOwlAPI and FindOntologyData: statistics
+# are reported per method, preload seeds them, cache_clear releases cached and
+# preloaded views without changing results, and a discarded finder (with its
+# graph) can be collected.
+
+import gc
+import unittest
+import weakref
+
+from mutato.finder.multiquery.bp import FindOntologyData
+from mutato.finder.singlequery import AskOwlAPI
+from mutato.finder.singlequery.dmo import OwlGraphRegistry
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+
+class TestFinderCacheLifecycle(unittest.TestCase):
+
+    def _finder(self) -> FindOntologyData:
+        return FindOntologyData(
+            ontologies=[ONTOLOGY_NAME],
+            absolute_path=ABSOLUTE_PATH,
+            namespace=None)
+
+    def test_ask_owl_api_cache_info(self) -> None:
+        api = AskOwlAPI(ontology_name=ONTOLOGY_NAME, absolute_path=ABSOLUTE_PATH)
+        labels = api.labels()
+        self.assertIs(api.labels(), labels)
+
+        info = api.cache_info()['AskOwlAPI.labels']
+        self.assertEqual((info.hits, info.misses, info.maxsize), (1, 1, 1024))
+
+        api.cache_clear()
+        self.assertEqual(api.cache_info(), {})
+        self.assertEqual(api.labels(), labels)
+
+    def test_cache_clear_drops_preloaded_views(self) -> None:
+        api = AskOwlAPI(ontology_name=ONTOLOGY_NAME, absolute_path=ABSOLUTE_PATH)
+        api.preload([('labels', {}, ['seeded'])])
+        self.assertEqual(api.labels(), ['seeded'])
+
+        api.cache_clear()
+        self.assertNotEqual(api.labels(), ['seeded'])
+
+    def test_preload_seeds_instance_caches(self) -> None:
+        api = AskOwlAPI(ontology_name=ONTOLOGY_NAME, absolute_path=ABSOLUTE_PATH)
+        api.preload([('by_predicate', {'predicate': 'rdfs:label', 'to_lowercase': False}, {'seeded': []})])
+
+        self.assertNotIn('by_predicate', vars(api))
+        self.assertEqual(api.cache_info()['AskOwlAPI.by_predicate'].currsize, 1)
+        self.assertEqual(api.by_predicate('rdfs:label', False), {'seeded': []})
+
+        # not a cached view
+        self.assertRaises(ValueError, api.preload, [('cache_info', {}, None)])
+
+    def test_finder_cache_clear(self) -> None:
+        finder = self._finder()
+        entity = next(iter(finder.types_rev()))
+        children = finder.children(entity)
+        lookup = finder.lookup()
+
+        self.assertIn('FindOntologyData.children', finder.cache_info())
+
+        finder.cache_clear()
+        self.assertEqual(finder.cache_info(), {})
+        self.assertEqual(finder._d_views, {})
+        for ask_owl_api in finder._d_ontologies.values():
+            self.assertEqual(ask_owl_api.cache_info(), {})
+
+        self.assertEqual(finder.children(entity), children)
+        self.assertEqual(finder.lookup(), lookup)
+
+    def test_discarded_finder_is_collected(self) -> None:
+        finder = self._finder()
+        entity = next(iter(finder.types_rev()))
+        finder.children(entity)
+        finder.lookup()
+
+        ref = weakref.ref(finder)
+        ask_owl_api_ref = weakref.ref(finder._d_ontologies[ONTOLOGY_NAME])
+        del finder
+        gc.collect()
+
+        self.assertIsNone(ref())
+        self.assertIsNone(ask_owl_api_ref())
+
+    def test_reloaded_graph_is_collected(self) -> None:
+        OwlGraphRegistry.clear()
+        api = AskOwlAPI(ontology_name=ONTOLOGY_NAME, absolute_path=ABSOLUTE_PATH)
+        api.labels()
+
+        graph_ref = weakref.ref(api.graph)
+        del api
+        gc.collect()
+
+        # the registry does not keep an unused graph alive
+        self.assertIsNone(graph_ref())
+        self.assertEqual(OwlGraphRegistry.cache_info().currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates LoadOntologiesParallel: ontologies parsed and their views built in
+# worker processes match a sequential load, the local AskOwlAPI loads its graph
+# only when a call misses the preloaded views, and preloaded views answer calls
+# made positionally or by name.
+
+import unittest
+
+from mutato.finder.singlequery import AskOwlAPI
+from mutato.finder.singlequery.dmo import OwlGraphRegistry
+from mutato.finder.multiquery.svc import LoadOntologiesParallel, QueryNerDepth
+
+ONTOLOGIES = ['animals-test', 'colors-test', 'music-test']
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+
+class TestLoadOntologiesParallel(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        OwlGraphRegistry.clear()
+        cls.d_ontologies = LoadOntologiesParallel(max_workers=2).process(
+            ontologies=ONTOLOGIES,
+            absolute_path=ABSOLUTE_PATH,
+            namespace=None)
+        cls.cache_info = OwlGraphRegistry.cache_info()
+        cls.unloaded = [
+            ontology_name for ontology_name, ask_owl_api in cls.d_ontologies.items()
+            if ask_owl_api._graph is None
+        ]
+
+        OwlGraphRegistry.clear()
+        cls.d_expected = {
+            ontology_name: AskOwlAPI(ontology_name=ontology_name, absolute_path=ABSOLUTE_PATH)
+            for ontology_name in ONTOLOGIES
+        }
+
+    def test_input_order(self) -> None:
+        self.assertEqual(list(self.d_ontologies), ONTOLOGIES)
+
+    def test_graphs_not_loaded(self) -> None:
+        self.assertEqual(self.cache_info.misses, 0)
+        self.assertEqual(self.cache_info.hits, 0)
+        self.assertEqual(self.unloaded, ONTOLOGIES)
+
+    def test_views_match_sequential(self) -> None:
+        for ontology_name in ONTOLOGIES:
+            for name, kwargs in LoadOntologiesParallel.VIEWS:
+                with self.subTest(ontology=ontology_name, view=name, kwargs=kwargs):
+                    self.assertEqual(
+                        getattr(self.d_ontologies[ontology_name], name)(**kwargs),
+                        getattr(self.d_expected[ontology_name], name)(**kwargs))
+
+    def test_preloaded_call_forms(self) -> None:
+        ask_owl_api = self.d_ontologies['animals-test']
+
+        by_name = ask_owl_api.by_predicate(predicate='rdfs:subClassOf')
+        self.assertIs(ask_owl_api.by_predicate('rdfs:subClassOf'), by_name)
+        self.assertIs(ask_owl_api.by_predicate('rdfs:subClassOf', True, False), by_name)
+
+        name, kwargs = QueryNerDepth.view()
+        self.assertIs(getattr(ask_owl_api, name)(**kwargs), getattr(ask_owl_api, name)(**kwargs))
+
+    def test_other_calls_are_queried(self) -> None:
+        ask_owl_api = self.d_ontologies['animals-test']
+        expected = self.d_expected['animals-test']
+
+        self.assertEqual(ask_owl_api.by_predicate('rdfs:label'), expected.by_predicate('rdfs:label'))
+        self.assertEqual(ask_owl_api.labels(), expected.labels())
+
+        entity = expected.entities()[0]
+        self.assertEqual(ask_owl_api.parents(entity), expected.parents(entity))
+
+        # the miss loaded the graph
+        self.assertIs(ask_owl_api.graph, expected.graph)
+
+    def test_invalid_max_workers(self) -> None:
+        for max_workers in [0, -1, 1.5, None]:
+            with self.subTest(max_workers=max_workers):
+                self.assertRaises(ValueError, LoadOntologiesParallel, max_workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,7 +26,7 @@ class TestFindOntologyJSON(unittest.TestCase):
 
         self.assertEqual(
             sorted(d_owl.keys()), [
-                'by_predicate', 'children', 'equivalents',
+                'by_predicate', 'children', 'equivalence_classes', 'equivalents',
                 'labels', 'ner', 'ngrams', 'parents', 'predicates',
                 'spans', 'synonyms', 'trie'
             ])
@@ -11,7 +11,7 @@ NAMESPACE = 'http://graffl.ai/medicopilot'
 
 REQUIRED_KEYS = {
     'children', 'parents', 'trie', 'ngrams', 'spans',
-    'labels', 'equivalents', 'predicates', 'by_predicate', 'ner', 'synonyms'
+    'labels', 'equivalents', 'equivalence_classes', 'predicates', 'by_predicate', 'ner', 'synonyms'
 }
 
 
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates ModelResultMerge and multi-ontology FindOntologyData: list values are
+# unioned, deduplicated and sorted; dict values (spans) are deduplicated in input
+# order; and a finder over several ontologies answers from every one of them.
+
+import unittest
+
+from mutato.finder.multiquery.bp import FindOntologyData
+from mutato.finder.multiquery.dmo import ModelResultMerge
+from mutato.finder.singlequery import AskOwlAPI
+from mutato.finder.singlequery.dto import QueryResultType
+
+ONTOLOGIES = ['animals-test', 'colors-test', 'music-test']
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+
+class TestModelResultMerge(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.merge = ModelResultMerge().process
+
+    def test_lists_unioned_and_sorted(self) -> None:
+        results = [
+            {'b': ['y', 'x'], 'a': ['z']},
+            None,
+            {},
+            {'b': ['x', 'w'], 'c': []},
+        ]
+        d_merged = self.merge(results, QueryResultType.DICT_OF_STR2LIST)
+
+        self.assertEqual(d_merged, {'b': ['w', 'x', 'y'], 'a': ['z'], 'c': []})
+        self.assertEqual(list(d_merged), ['b', 'a', 'c'])
+
+    def test_dicts_deduplicated_in_order(self) -> None:
+        first = {'canon': 'german_shepherd', 'content': ['shepherd'], 'distance': 4}
+        second = {'canon': 'german_pointer', 'content': ['pointer'], 'distance': 4}
+
+        d_merged = self.merge(
+            [{'german': [first]}, {'german': [second, dict(first)]}],
+            QueryResultType.DICT_OF_STR2DICT)
+
+        self.assertEqual(d_merged, {'german': [first, second]})
+
+    def test_unsupported_result_type(self) -> None:
+        self.assertRaises(NotImplementedError, self.merge, [], QueryResultType.LIST_OF_STRINGS)
+
+
+class TestMultiOntologyFinder(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.finder = FindOntologyData(
+            ontologies=ONTOLOGIES,
+            absolute_path=ABSOLUTE_PATH,
+            namespace=None)
+        cls.apis = [
+            AskOwlAPI(ontology_name=ontology_name, absolute_path=ABSOLUTE_PATH)
+            for ontology_name in ONTOLOGIES
+        ]
+
+    def test_by_predicate(self) -> None:
+        d_merged = self.finder.by_predicate('rdfs:subClassOf')
+        for api in self.apis:
+            for k, values in api.by_predicate('rdfs:subClassOf').items():
+                self.assertTrue(set(values).issubset(d_merged[k]))
+                self.assertEqual(d_merged[k], sorted(d_merged[k]))
+
+    def test_spans(self) -> None:
+        d_merged = self.finder.spans()
+        for api in self.apis:
+            for k, values in (api.spans() or {}).items():
+                for value in values:
+                    self.assertIn(value, d_merged[k])
+
+    def test_parallel_load_matches(self) -> None:
+        finder = FindOntologyData(
+            ontologies=ONTOLOGIES,
+            absolute_path=ABSOLUTE_PATH,
+            namespace=None,
+            max_workers=2)
+
+        self.assertEqual(finder.by_predicate('rdfs:subClassOf'), self.finder.by_predicate('rdfs:subClassOf'))
+        self.assertEqual(finder.spans(), self.finder.spans())
+        self.assertEqual(finder.lookup(), self.finder.lookup())
+
+
+if __name__ == '__main__':
+    unittest.main()
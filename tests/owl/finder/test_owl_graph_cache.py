@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates OwlGraphCache: a parsed OWL graph is written to disk, reloaded by
+# later processes instead of re-parsing Turtle, invalidated when the file changes,
+# and bounded to one entry per file.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from rdflib.compare import isomorphic
+
+from mutato.finder.singlequery import AskOwlAPI
+from mutato.finder.singlequery.dmo import OwlGraphCache, OwlGraphRegistry
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+
+class TestOwlGraphCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.tempdir.name, f'{ONTOLOGY_NAME}.owl')
+        shutil.copy(os.path.join(ABSOLUTE_PATH, f'{ONTOLOGY_NAME}.owl'), self.input_path)
+
+        self.cache_dir = os.path.join(self.tempdir.name, 'graphs')
+        OwlGraphRegistry.clear()
+        OwlGraphRegistry.set_cache_dir(self.cache_dir)
+
+    def tearDown(self) -> None:
+        OwlGraphRegistry.clear()
+        OwlGraphRegistry.set_cache_dir(None)
+        self.tempdir.cleanup()
+
+    def _new_process(self) -> None:
+        """ Simulate a later run: the in-memory registry is empty, the disk cache is not """
+        OwlGraphRegistry.clear()
+        OwlGraphRegistry.set_cache_dir(self.cache_dir)
+
+    def test_reloaded_from_disk(self) -> None:
+        parsed = OwlGraphRegistry.graph(self.input_path)
+        self.assertEqual(OwlGraphRegistry.graph_cache().cache_info().currsize, 1)
+
+        self._new_process()
+        loaded = OwlGraphRegistry.graph(self.input_path)
+
+        self.assertIsNot(loaded, parsed)
+        self.assertTrue(isomorphic(loaded, parsed))
+        self.assertEqual(dict(loaded.namespaces()), dict(parsed.namespaces()))
+        self.assertEqual(OwlGraphRegistry.graph_cache().cache_info().hits, 1)
+
+    def test_queries_match(self) -> None:
+        api = AskOwlAPI(ontology_name=ONTOLOGY_NAME, absolute_path=self.tempdir.name)
+        expected = (api.labels(), api.synonyms(), api.spans())
+
+        self._new_process()
+        api = AskOwlAPI(ontology_name=ONTOLOGY_NAME, absolute_path=self.tempdir.name)
+
+        self.assertEqual(OwlGraphRegistry.graph_cache().cache_info().hits, 1)
+        self.assertEqual((api.labels(), api.synonyms(), api.spans()), expected)
+
+    def test_changed_file_is_parsed_again(self) -> None:
+        graph = OwlGraphRegistry.graph(self.input_path)
+
+        with open(self.input_path, 'a') as f:
+            f.write('\n<http://test.ai/animals#quokka> '
+                    '<http://www.w3.org/2000/01/rdf-schema#label> "quokka" .\n')
+
+        self._new_process()
+        changed = OwlGraphRegistry.graph(self.input_path)
+
+        self.assertEqual(len(changed), len(graph) + 1)
+        self.assertEqual(OwlGraphRegistry.graph_cache().cache_info().hits, 0)
+
+        # the entry for the edited file replaced the old one
+        self.assertEqual(OwlGraphRegistry.graph_cache().cache_info().currsize, 1)
+        self.assertEqual(OwlGraphRegistry.graph_cache().cache_info().evictions, 1)
+
+    def test_one_entry_per_file(self) -> None:
+        other_path = os.path.join(self.tempdir.name, 'colors-test.owl')
+        shutil.copy(os.path.join(ABSOLUTE_PATH, 'colors-test.owl'), other_path)
+
+        OwlGraphRegistry.graph(other_path)
+        for i in range(3):
+            with open(self.input_path, 'a') as f:
+                f.write(f'\n<http://test.ai/animals#quokka{i}> '
+                        f'<http://www.w3.org/2000/01/rdf-schema#label> "quokka {i}" .\n')
+            self._new_process()
+            OwlGraphRegistry.graph(self.input_path)
+
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_concurrent_discard(self) -> None:
+        OwlGraphRegistry.graph(self.input_path)
+
+        cache = OwlGraphCache(self.cache_dir)
+        key = cache.key(self.input_path, 'ttl')
+        path = os.path.join(self.cache_dir, f'{key}.pickle')
+
+        # another process discards the entry while this one reads it
+        def discarded(f):
+            os.remove(path)
+            raise EOFError
+
+        with mock.patch('mutato.finder.singlequery.dmo.owl_graph_cache.pickle.load', side_effect=discarded), \
+                self.assertLogs('mutato.finder.singlequery.dmo.owl_graph_cache', level='WARNING'):
+            self.assertIsNone(cache.load(key))
+
+        self.assertEqual(cache.cache_info().evictions, 1)
+
+    def test_unreadable_entry_is_discarded(self) -> None:
+        graph = OwlGraphRegistry.graph(self.input_path)
+
+        cache = OwlGraphCache(self.cache_dir)
+        with open(os.path.join(self.cache_dir, f'{cache.key(self.input_path, "ttl")}.pickle'), 'wb') as f:
+            f.write(b'not a graph')
+
+        self._new_process()
+        with self.assertLogs('mutato.finder.singlequery.dmo.owl_graph_cache', level='WARNING'):
+            reparsed = OwlGraphRegistry.graph(self.input_path)
+
+        self.assertTrue(isomorphic(reparsed, graph))
+        self.assertEqual(OwlGraphRegistry.graph_cache().cache_info().evictions, 1)
+
+        # the re-parsed graph replaced the bad entry
+        self._new_process()
+        OwlGraphRegistry.graph(self.input_path)
+        self.assertEqual(OwlGraphRegistry.graph_cache().cache_info().hits, 1)
+
+    def test_failed_write_is_logged(self) -> None:
+        cache = OwlGraphRegistry.graph_cache()
+        with mock.patch.object(cache, 'save', side_effect=OSError('read-only file system')), \
+                self.assertLogs('mutato.finder.singlequery.dmo.owl_graph_registry', level='WARNING'):
+            graph = OwlGraphRegistry.graph(self.input_path)
+
+        self.assertTrue(len(graph))
+        self.assertIs(OwlGraphRegistry.graph(self.input_path), graph)
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+    def test_disabled(self) -> None:
+        OwlGraphRegistry.set_cache_dir(None)
+        OwlGraphRegistry.graph(self.input_path)
+
+        self.assertIsNone(OwlGraphRegistry.graph_cache())
+        self.assertFalse(os.listdir(self.cache_dir))
+
+    def test_clear(self) -> None:
+        OwlGraphRegistry.graph(self.input_path)
+
+        cache = OwlGraphRegistry.graph_cache()
+        cache.clear()
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
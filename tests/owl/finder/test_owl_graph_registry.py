@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates OwlGraphRegistry: each OWL file is parsed once per process and the
+# graph is shared by AskOwlAPI, OWLSchemaDetector and UniversalMDAGenerator;
+# a changed file is parsed again, and an unused graph is freed.
+
+import gc
+import os
+import shutil
+import tempfile
+import unittest
+import weakref
+
+from mutato.finder.singlequery import AskOwlAPI
+from mutato.finder.singlequery.dmo import OwlGraphRegistry
+from mutato.mda import OWLSchemaDetector, OWLSchema, UniversalMDAGenerator
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+
+class TestOwlGraphRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.tempdir.name, f'{ONTOLOGY_NAME}.owl')
+        shutil.copy(os.path.join(ABSOLUTE_PATH, f'{ONTOLOGY_NAME}.owl'), self.input_path)
+
+    def tearDown(self) -> None:
+        self.tempdir.cleanup()
+
+    def _api(self) -> AskOwlAPI:
+        return AskOwlAPI(ontology_name=ONTOLOGY_NAME, absolute_path=self.tempdir.name)
+
+    def test_parsed_once(self) -> None:
+        misses = OwlGraphRegistry.cache_info().misses
+
+        graph = self._api().graph
+        self.assertIs(self._api().graph, graph)
+        self.assertIs(OwlGraphRegistry.graph(self.input_path), graph)
+
+        self.assertEqual(OwlGraphRegistry.cache_info().misses, misses + 1)
+
+    def test_path_is_resolved(self) -> None:
+        relative_path = os.path.relpath(self.input_path)
+        self.assertIs(OwlGraphRegistry.graph(relative_path),
+                      OwlGraphRegistry.graph(self.input_path))
+
+    def test_detector_shares_graph(self) -> None:
+        graph = self._api().graph
+        detector = OWLSchemaDetector.from_path(self.input_path)
+        self.assertIs(detector._graph, graph)
+        self.assertEqual(detector.detect(), OWLSchema.CLASS_BASED)
+
+    def test_universal_generator_parses_once(self) -> None:
+        misses = OwlGraphRegistry.cache_info().misses
+
+        d_owl = UniversalMDAGenerator(
+            ontology_name=ONTOLOGY_NAME,
+            absolute_path=self.tempdir.name,
+            namespace=None).generate()
+
+        self.assertTrue(d_owl['labels'])
+        self.assertEqual(OwlGraphRegistry.cache_info().misses, misses + 1)
+
+    def test_changed_file_is_parsed_again(self) -> None:
+        graph = OwlGraphRegistry.graph(self.input_path)
+        evictions = OwlGraphRegistry.cache_info().evictions
+
+        with open(self.input_path, 'a') as f:
+            f.write('\n<http://test.ai/animals#quokka> '
+                    '<http://www.w3.org/2000/01/rdf-schema#label> "quokka" .\n')
+
+        changed = OwlGraphRegistry.graph(self.input_path)
+        self.assertIsNot(changed, graph)
+        self.assertEqual(len(changed), len(graph) + 1)
+        self.assertEqual(OwlGraphRegistry.cache_info().evictions, evictions + 1)
+
+    def test_unused_graph_is_freed(self) -> None:
+        api = self._api()
+        graph_ref = weakref.ref(api.graph)
+        currsize = OwlGraphRegistry.cache_info().currsize
+
+        del api
+        gc.collect()
+
+        self.assertIsNone(graph_ref())
+        self.assertLess(OwlGraphRegistry.cache_info().currsize, currsize)
+
+        misses = OwlGraphRegistry.cache_info().misses
+        self.assertTrue(len(OwlGraphRegistry.graph(self.input_path)))
+        self.assertEqual(OwlGraphRegistry.cache_info().misses, misses + 1)
+
+    def test_missing_file(self) -> None:
+        self.assertRaises(FileNotFoundError, OwlGraphRegistry.graph,
+                          os.path.join(self.tempdir.name, 'missing.owl'))
+
+
+if __name__ == '__main__':
+    unittest.main()
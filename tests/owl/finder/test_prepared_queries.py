@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates prepared query execution in OwlQueryExtract: each query is prepared once,
+# single triple patterns are answered from the graph index with the same rows and order
+# as the SPARQL engine, and per-entity templates bind '?entity' instead of formatting it.
+
+import unittest
+
+from mutato.core import InstanceCache
+from mutato.finder.singlequery import AskOwlAPI
+from mutato.finder.singlequery.dmo import OwlQueryExtract
+from mutato.finder.singlequery.dto import QueryResultType
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+QUERIES = [
+    ('SELECT ?a WHERE { ?x rdfs:label ?a }', QueryResultType.LIST_OF_STRINGS),
+    ('SELECT ?x ?a ?a WHERE { ?x rdfs:label ?a }', QueryResultType.DICT_OF_STR2STR),
+    ('SELECT ?a ?b WHERE { ?a rdfs:subClassOf ?b }', QueryResultType.DICT_OF_STR2LIST),
+    ('SELECT ?a WHERE { ?a rdfs:subClassOf+ ?b }', QueryResultType.LIST_OF_STRINGS),
+    ('SELECT ?a WHERE { ?a rdf:type owl:Class }', QueryResultType.LIST_OF_STRINGS),
+    ('SELECT ?b ?a WHERE { ?a rdfs:label ?b . ?a rdfs:subClassOf ?c }', QueryResultType.DICT_OF_STR2STR),
+]
+
+
+class TestPreparedQueries(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.api = AskOwlAPI(ontology_name=ONTOLOGY_NAME, absolute_path=ABSOLUTE_PATH)
+
+    def setUp(self) -> None:
+        self.extract = OwlQueryExtract(self.api.graph)
+
+    def _engine(self, query: str, result_type: QueryResultType, bindings: dict = None):
+        """ The result the SPARQL engine gives for the unprepared query text """
+        rows = self.api.graph.query(query, initBindings=bindings)
+        return self.extract.transform(list(rows), False, result_type)
+
+    def test_same_rows_as_engine(self) -> None:
+        for query, result_type in QUERIES:
+            with self.subTest(query=query):
+                actual = self.extract.process(query, False, result_type)
+                expected = self._engine(query, result_type)
+                self.assertTrue(actual)
+                self.assertEqual(actual, expected)
+                if isinstance(expected, dict):
+                    self.assertEqual(list(actual), list(expected))
+
+    def test_prepared_once(self) -> None:
+        query, result_type = QUERIES[0]
+        for _ in range(3):
+            self.extract.process(query, False, result_type)
+
+        info = InstanceCache.info(self.extract)['OwlQueryExtract._prepare_query']
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_bindings(self) -> None:
+        query = 'SELECT ?a WHERE { ?entity rdfs:subClassOf ?a }'
+        for entity in self.api.entities():
+            bindings = {'entity': self.api._entity_query(query, entity)[1]['entity']}
+            with self.subTest(entity=entity):
+                self.assertEqual(
+                    self.extract.process(query, False, QueryResultType.LIST_OF_STRINGS, bindings),
+                    self._engine(query, QueryResultType.LIST_OF_STRINGS, bindings))
+
+        info = InstanceCache.info(self.extract)['OwlQueryExtract._prepare_query']
+        self.assertEqual(info.misses, 1)
+
+    def test_entity_template(self) -> None:
+        sparql, bindings = self.api._entity_query('SELECT ?a WHERE { ?entity rdfs:subClassOf ?a }', 'cat')
+        self.assertIn('?entity', sparql)
+        self.assertTrue(str(bindings['entity']).endswith('#cat'))
+
+        # not a plain local name: formatted into the query, which then fails as before
+        sparql, bindings = self.api._entity_query('SELECT ?a WHERE { ?entity rdfs:subClassOf ?a }', 'big cat')
+        self.assertIsNone(bindings)
+        self.assertIn(':big cat', sparql)
+        self.assertRaises(ValueError, self.api.parents, 'big cat')
+
+    def test_hierarchy(self) -> None:
+        for entity in self.api.entities():
+            for method in ['parents', 'children', 'ancestors', 'descendants']:
+                with self.subTest(entity=entity, method=method):
+                    sparql = {
+                        'parents': 'SELECT ?a WHERE { :#E rdfs:subClassOf ?a }',
+                        'children': 'SELECT ?a WHERE { ?a rdfs:subClassOf :#E }',
+                        'ancestors': 'SELECT ?a WHERE { :#E rdfs:subClassOf+ ?a }',
+                        'descendants': 'SELECT ?a WHERE { ?a rdfs:subClassOf+ :#E }',
+                    }[method].replace('#E', entity)
+
+                    expected = self._engine(sparql, QueryResultType.LIST_OF_STRINGS)
+                    if method == 'ancestors' and expected:
+                        expected = sorted(expected, reverse=True)
+
+                    self.assertEqual(getattr(self.api, method)(entity), expected)
+
+    def test_do_not_transform(self) -> None:
+        query, _ = QUERIES[0]
+        result = self.extract.process(query, False, QueryResultType.DO_NOT_TRANSFORM)
+        self.assertEqual(len(list(result)), len(self.api.labels()))
+
+
+if __name__ == '__main__':
+    unittest.main()
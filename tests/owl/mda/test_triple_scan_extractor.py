@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates that TripleScanExtractor answers every MDA generation query
+# exactly as the SPARQL queries of AskOwlAPI and MixedAskOwlAPI do,
+# for a class-based ontology and for a small mixed class/individual ontology.
+
+import os
+import tempfile
+import unittest
+
+from mutato.finder.singlequery import AskOwlAPI
+from mutato.mda.extractors import (
+    MixedAskOwlAPI,
+    TripleScanExtractor,
+    MixedTripleScanExtractor
+)
+
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+
+MIXED_OWL = """
+@prefix : <#NAMESPACE> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+
+:inflection a owl:AnnotationProperty .
+
+:stimulus a owl:NamedIndividual .
+
+:fiscal_policy a owl:Class ;
+    rdfs:label "fiscal policy" ;
+    rdfs:seeAlso "fiscal stance, budget policy" ;
+    rdfs:subClassOf :policy .
+
+:policy a owl:Class ;
+    rdfs:label "policy" ;
+    skos:altLabel "policies" ;
+    rdfs:subClassOf [ a owl:Restriction ; owl:onProperty :inflection ; owl:someValuesFrom :plan ] .
+
+:plan a owl:Class ;
+    rdfs:label "plan" ;
+    owl:equivalentClass :policy ;
+    :inflection "plans" .
+
+:tax_cut a owl:NamedIndividual, :fiscal_policy, :plan ;
+    rdfs:label "tax cut" .
+
+:stimulus a :plan, :fiscal_policy, owl:Thing ;
+    rdfs:label "stimulus" ;
+    rdfs:seeAlso "nil" .
+
+:budget_review a :plan ;
+    rdfs:label "budget review" .
+"""
+
+# the two namespaces sort either side of owl:NamedIndividual
+NAMESPACES = ['http://econ.test/mixed#', 'http://zoo.test/mixed#']
+
+
+class TestTripleScanExtractor(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tempdir = tempfile.TemporaryDirectory()
+
+        cls.pairs = [
+            (AskOwlAPI, TripleScanExtractor,
+             AskOwlAPI(ontology_name='animals-test', absolute_path=ABSOLUTE_PATH))
+        ]
+
+        for i, namespace in enumerate(NAMESPACES):
+            ontology_name = f'mixed-{i}'
+            with open(os.path.join(cls.tempdir.name, f'{ontology_name}.owl'), 'w') as f:
+                f.write(MIXED_OWL.replace('#NAMESPACE', namespace))
+
+            for api_type, extractor_type in [(AskOwlAPI, TripleScanExtractor),
+                                             (MixedAskOwlAPI, MixedTripleScanExtractor)]:
+                cls.pairs.append((api_type, extractor_type, api_type(
+                    ontology_name=ontology_name, absolute_path=cls.tempdir.name)))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tempdir.cleanup()
+
+    def _assert_same(self, method: str, *args) -> None:
+        for _, extractor_type, api in self.pairs:
+            with self.subTest(api=api.ontology_name, extractor=extractor_type.__name__, method=method, args=args):
+                expected = getattr(api, method)(*args)
+                self.assertEqual(getattr(extractor_type(api), method)(*args), expected)
+
+    def test_views(self) -> None:
+        for method in ['predicates', 'labels', 'entities', 'keyed_labels', 'trie',
+                       'spans', 'synonyms', 'synonyms_rev', 'equivalents']:
+            self._assert_same(method)
+
+    def test_ngrams(self) -> None:
+        for gram_level in range(1, 10):
+            self._assert_same('ngrams', gram_level)
+
+    def test_by_predicate(self) -> None:
+        for _, extractor_type, api in self.pairs:
+            d_predicates = api.predicates()
+            extractor = extractor_type(api)
+            for prefix in d_predicates:
+                for predicate in d_predicates[prefix]:
+                    predicate = f'{prefix}:{predicate}'
+                    with self.subTest(api=api.ontology_name, predicate=predicate):
+                        self.assertEqual(extractor.by_predicate(predicate),
+                                         api.by_predicate(predicate))
+
+    def test_children_and_parents(self) -> None:
+        for _, extractor_type, api in self.pairs:
+            extractor = extractor_type(api)
+            for entity in api.entities():
+                with self.subTest(api=api.ontology_name, entity=entity):
+                    self.assertEqual(extractor.children(entity), api.children(entity))
+                    self.assertEqual(extractor.parents(entity), api.parents(entity))
+
+    def test_individual_children(self) -> None:
+        for api_type, extractor_type, api in self.pairs:
+            if api_type is MixedAskOwlAPI:
+                self.assertEqual(
+                    sorted(extractor_type(api).children('plan')),
+                    ['stimulus', 'tax_cut'])
+
+
+if __name__ == '__main__':
+    unittest.main()
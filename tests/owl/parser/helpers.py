@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Shared fixtures for the parser unit tests: a token factory and a stub
+# ontology finder exposing only the methods the matching services call.
+
+
+def make_tokens(text: str,
+                ancestors: dict | None = None,
+                surface=None) -> list:
+    """ Build parser input tokens from whitespace-separated normals
+
+    Args:
+        text (str): the normals, separated by whitespace
+        ancestors (dict, optional): ancestors keyed by normal. Defaults to None.
+        surface (callable, optional): maps a normal to its token text. Defaults to None (the normal).
+
+    Returns:
+        list: one token per normal, with character offsets into 'text'
+    """
+    results = []
+
+    x = 0
+    for i, normal in enumerate(text.split()):
+        token = {'id': i, 'x': x, 'y': x + len(normal), 'ner': None,
+                 'text': surface(normal) if surface else normal,
+                 'normal': normal}
+        if ancestors and normal in ancestors:
+            token['ancestors'] = ancestors[normal]
+        results.append(token)
+        x += len(normal) + 1
+
+    return results
+
+
+class OntologyStub(object):
+    """ The finder methods used by exact and hierarchy matching """
+
+    def __init__(self,
+                 d_canon: dict | None = None,
+                 entities: set | None = None):
+        self._d_canon = d_canon or {}
+        self._entities = entities or set()
+
+    def lookup(self) -> dict:
+        d_lookup = {}
+        for entry in self._d_canon:
+            d_lookup.setdefault(len(entry.split()), []).append(entry)
+        return d_lookup
+
+    def has_spans(self) -> bool:
+        return False
+
+    def find_canon(self, input_text: str) -> str | None:
+        return self._d_canon.get(input_text)
+
+    def find_ner(self, canon: str) -> None:
+        return None
+
+    def find_variants(self, canon: str) -> list:
+        return []
+
+    def entity_exists(self, entity: str) -> bool:
+        return entity in self._entities
+
+    def ontologies(self) -> list:
+        return ['test']
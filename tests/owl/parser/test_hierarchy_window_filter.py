@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates hierarchy matching over a validity mask with prefix sums:
+# qualifying windows and their starts, splicing a swap into the mask and
+# prefix sums, swaps, and the local rescan after a swap.
+
+import unittest
+
+from mutato.parser.dmo import HierarchyMatchFinder
+from mutato.parser.svc.perform_hierarchy_matching import PerformHierarchyMatching
+from tests.owl.parser.helpers import OntologyStub, make_tokens
+
+
+class TestHierarchyWindowFilter(unittest.TestCase):
+
+    def test_windows_require_a_valid_token(self) -> None:
+        tokens = make_tokens('a b c d e', {'c': ['x']})
+        windows = HierarchyMatchFinder().process(tokens, gram_size=2)
+        self.assertEqual(
+            [(start, [t['normal'] for t in w]) for start, w in windows],
+            [(1, ['b', 'c']), (2, ['c', 'd'])])
+
+    def test_window_bounds(self) -> None:
+        tokens = make_tokens('a b c d e', {'c': ['x'], 'e': ['y']})
+        windows = HierarchyMatchFinder().process(
+            tokens, gram_size=2, first=3, last=3)
+        self.assertEqual([[t['normal'] for t in w] for _, w in windows], [['d', 'e']])
+
+    def test_prefix_sums(self) -> None:
+        self.assertEqual(
+            HierarchyMatchFinder.prefix_sums([False, True, True, False]),
+            [0, 0, 1, 2, 2])
+
+    def test_splice(self) -> None:
+        mask = [False, True, True, False, True]
+        prefix = HierarchyMatchFinder.prefix_sums(mask)
+
+        HierarchyMatchFinder.splice(mask, prefix, 1, 4, False)
+        self.assertEqual(mask, [False, False, True])
+        self.assertEqual(prefix, HierarchyMatchFinder.prefix_sums(mask))
+
+        HierarchyMatchFinder.splice(mask, prefix, 0, 2, True)
+        self.assertEqual(mask, [True, True])
+        self.assertEqual(prefix, HierarchyMatchFinder.prefix_sums(mask))
+
+    def test_swap_and_rescan(self) -> None:
+        tokens = make_tokens('the big cat sat down', {'cat': ['feline'], 'down': ['below']})
+        api = PerformHierarchyMatching(
+            OntologyStub(entities={'big_feline', 'sat_below'}))
+
+        results = api.process(tokens)
+        self.assertEqual(
+            [t['normal'] for t in results], ['the', 'big_feline', 'sat_below'])
+        self.assertEqual(results[1]['swaps']['type'], 'hierarchy')
+
+    def test_no_match_terminates(self) -> None:
+        tokens = make_tokens('the big cat', {'cat': ['feline']})
+        results = PerformHierarchyMatching(OntologyStub()).process(tokens)
+        self.assertEqual([t['normal'] for t in results], ['the', 'big', 'cat'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates the cache gauges MutatoAPI reports with enable_metrics: hit and miss
+# counts from the finder's per-instance caches and from the result cache, and no
+# finder gauges for a FindOntologyJSON finder, which keeps no method caches.
+
+import unittest
+
+from mutato.mda import MDAGenerator
+from mutato.finder.multiquery import FindOntologyData, FindOntologyJSON
+from mutato.parser import MutatoAPI
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+NAMESPACE = 'http://test.ai/animals'
+INPUT_TEXT = 'the german shepherd chased a cat'
+
+
+class TestMutatoAPICacheGauges(unittest.TestCase):
+
+    def test_finder_gauges(self) -> None:
+        finder = FindOntologyData(
+            ontologies=[ONTOLOGY_NAME],
+            absolute_path=ABSOLUTE_PATH,
+            namespace=None)
+        api = MutatoAPI(find_ontology_data=finder, cache_size=16, enable_metrics=True)
+        api.swap_input_text(INPUT_TEXT)
+
+        gauges = api.metrics().snapshot()['gauges']
+        self.assertIn('mutato_cache_misses{cache="finder.find_canon"}', gauges)
+        self.assertIn('mutato_cache_hits{cache="finder.find_canon"}', gauges)
+        self.assertIn('mutato_cache_hits{cache="result"}', gauges)
+
+        info = finder.cache_info()['FindOntologyData.find_canon']
+        self.assertEqual(gauges['mutato_cache_misses{cache="finder.find_canon"}'], info.misses)
+
+    def test_json_finder_has_no_finder_gauges(self) -> None:
+        d_owl = MDAGenerator(
+            ontology_name=ONTOLOGY_NAME,
+            absolute_path=ABSOLUTE_PATH,
+            namespace=NAMESPACE).generate()
+        finder = FindOntologyJSON(d_owl=d_owl, ontology_name='animals')
+        api = MutatoAPI(find_ontology_data=finder, enable_metrics=True)
+        api.swap_input_text(INPUT_TEXT)
+
+        gauges = api.metrics().snapshot()['gauges']
+        self.assertFalse([series for series in gauges if 'cache="finder.' in series])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Tests that MutatoAPI(production=True) skips per-call validation
+# without changing the swap output.
+
+import os
+import unittest
+from mutato.mda import MDAGenerator
+from mutato.finder.multiquery import FindOntologyJSON
+from mutato.parser import MutatoAPI
+
+os.environ['SPAN_DISTANCE'] = '4'
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+NAMESPACE = 'http://test.ai/animals'
+
+
+class TestMutatoAPIProductionMode(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        d_owl = MDAGenerator(
+            ontology_name=ONTOLOGY_NAME,
+            absolute_path=ABSOLUTE_PATH,
+            namespace=NAMESPACE,
+        ).generate()
+        finder = FindOntologyJSON(d_owl=d_owl, ontology_name='animals')
+        cls.api = MutatoAPI(find_ontology_data=finder)
+        cls.production_api = MutatoAPI(find_ontology_data=finder, production=True)
+
+    def _assert_same(self, text: str) -> None:
+        self.assertEqual(
+            self.api.swap_input_text(text),
+            self.production_api.swap_input_text(text))
+
+    def test_single_entity(self) -> None:
+        self._assert_same('Dog')
+
+    def test_multiple_entities(self) -> None:
+        self._assert_same('the dog chased the cat past the horse')
+
+    def test_no_entities(self) -> None:
+        self._assert_same('nothing to see here')
+
+
+if __name__ == '__main__':
+    unittest.main()
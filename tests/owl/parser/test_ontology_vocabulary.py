@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates the ontology vocabulary prefilter: which tokens are in vocabulary,
+# and that windows touching an out-of-vocabulary token are never listed.
+
+import unittest
+
+from mutato.parser.dmo import OntologyVocabulary, TokenWindows
+from tests.owl.parser.helpers import make_tokens
+
+
+D_LOOKUP = {
+    1: ['inflation'],
+    '2': ['fiscal policy', 'monetary_policy analysis'],
+}
+
+D_SPANS = {
+    'nursing': [{'content': ['history'], 'distance': 4, 'forward': True,
+                 'reverse': True, 'canon': 'nursing_history'}],
+}
+
+
+class TestOntologyVocabulary(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.vocabulary = OntologyVocabulary(D_LOOKUP, D_SPANS)
+
+    def test_lookup_and_span_tokens(self) -> None:
+        for normal in ['inflation', 'fiscal', 'policy', 'monetary_policy',
+                       'analysis', 'nursing', 'history']:
+            self.assertIn(normal, self.vocabulary)
+        self.assertNotIn('the', self.vocabulary)
+
+    def test_case_and_multi_part_normals(self) -> None:
+        self.assertIn('Fiscal', self.vocabulary)
+        self.assertIn('fiscal policy', self.vocabulary)
+        self.assertNotIn('fiscal cliff', self.vocabulary)
+
+    def test_mask(self) -> None:
+        tokens = make_tokens('the fiscal policy is inflation')
+        self.assertEqual(self.vocabulary.mask(tokens),
+                         [False, True, True, False, True])
+
+    def test_windows_skip_out_of_vocabulary_tokens(self) -> None:
+        tokens = make_tokens('the fiscal policy is inflation')
+        windows = TokenWindows(tokens, mask=self.vocabulary.mask(tokens))
+        self.assertEqual(list(windows.ranges(2)), [(1, 3)])
+        self.assertEqual(list(windows.ranges(1)), [(1, 2), (2, 3), (4, 5)])
+        self.assertEqual(list(windows.ranges(3)), [])
+
+    def test_empty_ontology(self) -> None:
+        vocabulary = OntologyVocabulary(None)
+        self.assertEqual(len(vocabulary), 0)
+        self.assertEqual(vocabulary.mask(make_tokens('a')), [False])
+
+
+if __name__ == '__main__':
+    unittest.main()
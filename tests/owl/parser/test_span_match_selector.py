@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates occurrence-aware span placement (SpanDistanceCheck) and the
+# best-first selection of non-overlapping span matches (SpanMatchSelector).
+
+import unittest
+
+from mutato.parser.dmo.spans import SpanDistanceCheck, SpanMatchSelector
+from tests.owl.parser.helpers import make_tokens
+
+
+def _rule(canon: str, *content) -> dict:
+    return {'content': list(content), 'distance': 4, 'forward': True,
+            'reverse': True, 'canon': canon}
+
+
+class TestSpanMatchSelector(unittest.TestCase):
+
+    def test_every_occurrence_is_placed(self) -> None:
+        rules = [_rule('nursing_history', 'nursing', 'history')]
+        results = SpanDistanceCheck().process(
+            rules, make_tokens('nursing history and then nursing history'))
+        self.assertEqual(
+            sorted(x['positions'] for x in results), [[0, 1], [1, 4], [4, 5]])
+
+    def test_placement_respects_distance(self) -> None:
+        rules = [_rule('nursing_history', 'nursing', 'history')]
+        results = SpanDistanceCheck().process(
+            rules, make_tokens('nursing a b c d e history'))
+        self.assertEqual(results, [])
+
+    def test_rules_are_not_mutated(self) -> None:
+        rules = [_rule('nursing_history', 'nursing', 'history')]
+        SpanDistanceCheck().process(rules, make_tokens('nursing history'))
+        self.assertNotIn('positions', rules[0])
+
+    def test_non_overlapping_matches_are_kept(self) -> None:
+        rules = [_rule('nursing_history', 'nursing', 'history')]
+        candidates = SpanDistanceCheck().process(
+            rules, make_tokens('nursing history and then nursing history'))
+        results = SpanMatchSelector().process(candidates)
+        self.assertEqual([x['positions'] for x in results], [[0, 1], [4, 5]])
+
+    def test_specific_rule_wins_overlap(self) -> None:
+        candidates = [
+            {**_rule('nursing', 'a', 'b'), 'positions': [0, 1]},
+            {**_rule('nursing_care_history', 'a', 'b'), 'positions': [1, 3]},
+        ]
+        results = SpanMatchSelector().process(candidates)
+        self.assertEqual([x['canon'] for x in results], ['nursing_care_history'])
+
+    def test_results_are_ordered_left_to_right(self) -> None:
+        candidates = [
+            {**_rule('b_b', 'a', 'b'), 'positions': [5, 6]},
+            {**_rule('a_a_a', 'a', 'b'), 'positions': [0, 2]},
+        ]
+        results = SpanMatchSelector().process(candidates)
+        self.assertEqual([x['canon'] for x in results], ['a_a_a', 'b_b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates the compiled span rule index: counter-based matching over the
+# required tokens of each rule, and that shared rules are never mutated.
+
+import copy
+import unittest
+
+from mutato.parser.dmo.spans import SpanContentCheck, SpanRuleIndex
+from tests.owl.parser.helpers import make_tokens
+
+
+D_RULES = {
+    'fiscal_policy': [
+        {'content': ['analysis'], 'distance': 4, 'forward': True, 'reverse': True,
+         'canon': 'fiscal_policy_analysis'},
+        {'content': ['reform', ' tax '], 'distance': 4, 'forward': True, 'reverse': True,
+         'canon': 'fiscal_policy_tax_reform'},
+    ],
+    'nursing': [
+        {'content': ['history'], 'distance': 4, 'forward': True, 'reverse': True,
+         'canon': 'nursing_history'},
+    ],
+}
+
+
+class TestSpanRuleIndex(unittest.TestCase):
+
+    def test_compiled_content_includes_key(self) -> None:
+        index = SpanRuleIndex(D_RULES)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.rule(0)['content'], ['analysis', 'fiscal_policy'])
+
+    def test_content_is_cleansed(self) -> None:
+        index = SpanRuleIndex(D_RULES)
+        self.assertIn('tax', index.tokens())
+        self.assertNotIn(' tax ', index.tokens())
+
+    def test_match_requires_every_token(self) -> None:
+        index = SpanRuleIndex(D_RULES)
+        self.assertEqual(index.match({'fiscal_policy', 'analysis'}), [0])
+        self.assertEqual(index.match({'fiscal_policy', 'reform'}), [])
+        self.assertEqual(
+            index.match({'fiscal_policy', 'reform', 'tax', 'analysis'}), [0, 1])
+
+    def test_rule_keys_restrict_index(self) -> None:
+        index = SpanRuleIndex(D_RULES, rule_keys=['nursing'])
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.match({'fiscal_policy', 'analysis'}), [])
+
+    def test_content_check_does_not_mutate_rules(self) -> None:
+        d_rules = copy.deepcopy(D_RULES)
+        check = SpanContentCheck(d_rules=d_rules, rule_keys=list(d_rules))
+
+        results = check.process(make_tokens('history of nursing'))
+        self.assertEqual([x['canon'] for x in results], ['nursing_history'])
+
+        results[0]['positions'] = [0, 2]
+        self.assertEqual(d_rules, D_RULES)
+        self.assertNotIn('positions', check.process(
+            make_tokens('history of nursing'))[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
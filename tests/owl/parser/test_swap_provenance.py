@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates compact swap provenance: index ranges into the input tokens and a
+# swap chain in place of nested token lists, and that it describes the same
+# swaps as the default nested form, and that compact output can be re-fed.
+
+import os
+import unittest
+
+from mutato.mda import MDAGenerator
+from mutato.finder.multiquery import FindOntologyJSON
+from mutato.parser import MutatoAPI
+from mutato.parser.dmo import HierarchyMatchFinder, SwapTokenGenerator
+from mutato.parser.dto import Record
+from tests.owl.parser.helpers import make_tokens
+
+os.environ['SPAN_DISTANCE'] = '4'
+
+ONTOLOGY_NAME = 'animals-test'
+ABSOLUTE_PATH = 'tests/test_data/ontologies'
+NAMESPACE = 'http://test.ai/animals'
+
+
+def _leaves(token: dict) -> list:
+    if 'swaps' not in token:
+        return [token]
+    return [leaf for child in token['swaps']['tokens'] for leaf in _leaves(child)]
+
+
+class TestSwapProvenance(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        d_owl = MDAGenerator(
+            ontology_name=ONTOLOGY_NAME,
+            absolute_path=ABSOLUTE_PATH,
+            namespace=NAMESPACE,
+        ).generate()
+        cls.finder = FindOntologyJSON(d_owl=d_owl, ontology_name='animals')
+        cls.api = MutatoAPI(find_ontology_data=cls.finder)
+        cls.compact_api = MutatoAPI(find_ontology_data=cls.finder, provenance='compact')
+
+    def test_swap_chain(self) -> None:
+        create_swap = SwapTokenGenerator(['econ']).process
+        tokens = make_tokens('the fiscal policy review')
+
+        inner = create_swap(normal='fiscal_policy', canon='fiscal_policy',
+                            ner=None, tokens=tokens[1:3], swap_type='exact')
+        outer = create_swap(normal='fiscal_policy_review', canon='fiscal_policy_review',
+                            ner=None, tokens=[inner, tokens[3]], swap_type='hierarchy',
+                            confidence=75.0)
+
+        positions = {id(token): i for i, token in enumerate(tokens)}
+        results = Record.to_dicts([tokens[0], outer], positions)
+
+        self.assertIs(results[0], tokens[0])
+        self.assertEqual(results[1]['swaps'], {
+            'range': [1, 4],
+            'canon': 'fiscal_policy_review',
+            'type': 'hierarchy',
+            'ontologies': ['econ'],
+            'confidence': 75.0,
+            'chain': [{'range': [1, 3], 'normal': 'fiscal_policy', 'ner': None,
+                       'canon': 'fiscal_policy', 'type': 'exact', 'confidence': 100.0}]})
+        self.assertEqual(results[1]['text'], 'fiscal policy review')
+
+    def test_same_swaps_as_nested(self) -> None:
+        text = 'the dog chased the cat past the horse'
+        nested = self.api.swap_input_text(text)
+        compact = self.compact_api.swap_input_text(text)
+
+        self.assertEqual(len(nested), len(compact))
+
+        cursor = 0
+        for d_nested, d_compact in zip(nested, compact):
+            for key in d_nested:
+                if key != 'swaps':
+                    self.assertEqual(d_nested[key], d_compact[key])
+
+            if 'swaps' not in d_nested:
+                cursor += 1
+                continue
+
+            start, end = d_compact['swaps']['range']
+            self.assertEqual(start, cursor)
+            self.assertEqual(end - start, len(_leaves(d_nested)))
+            self.assertNotIn('tokens', d_compact['swaps'])
+            cursor = end
+
+    def test_compact_round_trip(self) -> None:
+        compact = self.compact_api.swap_input_text('the german shepherd and the lab and the big cat')
+        self.assertTrue([token for token in compact if 'swaps' in token])
+
+        # compact swaps carry no 'swaps.tokens'; they are re-fed as plain tokens
+        results = self.compact_api.swap_input_tokens(compact)
+        self.assertEqual([token['normal'] for token in results],
+                         [token['normal'] for token in compact])
+
+        hierarchy = HierarchyMatchFinder()
+        swap = next(token for token in compact if 'swaps' in token)
+        self.assertFalse(hierarchy.is_valid(swap))
+
+    def test_unknown_provenance(self) -> None:
+        self.assertRaises(ValueError, MutatoAPI,
+                          self.finder, provenance='flat')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates in-place swap application on the token lattice, and an exact
+# matching pass over a document with many swaps.
+
+import unittest
+
+from mutato.parser.dmo import OntologyVocabulary, TokenLattice
+from mutato.parser.svc.perform_exact_matching import PerformExactMatching
+from tests.owl.parser.helpers import OntologyStub, make_tokens
+
+
+class TestTokenLattice(unittest.TestCase):
+
+    def test_replace(self) -> None:
+        tokens = make_tokens('the fiscal policy is')
+        lattice = TokenLattice(tokens)
+        lattice.replace(1, 3, {'normal': 'Fiscal_Policy'})
+
+        self.assertEqual(len(lattice), 3)
+        self.assertEqual(lattice.normals, ['the', 'fiscal_policy', 'is'])
+        self.assertEqual(lattice.windows().text(0, 3), 'the fiscal_policy is')
+        self.assertEqual(len(tokens), 4)
+
+    def test_replace_keeps_mask_in_step(self) -> None:
+        vocabulary = OntologyVocabulary({2: ['fiscal policy', 'fiscal_policy review']})
+        lattice = TokenLattice(make_tokens('the fiscal policy review'), vocabulary)
+        self.assertEqual(lattice.mask, [False, True, True, True])
+
+        lattice.replace(1, 3, {'normal': 'fiscal_policy'})
+        self.assertEqual(lattice.mask, [False, True, True])
+        self.assertEqual(list(lattice.windows().ranges(2)), [(1, 3)])
+
+    def test_exact_matching_with_many_swaps(self) -> None:
+        api = PerformExactMatching(OntologyStub(d_canon={
+            'fiscal policy': 'fiscal_policy',
+            'fiscal_policy review': 'fiscal_policy_review',
+        }))
+
+        results = api.process(make_tokens('fiscal policy review and ' * 1500))
+        self.assertEqual(len(results), 3000)
+        self.assertEqual(
+            {x['normal'] for x in results}, {'fiscal_policy_review', 'and'})
+        self.assertEqual(
+            [x['normal'] for x in results[0]['swaps']['tokens']],
+            ['fiscal_policy', 'review'])
+
+
+if __name__ == '__main__':
+    unittest.main()
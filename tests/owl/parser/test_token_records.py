@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates the compact token and swap records: dict-style reads inside the
+# pipeline, and a dict form identical to the nested dicts they replace.
+
+import unittest
+from dataclasses import asdict, dataclass
+
+from mutato.parser.dmo import SwapTokenGenerator
+from mutato.parser.dto import Record, SwapTokenRecord, TokenRecord
+from tests.owl.parser.helpers import make_tokens
+
+
+@dataclass
+class _Other:
+    i: int
+    head_text: str
+
+
+@dataclass
+class _Parsed:
+    id: str
+    text: str
+    ent: str
+    x: int
+    y: int
+    normal: str
+    other: _Other
+
+
+def _titled(normal: str) -> str:
+    return f' {normal.title()} '
+
+
+class TestTokenRecords(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.generator = SwapTokenGenerator(['econ'])
+
+    def _swap(self, tokens: list, normal: str) -> SwapTokenRecord:
+        return self.generator.process(
+            normal=normal, canon=normal, ner='skill',
+            tokens=tokens, swap_type='exact')
+
+    def test_swap_reads_like_a_dict(self) -> None:
+        swap = self._swap(make_tokens('fiscal policy', surface=_titled), 'fiscal_policy')
+
+        self.assertEqual(swap['normal'], 'fiscal_policy')
+        self.assertEqual(swap['text'], 'Fiscal Policy')
+        self.assertEqual(swap['swaps']['type'], 'exact')
+        self.assertIn('swaps', swap)
+        self.assertNotIn('ancestors', swap)
+        self.assertIsNone(swap.get('ancestors'))
+        self.assertRaises(KeyError, lambda: swap['to_dict'])
+
+    def test_dict_form(self) -> None:
+        tokens = make_tokens('fiscal policy review', surface=_titled)
+        inner = self._swap(tokens[:2], 'fiscal_policy')
+        outer = self._swap([inner, tokens[2]], 'fiscal_policy_review')
+
+        self.assertEqual(outer.to_dict(), {
+            'id': 0, 'x': 0, 'y': 20, 'ner': 'SKILL',
+            'text': 'Fiscal Policy Review',
+            'normal': 'fiscal_policy_review',
+            'swaps': {
+                'tokens': [inner.to_dict(), tokens[2]],
+                'canon': 'fiscal_policy_review',
+                'type': 'exact',
+                'ontologies': ['econ'],
+                'confidence': 100.0}})
+        self.assertEqual(list(outer.to_dict()), list(outer))
+        self.assertIs(type(outer.to_dict()['swaps']['tokens'][0]), dict)
+
+    def test_records_have_no_instance_dict(self) -> None:
+        swap = self._swap(make_tokens('inflation', surface=_titled), 'inflation')
+        self.assertFalse(hasattr(swap, '__dict__'))
+        self.assertFalse(hasattr(swap['swaps'], '__dict__'))
+
+    def test_record_requires_to_dict(self) -> None:
+        class _Incomplete(Record):
+            __slots__ = ()
+
+        self.assertRaises(TypeError, _Incomplete)
+
+    def test_token_record(self) -> None:
+        parsed = _Parsed(id='0', text='Inflation', ent='', x=0, y=9,
+                         normal='inflation', other=_Other(i=0, head_text='rose'))
+        token = TokenRecord(parsed)
+
+        self.assertEqual(token['normal'], 'inflation')
+        self.assertEqual(token['other'], {'i': 0, 'head_text': 'rose'})
+        self.assertIn('ent', token)
+        self.assertNotIn('ner', token)
+        self.assertEqual(token.to_dict(), asdict(parsed))
+
+        swap = self._swap([token], 'inflation')
+        self.assertEqual(Record.to_dicts([swap])[0]['swaps']['tokens'],
+                         [asdict(parsed)])
+
+
+if __name__ == '__main__':
+    unittest.main()
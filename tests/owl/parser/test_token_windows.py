@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Validates the index-range window view shared by the exact, blacklist and
+# hierarchy finders, and the range-based lookup and blacklist filters.
+
+import unittest
+from unittest import mock
+
+from mutato.parser.dmo import ExactMatchFinder, TokenWindows
+from mutato.parser.dmo.exact import SlidingWindowBlacklist, SlidingWindowLookup
+from tests.owl.parser.helpers import make_tokens
+
+
+class TestTokenWindows(unittest.TestCase):
+
+    def test_ranges(self) -> None:
+        windows = TokenWindows(make_tokens('a b c d'))
+        self.assertEqual(list(windows.ranges(2)), [(0, 2), (1, 3), (2, 4)])
+        self.assertEqual(list(windows.ranges(4)), [(0, 4)])
+        self.assertEqual(list(windows.ranges(5)), [])
+        self.assertEqual(list(windows.ranges(2, first=1, last=1)), [(1, 3)])
+
+    def test_text_matches_joined_normals(self) -> None:
+        normals = ['Fiscal', 'policy', "isn't", 'Key']
+        windows = TokenWindows(make_tokens(' '.join(normals)))
+        for gram_size in range(1, len(normals) + 1):
+            for start, end in windows.ranges(gram_size):
+                self.assertEqual(
+                    windows.text(start, end),
+                    ' '.join(normals[start:end]).lower())
+
+    def test_tokens_at(self) -> None:
+        tokens = make_tokens('a b c')
+        self.assertEqual(TokenWindows(tokens).tokens_at(1, 3), tokens[1:3])
+
+    def test_lookup_filters_ranges(self) -> None:
+        windows = TokenWindows(make_tokens('fiscal policy now'))
+        results = SlidingWindowLookup(
+            gram_size=2,
+            d_runtime_kb={'2': {'fiscal policy': ['fiscal_policy']}}).process(
+            list(windows.ranges(2)), windows)
+        self.assertEqual(results, [(0, 2)])
+
+    def test_blacklist_filters_ranges(self) -> None:
+        windows = TokenWindows(make_tokens('and fiscal'))
+        results = SlidingWindowBlacklist(
+            gram_size=1,
+            blacklist=['and']).process(list(windows.ranges(1)), windows)
+        self.assertEqual(results, [(1, 2)])
+
+    def test_finder_builds_lookup_once(self) -> None:
+        with mock.patch('mutato.parser.dmo.exact_match_finder.SlidingWindowLookup',
+                        wraps=SlidingWindowLookup) as lookup:
+            finder = ExactMatchFinder(
+                gram_size=2, d_lookup={'2': {'fiscal policy': ['fiscal_policy']}})
+            for _ in range(3):
+                self.assertEqual(finder.ranges(
+                    TokenWindows(make_tokens('fiscal policy'))), [(0, 2)])
+        self.assertEqual(lookup.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,7 +19,7 @@ ECON_NS = 'http://graffl.ai/skills#'
 
 _REQUIRED_KEYS = {
     'children', 'parents', 'trie', 'ngrams', 'spans',
-    'labels', 'equivalents', 'predicates', 'by_predicate',
+    'labels', 'equivalents', 'equivalence_classes', 'predicates', 'by_predicate',
     'ner', 'synonyms',
 }
 